@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""
+数学函数可视化工具 - 无界面批量渲染入口
+
+用法:
+    python batch_render.py manifest.json -o output --format svg --workers 4
+"""
+
+import os
+import sys
+import argparse
+
+# 在导入任何绘图模块之前选择 Agg 后端，工作进程通过环境变量继承该设置
+os.environ['MPLBACKEND'] = 'Agg'
+import matplotlib
+matplotlib.use('Agg')
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from config.settings import BATCH_OUTPUT_FORMATS
+from utils.batch_renderer import BatchRenderer
+
+
+def main():
+    """主函数"""
+    parser = argparse.ArgumentParser(description="根据 JSON/CSV 函数清单批量生成函数图像")
+    parser.add_argument('manifest', help="函数清单文件（.json 或 .csv）")
+    parser.add_argument('-o', '--output-dir', default=None, help="输出目录")
+    parser.add_argument('-f', '--format', default='png', choices=BATCH_OUTPUT_FORMATS,
+                        help="输出文件未写扩展名时使用的图像格式")
+    parser.add_argument('-w', '--workers', type=int, default=None,
+                        help="工作进程数（默认使用CPU核数，1表示不使用进程池）")
+    args = parser.parse_args()
+
+    try:
+        jobs = BatchRenderer.load_manifest(args.manifest)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"❌ 读取清单失败: {e}")
+        return 1
+
+    results = BatchRenderer.render_all(jobs, args.output_dir, args.format, args.workers)
+    failures = [message for success, message in results if not success]
+    for message in failures:
+        print(f"⚠️ {message}")
+    print(f"已渲染 {len(results) - len(failures)}/{len(results)} 张图像")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""
+数学函数可视化工具 - 无界面基准测试入口
+
+用法:
+    python benchmark.py                                  # 运行全部测试，若基准文件存在则与之比较
+    python benchmark.py --only evaluate roots --sizes 1000 100000
+    python benchmark.py -o results.json                  # 保存本次结果
+    python benchmark.py --save-baseline                  # 将本次结果保存为新的基准
+"""
+
+import os
+import sys
+import argparse
+import warnings
+
+# 在导入任何绘图模块之前选择 Agg 后端
+os.environ['MPLBACKEND'] = 'Agg'
+import matplotlib
+matplotlib.use('Agg')
+
+# 缺少中文字体时 matplotlib 会对每个字形发出警告，不影响测量
+warnings.filterwarnings('ignore', message='Glyph .* missing from font')
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from config.settings import (
+    BENCHMARK_SIZES, BENCHMARK_CURVES, BENCHMARK_WIDTHS, BENCHMARK_REPEATS,
+    BENCHMARK_CASE_BUDGET_S, BENCHMARK_REGRESSION_RATIO, BENCHMARK_BASELINE_FILE
+)
+from utils.benchmark_suite import BenchmarkSuite, BENCHMARK_NAMES
+
+
+def main():
+    """主函数"""
+    parser = argparse.ArgumentParser(description="测量求值、特征点、交点、网格点和绘图流程的耗时、内存与分配次数")
+    parser.add_argument('--only', nargs='+', choices=BENCHMARK_NAMES, default=BENCHMARK_NAMES,
+                        help="只运行指定的测试项目")
+    parser.add_argument('--families', nargs='+', default=None,
+                        help="函数类型（默认为全部内置函数和一个自定义表达式）")
+    parser.add_argument('--sizes', nargs='+', type=int, default=BENCHMARK_SIZES, help="采样点数")
+    parser.add_argument('--curves', nargs='+', type=int, default=BENCHMARK_CURVES, help="叠加的曲线数量")
+    parser.add_argument('--widths', nargs='+', type=float, default=BENCHMARK_WIDTHS, help="x范围的宽度")
+    parser.add_argument('-r', '--repeats', type=int, default=BENCHMARK_REPEATS, help="每项最多计时的次数")
+    parser.add_argument('--budget', type=float, default=BENCHMARK_CASE_BUDGET_S,
+                        help="每项计时的总时间预算（秒）")
+    parser.add_argument('-o', '--output', default=None, help="将结果保存为JSON文件")
+    parser.add_argument('-b', '--baseline', default=BENCHMARK_BASELINE_FILE, help="基准结果文件")
+    parser.add_argument('--save-baseline', action='store_true', help="将本次结果保存为基准")
+    parser.add_argument('--threshold', type=float, default=BENCHMARK_REGRESSION_RATIO,
+                        help="耗时、峰值内存或分配次数超过基准的多少倍时视为退化")
+    args = parser.parse_args()
+
+    baseline = None
+    if not args.save_baseline and os.path.exists(args.baseline):
+        try:
+            baseline = BenchmarkSuite.load_report(args.baseline)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ 读取基准失败: {e}")
+
+    try:
+        cases = BenchmarkSuite.build_cases(args.only, args.families, args.sizes, args.curves, args.widths)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+
+    print(f"共 {len(cases)} 项测试" + (f"，与基准 {args.baseline} 比较" if baseline else ""))
+
+    def progress(result):
+        comparison = BenchmarkSuite.compare([result], baseline, args.threshold) if baseline else {}
+        print(BenchmarkSuite.format_result(result, comparison.get(result['key'])), flush=True)
+
+    results = BenchmarkSuite.run(cases, args.repeats, args.budget, progress)
+    report = BenchmarkSuite.make_report(results)
+
+    regressions = []
+    if baseline is not None:
+        comparison = BenchmarkSuite.compare(results, baseline, args.threshold)
+        regressions = [key for key, item in comparison.items() if item['regressed']]
+        report['comparison'] = {'baseline': args.baseline, 'threshold': args.threshold,
+                                'items': comparison, 'regressions': regressions}
+
+    if args.output:
+        BenchmarkSuite.save_report(report, args.output)
+        print(f"结果已保存到: {args.output}")
+    if args.save_baseline:
+        BenchmarkSuite.save_report(report, args.baseline)
+        print(f"基准已保存到: {args.baseline}")
+
+    if regressions:
+        print(f"⚠️ {len(regressions)} 项相对基准退化:")
+        for key in regressions:
+            print(f"   {key}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,15 +7,88 @@
 APP_TITLE = "数学公式可视化工具"
 APP_GEOMETRY = "1200x800"
 APP_BACKGROUND = "#f0f0f0"
+DEFERRED_STARTUP = True         # 先显示窗口和控制面板，再在后台加载 matplotlib 和字体
+STARTUP_POLL_MS = 50            # 检查后台加载是否完成的间隔（毫秒）
 
 # 绘图设置
 DEFAULT_X_RANGE = (-5, 5)
 DEFAULT_Y_RANGE = (-5, 5)
 PLOT_POINTS = 1000
+ZOOM_STEP = 1.2                 # 鼠标滚轮每格的缩放倍数
+MIN_VIEW_SPAN = 1e-9            # 视图范围的最小宽度
+MAX_VIEW_SPAN = 1e9             # 视图范围的最大宽度
 FIGURE_SIZE = (10, 8)
 FIGURE_DPI = 100
 FIGURE_FACECOLOR = "#f8f8f8"
 AXES_FACECOLOR = "#f5f5f5"
+GRID_POINT_MIN_SPACING_PX = 4   # 坐标网格点之间的最小像素间距，更密时自动抽稀
+
+# 自适应采样设置
+ADAPTIVE_SAMPLING = True        # 是否按曲率与像素误差自适应采样（否则使用PLOT_POINTS均匀采样）
+ADAPTIVE_INITIAL_POINTS = 64    # 初始粗网格点数
+ADAPTIVE_TOLERANCE_PX = 0.25    # 三等分点偏离弦线的最大像素误差
+ADAPTIVE_MAX_DEPTH = 16         # 最大细分层数
+ADAPTIVE_MAX_POINTS_PER_PIXEL = 4  # 每个像素宽度内最多的采样点数
+
+# 函数存储设置
+FUNCTION_STORE_CAPACITY = 16    # 函数存储的初始槽位数（不足时加倍）
+
+# 求值后端设置
+FUSED_EVALUATION = True         # 安装了 numexpr 时用它单遍求值内置函数（多线程、不产生中间数组），否则使用NumPy
+FUSED_MIN_POINTS = 4096         # 点数少于此值时直接使用NumPy（numexpr 每次调用有固定开销）
+FUSED_THREADS = None            # numexpr 的线程数，None 表示使用 numexpr 的默认值
+
+# 批量求值设置
+BATCH_EVAL_CHUNK_ELEMENTS = 2**22  # 同类型曲线广播求值时每块（曲线数×点数）的最大元素数，用于限制内存
+BATCH_SAMPLING_MIN_CURVES = 32  # 需要重新采样的曲线达到此数量时，在共享的均匀网格上批量求值（不做自适应细分）
+BATCH_POINTS_PER_PIXEL = 2      # 批量采样时每个像素宽度内的采样点数
+
+# 参数扫描设置
+SWEEP_PARAMETERS = ('a', 'b', 'c')  # 可以扫描的参数
+SWEEP_DEFAULT_PARAMETER = 'b'   # 默认扫描的参数
+SWEEP_DEFAULT_RANGE = (0.1, 10.0)  # 默认的扫描范围（起点, 终点）
+SWEEP_DEFAULT_STEPS = 100       # 默认的扫描步数（曲线数量）
+SWEEP_MAX_STEPS = 5000          # 扫描步数上限
+SWEEP_POINTS_PER_PIXEL = 1      # 曲线族每个像素宽度内的采样点数（绘制耗时与 曲线数×点数 成正比）
+SWEEP_COLORMAP = 'viridis'      # 曲线族按参数值着色的颜色映射
+SWEEP_LINE_WIDTH = 1.0          # 曲线族的线宽
+SWEEP_ALPHA = 0.8               # 曲线族的不透明度
+
+# 求值缓存设置
+EVAL_CACHE_MAX_BYTES = 64 * 1024 * 1024  # LRU求值缓存的内存预算（字节）
+
+# 瓦片缓存设置
+TILE_CACHE_ENABLED = True       # 是否按2的幂划分的瓦片缓存函数值（平移、缩放时只计算缺失的瓦片）
+TILE_SAMPLES = 256              # 每个瓦片的采样间隔数（偶数）
+TILE_CACHE_MAX_BYTES = 32 * 1024 * 1024  # 瓦片缓存的内存预算（字节，瓦片为float32）
+
+# 特征点求解设置
+MAX_ROOTS = 5                   # 每条曲线最多返回的零点数量（None表示不限制）
+ROOT_TOLERANCE = 0.1            # 未提供求值函数时，零点区间端点的最大允许|y|
+ROOT_REFINE_ITERATIONS = 8      # 零点区间的向量化割线（Illinois）细化迭代次数
+MAX_EXTREMA = 5                 # 每条曲线最多返回的极值点数量（None表示不限制）
+MAX_INTERSECTIONS = 3           # 每对曲线最多返回的交点数量（None表示不限制）
+INTERSECTION_CHUNK_SIZE = 4000000  # 批量求交时每块差值矩阵的最大元素数，用于限制内存
+
+# 后台计算设置
+ASYNC_COMPUTE = True            # 是否在后台线程中计算采样、特征点和交点
+COMPUTE_WORKERS = 2             # 后台计算线程数
+ASYNC_POLL_MS = 16              # 主线程轮询后台计算结果的间隔（毫秒）
+REDRAW_FRAME_MS = 16            # 重绘调度的帧间隔（毫秒），同一帧内的重绘请求合并执行
+
+# 绘图性能分析设置
+PLOT_PROFILING = False          # 是否记录每次绘图各阶段的耗时（运行时可按 F9 切换）
+PROFILE_STATUS_READOUT = True   # 记录耗时时在状态栏显示上一帧的分解和最近各帧的百分位数
+PROFILE_WINDOW = 120            # 计算百分位数时使用的最近帧数
+PROFILE_TRACE_MAX_EVENTS = 100000  # 最多保留的 Chrome trace 事件数
+PROFILE_TRACE_FILE = "plot_trace.json"  # 按 Shift+F9 导出的 Chrome trace 文件
+
+# 实时调节设置
+LIVE_SCRUB_FRAME_MS = 16        # 实时调节时的最小重绘间隔（毫秒，约60fps）
+LIVE_SCRUB_IDLE_MS = 300        # 停止调节多久后执行一次完整重绘（毫秒）
+SCRUB_STEP = 0.1                # 鼠标滚轮每格调整的参数步长
+SCRUB_FINE_STEP = 0.01          # 按住Shift时的精细步长
+SCRUB_COARSE_STEP = 1.0         # 按住Ctrl时的粗调步长
 
 # 函数类型定义
 FUNCTION_TYPES = [
@@ -27,6 +100,24 @@ FUNCTION_TYPES = [
     "对数函数"
 ]
 
+# 自定义函数设置
+CUSTOM_FUNCTION_TYPE = "自定义函数"  # 自定义表达式的函数类型名称，具体函数的类型为 "自定义函数: 表达式"
+EXPRESSION_CACHE_SIZE = 64      # 最多缓存的已编译表达式数量
+EXPRESSION_MAX_DIGITS = 300     # 表达式中常数（包括常数的乘方）的最大十进制位数，更大的常数超出浮点数范围
+EXPRESSION_MAX_EXPONENT = 1000  # 表达式中常数指数的最大绝对值
+
+# 控制面板中各函数类型的公式和参数 (a, b, c) 的默认值（按显示顺序）
+# 控制面板在窗口显示前只读取此表，不导入 NumPy 和计算模块；函数族的 formula、default_params 也取自此表
+FUNCTION_PANEL_INFO = {
+    "二次函数": ("📐 y = a·x² + b·x + c", (1.0, 0.0, 0.0)),
+    "正弦函数": ("〰️ y = a·sin(b·x + c)", (1.0, 1.0, 0.0)),
+    "余弦函数": ("〰️ y = a·cos(b·x + c)", (1.0, 1.0, 0.0)),
+    "正切函数": ("📈 y = a·tan(b·x + c)", (1.0, 0.0, 0.0)),
+    "指数函数": ("📊 y = a·e^(b·x) + c", (1.0, 1.0, 0.0)),
+    "对数函数": ("📉 y = a·log(b·x + c)", (1.0, 1.0, 0.0)),
+    CUSTOM_FUNCTION_TYPE: ("✏️ y = f(x)，可使用参数 a、b、c", (1.0, 1.0, 0.0)),
+}
+
 # 颜色设置
 FUNCTION_COLORS = ['b', 'r', 'g', 'm', 'c', 'y', 'k']
 
@@ -77,6 +168,17 @@ CHINESE_FONT_KEYWORDS = [
 
 FALLBACK_FONTS = ['Arial Unicode MS', 'Liberation Sans']
 
+# 字体缓存设置
+FONT_CACHE_ENABLED = True               # 是否将字体发现结果缓存到磁盘
+FONT_CACHE_APP_DIR = "math_visualizer"  # 用户缓存目录下的应用子目录
+FONT_CACHE_FILENAME = "font_cache.json" # 缓存文件名
+FONT_CACHE_VERSION = 1                  # 缓存格式版本，格式变化时递增
+
+# 字形覆盖率验证设置
+FONT_COVERAGE_TEST_CHARS = "中文测试数学函数零点最大值最小值交点顶点可视化"  # 中文字体必须包含的字符
+FONT_COVERAGE_MIN_RATIO = 1.0           # 判定为支持中文所需的最低覆盖率
+FONT_VERIFY_WORKERS = 8                 # 并行读取字体cmap的线程数
+
 # matplotlib设置
 MATPLOTLIB_CONFIG = {
     'text.usetex': False,
@@ -195,3 +297,19 @@ ANIMATION_CONFIG = {
 # 文件保存设置
 DEFAULT_SAVE_FILENAME = "math_functions_plot.png"
 SAVE_DPI = 150
+BATCH_OUTPUT_FORMATS = ('png', 'svg')  # 批量渲染支持的输出格式
+
+# 基准测试设置
+BENCHMARK_SIZES = (10**3, 10**4, 10**5, 10**6, 10**7)  # 求值、零点和极值点测试的采样点数
+BENCHMARK_CURVES = (2, 8, 32)   # 叠加的曲线数量
+BENCHMARK_WIDTHS = (10, 1000)   # x范围的宽度
+BENCHMARK_EXPRESSION = "x**3 - sin(2*x)/x"  # 参与测试的自定义表达式
+BENCHMARK_PARAMS = (1.0, 1.0, 0.0)  # 测试函数的参数 (a, b, c)，对全部内置函数都有效
+BENCHMARK_REPEATS = 5           # 每项测试最多计时的次数
+BENCHMARK_CASE_BUDGET_S = 2.0   # 每项测试计时的总时间预算（秒），超出后不再重复
+BENCHMARK_MAX_GRID_ELEMENTS = 10**7  # 多曲线测试中 曲线数×采样点数 的上限
+BENCHMARK_REGRESSION_RATIO = 1.25    # 耗时、峰值内存或分配次数超过基准的此倍数时视为退化
+BENCHMARK_MIN_DELTA_S = 0.002   # 耗时差小于此值时视为测量噪声（秒）
+BENCHMARK_MIN_DELTA_BYTES = 1024 * 1024  # 峰值内存差小于此值时视为测量噪声（字节）
+BENCHMARK_MIN_DELTA_ALLOCATIONS = 1000   # 分配的内存块数之差小于此值时视为测量噪声
+BENCHMARK_BASELINE_FILE = "benchmark_baseline.json"  # 默认的基准结果文件
@@ -3,5 +3,17 @@
 核心模块初始化文件
 """
 
-from .math_functions import MathFunctionCalculator
-from .font_manager import FontManager
+# 按需导入：子模块依赖 numpy/matplotlib，延迟到首次访问时加载以加快启动
+_LAZY_EXPORTS = {
+    'MathFunctionCalculator': '.math_functions',
+    'FontManager': '.font_manager',
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        from importlib import import_module
+        return getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
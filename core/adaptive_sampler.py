@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+"""
+自适应采样模块 - 按像素空间误差递归细分区间，生成绘制曲线所需的最少采样点
+"""
+
+import numpy as np
+from typing import Callable, Optional, Tuple
+from config.settings import (
+    ADAPTIVE_INITIAL_POINTS, ADAPTIVE_TOLERANCE_PX,
+    ADAPTIVE_MAX_DEPTH, ADAPTIVE_MAX_POINTS_PER_PIXEL
+)
+
+
+class AdaptiveSampler:
+    """自适应曲线采样器类"""
+
+    @staticmethod
+    def initial_grid(x_range: Tuple[float, float], pixel_width: int,
+                     count: int = ADAPTIVE_INITIAL_POINTS) -> np.ndarray:
+        """
+        生成初始粗网格
+
+        内部点做确定性的微小扰动，避免网格与周期函数的零点恰好对齐而漏掉整段波形。
+
+        Args:
+            x_range: x轴范围
+            pixel_width: 画布宽度（像素）
+            count: 初始点数
+
+        Returns:
+            升序排列的x坐标数组（包含两个端点）
+        """
+        count = int(max(3, min(count, pixel_width)))
+        x = np.linspace(x_range[0], x_range[1], count)
+        step = (x_range[1] - x_range[0]) / (count - 1)
+        jitter = 0.25 * step * np.sin(np.arange(1, count - 1) * 2.399963)
+        x[1:-1] += jitter
+        return x
+
+    @staticmethod
+    def sample(func: Callable[[np.ndarray], np.ndarray], x_range: Tuple[float, float],
+               y_range: Tuple[float, float], pixel_width: int, pixel_height: int,
+               tolerance_px: float = ADAPTIVE_TOLERANCE_PX,
+               max_depth: int = ADAPTIVE_MAX_DEPTH,
+               seed: Optional[Tuple[np.ndarray, np.ndarray]] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        对函数进行自适应采样
+
+        Args:
+            func: 向量化求值函数
+            x_range: x轴范围
+            y_range: y轴范围（用于换算像素误差）
+            pixel_width, pixel_height: 绘图区域的像素尺寸
+            tolerance_px: 允许的最大像素误差
+            max_depth: 最大细分层数
+            seed: 相邻视图中已有的采样点 (x, y)（可选）。只应在新视图的像素精度不高于旧视图时
+                  （平移或缩小）提供，此时相邻旧点之间的区间无需重新检查
+
+        Returns:
+            (x, y) 采样点数组
+        """
+        x = AdaptiveSampler.initial_grid(x_range, pixel_width)
+        active = None
+        if seed is not None:
+            x, y, active = AdaptiveSampler.merge_seed(func, x, seed, x_range, pixel_width)
+        else:
+            y = np.asarray(func(x), dtype=float)
+        return AdaptiveSampler.refine(func, x, y, y_range, pixel_width, pixel_height,
+                                      tolerance_px, max_depth, active)
+
+    @staticmethod
+    def merge_seed(func: Callable[[np.ndarray], np.ndarray], grid: np.ndarray,
+                   seed: Tuple[np.ndarray, np.ndarray], x_range: Tuple[float, float],
+                   pixel_width: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        用旧视图中落在新范围内的采样点代替初始网格的对应部分
+
+        旧点之间的区间已满足不低于新视图的精度，无需重新检查；
+        只有新露出部分的粗网格点需要求值，并从与它们相邻的区间开始细分。
+
+        Args:
+            func: 向量化求值函数
+            grid: 新范围的初始网格
+            seed: 旧视图的采样点 (x, y)
+            x_range: 新的x轴范围
+            pixel_width: 画布宽度（像素）
+
+        Returns:
+            (x, y, active)，active 标记需要检查的区间
+        """
+        seed_x = np.asarray(seed[0], dtype=float)
+        seed_y = np.asarray(seed[1], dtype=float)
+        inside = (seed_x > min(x_range)) & (seed_x < max(x_range))
+        # 缩小视图时旧点可能远密于新的像素网格，此时不复用
+        if inside.sum() < 2 or inside.sum() > pixel_width * ADAPTIVE_MAX_POINTS_PER_PIXEL:
+            y = np.asarray(func(grid), dtype=float)
+            return grid, y, np.ones(len(grid) - 1, dtype=bool)
+
+        seed_x, seed_y = seed_x[inside], seed_y[inside]
+        # 只保留旧点覆盖范围之外的网格点（新露出的部分）
+        new_x = grid[(grid < seed_x[0]) | (grid > seed_x[-1])]
+        new_y = np.asarray(func(new_x), dtype=float)
+
+        x = np.concatenate((new_x, seed_x))
+        y = np.concatenate((new_y, seed_y))
+        is_new = np.concatenate((np.ones(len(new_x), dtype=bool), np.zeros(len(seed_x), dtype=bool)))
+        order = np.argsort(x, kind='stable')
+        x, y, is_new = x[order], y[order], is_new[order]
+
+        # 至少有一个端点是新点的区间需要检查
+        active = is_new[:-1] | is_new[1:]
+        return x, y, active
+
+    @staticmethod
+    def rough_intervals(x: np.ndarray, y: np.ndarray, y_range: Tuple[float, float],
+                        pixel_height: int,
+                        tolerance_px: float = ADAPTIVE_TOLERANCE_PX) -> np.ndarray:
+        """
+        根据已有的密集等距采样点估计哪些区间需要细分，不额外求值
+
+        相邻三点的二阶差分的1/8近似于区间内折线偏离曲线的距离；
+        此外跨越定义域边界/极点（部分为NaN）的区间也需要细分。
+
+        Args:
+            x, y: 等距采样点
+            y_range: y轴范围
+            pixel_height: 画布高度（像素）
+            tolerance_px: 允许的最大像素误差
+
+        Returns:
+            长度为 len(x)-1 的布尔数组，标记需要细分的区间
+        """
+        y = np.asarray(y, dtype=float)
+        active = np.zeros(max(len(x) - 1, 0), dtype=bool)
+        if len(y) < 3:
+            active[:] = True
+            return active
+
+        y_lo, y_hi = min(y_range), max(y_range)
+        scale_y = max(pixel_height, 1) / max(y_hi - y_lo, 1e-12)
+        finite = np.isfinite(y)
+        active |= finite[:-1] != finite[1:]
+
+        with np.errstate(invalid='ignore', over='ignore'):
+            err = np.abs(y[:-2] - 2 * y[1:-1] + y[2:]) / 8 * scale_y
+            hidden = (((y[:-2] > y_hi) & (y[1:-1] > y_hi) & (y[2:] > y_hi)) |
+                      ((y[:-2] < y_lo) & (y[1:-1] < y_lo) & (y[2:] < y_lo)))
+        rough = (err > tolerance_px) & ~hidden
+        rough &= finite[:-2] & finite[1:-1] & finite[2:]
+        active[:-1] |= rough
+        active[1:] |= rough
+        return active
+
+    @staticmethod
+    def refine(func: Callable[[np.ndarray], np.ndarray], x: np.ndarray, y: np.ndarray,
+               y_range: Tuple[float, float], pixel_width: int, pixel_height: int,
+               tolerance_px: float = ADAPTIVE_TOLERANCE_PX,
+               max_depth: int = ADAPTIVE_MAX_DEPTH,
+               active: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        在已有采样点的基础上逐层细分
+
+        每一层对所有待检查区间同时求三等分点的值，若偏离弦线超过像素容差，
+        或区间跨越定义域边界/极点（部分为NaN），则插入这两个点并继续检查三个子区间。
+        区间宽度下限由画布像素宽度决定。
+
+        Args:
+            func: 向量化求值函数
+            x, y: 初始采样点
+            y_range: y轴范围
+            pixel_width, pixel_height: 绘图区域的像素尺寸
+            tolerance_px: 允许的最大像素误差
+            max_depth: 最大细分层数
+            active: 第一层需要检查的区间（可选，默认检查全部区间）
+
+        Returns:
+            (x, y) 细分后的采样点数组
+        """
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        if len(x) < 2:
+            return x, y
+
+        x_span = abs(x[-1] - x[0])
+        y_lo, y_hi = min(y_range), max(y_range)
+        y_span = max(y_hi - y_lo, 1e-12)
+        scale_y = max(pixel_height, 1) / y_span
+        min_dx = x_span / (max(pixel_width, 1) * ADAPTIVE_MAX_POINTS_PER_PIXEL)
+
+        if active is None:
+            active = np.ones(len(x) - 1, dtype=bool)
+        for _ in range(max_depth):
+            idx = np.flatnonzero(active)
+            if len(idx) == 0:
+                break
+
+            # 三等分点检查：中点检查会漏掉中点恰好落在弦上的S形区间
+            xa, xb = x[idx], x[idx + 1]
+            ya, yb = y[idx], y[idx + 1]
+            x1 = xa + (xb - xa) / 3
+            x2 = xb - (xb - xa) / 3
+            yq = np.asarray(func(np.concatenate((x1, x2))), dtype=float)
+            y1, y2 = yq[:len(idx)], yq[len(idx):]
+
+            finite = np.isfinite(ya) & np.isfinite(yb) & np.isfinite(y1) & np.isfinite(y2)
+            any_finite = np.isfinite(ya) | np.isfinite(yb) | np.isfinite(y1) | np.isfinite(y2)
+            mixed = ~finite & any_finite
+
+            with np.errstate(invalid='ignore'):
+                err1 = np.abs(y1 - (2 * ya + yb) / 3)
+                err2 = np.abs(y2 - (ya + 2 * yb) / 3)
+                err = np.maximum(err1, err2) * scale_y
+                # 四个点都在可见范围同一侧之外时，整段不可见
+                hidden = (((ya > y_hi) & (yb > y_hi) & (y1 > y_hi) & (y2 > y_hi)) |
+                          ((ya < y_lo) & (yb < y_lo) & (y1 < y_lo) & (y2 < y_lo)))
+            err = np.where(finite & ~hidden, err, 0.0)
+
+            split = ((err > tolerance_px) | mixed) & ((xb - xa) > 3 * min_dx)
+            sel = idx[split]
+            if len(sel) == 0:
+                break
+
+            # 每个细分区间插入两个点：(sel+1) 位置依次放入 x1、x2
+            insert_at = np.repeat(sel + 1, 2)
+            x = np.insert(x, insert_at, np.column_stack((x1[split], x2[split])).ravel())
+            y = np.insert(y, insert_at, np.column_stack((y1[split], y2[split])).ravel())
+
+            # 第k个被细分的区间之前已插入2k个点，其三个子区间从 sel+2k 开始
+            new_pos = sel + 2 * np.arange(len(sel))
+            active = np.zeros(len(x) - 1, dtype=bool)
+            active[new_pos] = True
+            active[new_pos + 1] = True
+            active[new_pos + 2] = True
+
+        return x, y
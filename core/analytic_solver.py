@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""
+解析特征求解模块 - 按函数族直接枚举零点、极值点、渐近线和周期边界
+
+各函数族的求解公式见 core.function_registry，本模块提供共用的枚举工具
+"""
+
+import numpy as np
+from typing import Dict, Optional, Tuple
+from core.feature_engine import EXTREMA_DTYPE, EXTREMUM_MAX, EXTREMUM_MIN
+
+
+class AnalyticSolver:
+    """解析特征求解器类
+
+    所有结果只依赖函数参数与x范围，与采样点数无关；
+    枚举的复杂度为 O(k)，k 为范围内的特征数量。
+    """
+
+    @staticmethod
+    def supports(func_type: str) -> bool:
+        """判断函数类型是否有解析解"""
+        from core.function_registry import FunctionRegistry
+        family = FunctionRegistry.get(func_type)
+        return family is not None and family.has_analytic_features
+
+    @staticmethod
+    def empty_features() -> Dict[str, np.ndarray]:
+        """
+        创建空的特征字典
+
+        Returns:
+            包含 roots, extrema, vertical_asymptotes, horizontal_asymptotes,
+            period_boundaries 五个键的字典
+        """
+        return {
+            'roots': np.empty(0),
+            'extrema': np.empty(0, dtype=EXTREMA_DTYPE),
+            'vertical_asymptotes': np.empty(0),
+            'horizontal_asymptotes': np.empty(0),
+            'period_boundaries': np.empty(0),
+        }
+
+    @staticmethod
+    def solve(func_type: str, params: Tuple[float, float, float], x_range: Tuple[float, float],
+              max_count: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """
+        求解函数在x范围内的全部特征
+
+        Args:
+            func_type: 函数类型
+            params: 函数参数 (a, b, c)
+            x_range: x轴范围
+            max_count: 每类特征最多枚举的数量，None表示不限制
+
+        Returns:
+            特征字典（各项均按x升序排列）
+        """
+        # 函数族依赖本模块的枚举工具，在此处导入以避免循环导入
+        from core.function_registry import FunctionRegistry
+        features = AnalyticSolver.empty_features()
+        family = FunctionRegistry.get(func_type)
+        if family is not None:
+            family.solve_features(features, *params, min(x_range), max(x_range), max_count)
+        return features
+
+    @staticmethod
+    def periodic_solutions(b: float, c: float, x_min: float, x_max: float,
+                           phase: float, step: float,
+                           max_count: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        求解 b·x + c = phase + k·step 在 [x_min, x_max] 内的全部解
+
+        Args:
+            b, c: 线性相位参数
+            x_min, x_max: x范围
+            phase: 相位偏移
+            step: 相邻解之间的相位步长
+            max_count: 最多枚举的解数量
+
+        Returns:
+            (按x升序排列的解, 对应的整数k)
+        """
+        u_lo, u_hi = sorted((b * x_min + c, b * x_max + c))
+        k_lo = np.ceil((u_lo - phase) / step)
+        k_hi = np.floor((u_hi - phase) / step)
+        if k_hi < k_lo:
+            return np.empty(0), np.empty(0, dtype=np.int64)
+
+        if max_count is not None and k_hi - k_lo + 1 > max_count:
+            # 从x较小的一端开始截取
+            if b > 0:
+                k_hi = k_lo + max_count - 1
+            else:
+                k_lo = k_hi - max_count + 1
+
+        k = np.arange(int(k_lo), int(k_hi) + 1, dtype=np.int64)
+        x = (phase + k * step - c) / b
+        if b < 0:
+            x, k = x[::-1], k[::-1]
+
+        keep = (x >= x_min) & (x <= x_max)
+        return x[keep], k[keep]
+
+    @staticmethod
+    def make_extrema(x: np.ndarray, y: np.ndarray, kind: Optional[int] = None) -> np.ndarray:
+        """构造极值点结构化数组，未指定kind时按函数值符号判断极大/极小"""
+        extrema = np.empty(len(x), dtype=EXTREMA_DTYPE)
+        extrema['x'] = x
+        extrema['y'] = y
+        if kind is None:
+            extrema['kind'] = np.where(np.asarray(y) > 0, EXTREMUM_MAX, EXTREMUM_MIN)
+        else:
+            extrema['kind'] = kind
+        return extrema
+
+    @staticmethod
+    def in_range(values, x_min: float, x_max: float) -> np.ndarray:
+        """筛选出位于x范围内的值并升序排列"""
+        values = np.sort(np.asarray(values, dtype=float))
+        return values[(values >= x_min) & (values <= x_max)]
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+"""
+函数求值缓存模块 - 按 (函数类型, 参数, 网格) 缓存求值结果的LRU缓存
+"""
+
+import threading
+import numpy as np
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional, Tuple
+from config.settings import EVAL_CACHE_MAX_BYTES
+
+
+class EvaluationCache:
+    """带内存预算的LRU求值缓存类
+
+    缓存的数组均被设为只读，调用方可以安全地共享而不必复制；
+    所有操作都加锁，可以被后台计算线程和主线程同时使用。
+    """
+
+    def __init__(self, max_bytes: int = EVAL_CACHE_MAX_BYTES):
+        """
+        初始化缓存
+
+        Args:
+            max_bytes: 缓存数组占用的最大字节数
+        """
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def grid_key(start: float, stop: float, count: int) -> Tuple[float, float, int]:
+        """生成均匀网格的键"""
+        return (float(start), float(stop), int(count))
+
+    @staticmethod
+    def make_key(func_type: str, params: Tuple[float, float, float], grid: Hashable) -> Tuple:
+        """
+        生成缓存键
+
+        Args:
+            func_type: 函数类型
+            params: 函数参数 (a, b, c)
+            grid: 网格描述，如 grid_key() 的返回值
+
+        Returns:
+            可哈希的缓存键
+        """
+        return (func_type, tuple(float(p) for p in params), grid)
+
+    def get(self, key: Hashable) -> Optional[Tuple[np.ndarray, ...]]:
+        """
+        查询缓存，命中时将条目移到最近使用的位置
+
+        Args:
+            key: 缓存键
+
+        Returns:
+            缓存的数组元组，未命中时返回None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: Hashable, arrays: Tuple[np.ndarray, ...]) -> Tuple[np.ndarray, ...]:
+        """
+        写入缓存，超出内存预算时淘汰最久未使用的条目
+
+        Args:
+            key: 缓存键
+            arrays: 要缓存的数组元组
+
+        Returns:
+            只读化后的数组元组
+        """
+        frozen = []
+        for array in arrays:
+            array = np.asarray(array)
+            array.setflags(write=False)
+            frozen.append(array)
+        frozen = tuple(frozen)
+
+        size = sum(array.nbytes for array in frozen)
+        if size > self.max_bytes:
+            return frozen  # 单个条目超出预算时不缓存
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= sum(array.nbytes for array in old)
+
+            self._entries[key] = frozen
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= sum(array.nbytes for array in evicted)
+        return frozen
+
+    def get_or_compute(self, key: Hashable,
+                       compute: Callable[[], Tuple[np.ndarray, ...]]) -> Tuple[np.ndarray, ...]:
+        """
+        查询缓存，未命中时调用compute计算并写入
+
+        Args:
+            key: 缓存键
+            compute: 返回数组元组的计算函数
+
+        Returns:
+            只读的数组元组
+        """
+        entry = self.get(key)
+        if entry is not None:
+            return entry
+        return self.put(key, compute())
+
+    def clear(self) -> None:
+        """清空缓存"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def get_memory_usage(self) -> int:
+        """获取当前缓存占用的字节数"""
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+"""
+表达式编译模块 - 用 sympy 解析用户输入的表达式，并编译为 NumPy 向量化函数
+
+表达式只解析一次：sympy 生成函数值、一阶和二阶导数的符号表达式，
+再经 lambdify 转换为 NumPy 函数；编译结果按表达式的哈希值缓存。
+sympy 在第一次编译时才导入，不影响启动速度。
+"""
+
+import re
+import math
+import hashlib
+import threading
+import numpy as np
+from collections import OrderedDict
+from typing import Callable, List, Optional
+from config.settings import EXPRESSION_CACHE_SIZE, EXPRESSION_MAX_DIGITS, EXPRESSION_MAX_EXPONENT
+
+# 表达式中允许出现的字符；禁止属性访问和双下划线名称
+_ALLOWED_CHARS = re.compile(r'^[0-9A-Za-z_+\-*/^().,\s]+$')
+_ATTRIBUTE_ACCESS = re.compile(r'\.\s*[A-Za-z_]')
+
+# 可以使用的变量和参数
+VARIABLE_NAME = 'x'
+PARAMETER_NAMES = ('a', 'b', 'c')
+
+# 可以使用的函数和常数（sympy 中的名称）
+ALLOWED_FUNCTIONS = (
+    'sin', 'cos', 'tan', 'cot', 'sec', 'csc', 'asin', 'acos', 'atan', 'atan2',
+    'sinh', 'cosh', 'tanh', 'asinh', 'acosh', 'atanh',
+    'exp', 'log', 'sqrt', 'cbrt', 'Abs', 'sign', 'floor', 'ceiling', 'Min', 'Max',
+    'pi', 'E',
+)
+
+# 常用写法的别名
+FUNCTION_ALIASES = {
+    'ln': 'log', 'abs': 'Abs', 'arcsin': 'asin', 'arccos': 'acos', 'arctan': 'atan',
+    'ceil': 'ceiling', 'min': 'Min', 'max': 'Max', 'e': 'E',
+}
+
+
+class CompiledExpression:
+    """编译后的表达式
+
+    evaluate、derivative、second_derivative 均接受 (x, a, b, c)，
+    返回与x（及参数数组）广播后形状相同的新数组，定义域外和无穷大处为NaN。
+    """
+
+    def __init__(self, text: str, derivative_text: str, parameters: List[str],
+                 kernel: Callable, derivative_kernel: Optional[Callable],
+                 second_derivative_kernel: Optional[Callable]):
+        """
+        Args:
+            text: 规范化后的表达式文本
+            derivative_text: 一阶导数的表达式文本
+            parameters: 表达式中用到的参数名
+            kernel: 函数值的 lambdify 结果
+            derivative_kernel: 一阶导数的 lambdify 结果（无法求导时为None）
+            second_derivative_kernel: 二阶导数的 lambdify 结果（无法求导时为None）
+        """
+        self.text = text
+        self.derivative_text = derivative_text
+        self.parameters = parameters
+        self._kernel = kernel
+        self._derivative_kernel = derivative_kernel
+        self._second_derivative_kernel = second_derivative_kernel
+
+    @staticmethod
+    def _call(kernel: Callable, x: np.ndarray, a: float, b: float, c: float) -> np.ndarray:
+        """调用 lambdify 生成的函数，结果（包括常数表达式）广播为x与参数广播后的形状"""
+        x = np.asarray(x, dtype=float)
+        shape = np.broadcast_shapes(x.shape, np.shape(a), np.shape(b), np.shape(c))
+        with np.errstate(all='ignore'):
+            y = np.array(np.broadcast_to(kernel(x, a, b, c), shape), dtype=float)
+        y[~np.isfinite(y)] = np.nan
+        return y
+
+    def evaluate(self, x: np.ndarray, a: float, b: float, c: float) -> np.ndarray:
+        """计算函数值"""
+        return self._call(self._kernel, x, a, b, c)
+
+    @property
+    def has_derivatives(self) -> bool:
+        """是否有可用的符号导数"""
+        return self._derivative_kernel is not None
+
+    def derivative(self, x: np.ndarray, a: float, b: float, c: float) -> np.ndarray:
+        """计算一阶导数"""
+        if self._derivative_kernel is None:
+            raise NotImplementedError(f"无法对表达式求导: {self.text}")
+        return self._call(self._derivative_kernel, x, a, b, c)
+
+    def second_derivative(self, x: np.ndarray, a: float, b: float, c: float) -> np.ndarray:
+        """计算二阶导数"""
+        if self._second_derivative_kernel is None:
+            raise NotImplementedError(f"无法对表达式求导: {self.text}")
+        return self._call(self._second_derivative_kernel, x, a, b, c)
+
+
+class ExpressionCompiler:
+    """表达式编译器类（带LRU缓存，可以被多个线程同时使用）"""
+
+    _cache = OrderedDict()
+    _lock = threading.Lock()
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """规范化表达式文本：合并连续空白"""
+        return ' '.join(str(text).split())
+
+    @staticmethod
+    def cache_key(text: str) -> str:
+        """计算表达式的缓存键（规范化文本的哈希值）"""
+        return hashlib.sha1(ExpressionCompiler.normalize(text).encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def compile(text: str) -> CompiledExpression:
+        """
+        编译表达式，同一表达式只解析一次
+
+        Args:
+            text: 表达式文本，如 "x**3 - sin(2*x)/x"，可以使用参数 a、b、c
+
+        Returns:
+            编译后的表达式
+
+        Raises:
+            ValueError: 表达式为空、包含不支持的内容或无法解析
+        """
+        key = ExpressionCompiler.cache_key(text)
+        with ExpressionCompiler._lock:
+            compiled = ExpressionCompiler._cache.get(key)
+            if compiled is not None:
+                ExpressionCompiler._cache.move_to_end(key)
+                return compiled
+
+        compiled = ExpressionCompiler._build(ExpressionCompiler.normalize(text))
+
+        with ExpressionCompiler._lock:
+            ExpressionCompiler._cache[key] = compiled
+            while len(ExpressionCompiler._cache) > EXPRESSION_CACHE_SIZE:
+                ExpressionCompiler._cache.popitem(last=False)
+        return compiled
+
+    @staticmethod
+    def preload() -> None:
+        """预先导入 sympy 及其解析器（可在后台线程中调用），第一次编译时无需在界面线程中导入"""
+        import sympy
+        from sympy.parsing import sympy_parser
+
+    @staticmethod
+    def _build(text: str) -> CompiledExpression:
+        """解析表达式并生成函数值和导数的 NumPy 函数"""
+        if not text:
+            raise ValueError("请输入函数表达式")
+        if not _ALLOWED_CHARS.match(text) or '__' in text or _ATTRIBUTE_ACCESS.search(text):
+            raise ValueError("表达式包含不支持的字符")
+
+        import sympy
+        from sympy.parsing.sympy_parser import (
+            parse_expr, standard_transformations, implicit_multiplication, implicit_application,
+            function_exponentiation, convert_xor
+        )
+
+        x = sympy.Symbol(VARIABLE_NAME, real=True)
+        params = [sympy.Symbol(name, real=True) for name in PARAMETER_NAMES]
+        local_dict = {VARIABLE_NAME: x}
+        local_dict.update(zip(PARAMETER_NAMES, params))
+        for alias, name in FUNCTION_ALIASES.items():
+            local_dict[alias] = getattr(sympy, name)
+
+        # 只提供白名单中的名称；其余名称会被解析为符号，随后报告为未知名称
+        global_dict = {name: getattr(sympy, name) for name in ALLOWED_FUNCTIONS}
+        global_dict.update({name: getattr(sympy, name)
+                            for name in ('Integer', 'Float', 'Rational', 'Symbol', 'Function')})
+
+        # 支持 2x、sin x、^ 等常见写法；不拆分多字母名称，拼错的函数名会作为未知名称报告
+        transformations = standard_transformations + (
+            implicit_multiplication, implicit_application, function_exponentiation, convert_xor
+        )
+        # 先不求值地解析并检查常数的大小，避免 9**9**9**9 之类的常数在求值时长时间占用界面线程
+        try:
+            # 不求值时解析结果由 Add、Mul、Pow 直接构造，只在这一步提供这些名称
+            constructors = {name: getattr(sympy, name) for name in ('Add', 'Mul', 'Pow')}
+            unevaluated = parse_expr(text, local_dict=local_dict, global_dict=dict(global_dict, **constructors),
+                                     transformations=transformations, evaluate=False)
+        except Exception:
+            raise ValueError(f"无法解析表达式: {text}")
+        if isinstance(unevaluated, sympy.Basic):
+            ExpressionCompiler._check_constants(sympy, unevaluated)
+        try:
+            expr = parse_expr(text, local_dict=local_dict, global_dict=global_dict,
+                              transformations=transformations)
+        except Exception:
+            raise ValueError(f"无法解析表达式: {text}")
+
+        if not isinstance(expr, sympy.Expr):
+            raise ValueError(f"无法解析表达式: {text}")
+        unknown = sorted(str(s) for s in expr.free_symbols - {x, *params})
+        undefined = sorted(str(f.func) for f in expr.atoms(sympy.core.function.AppliedUndef))
+        if unknown or undefined:
+            raise ValueError(f"表达式中有未知的名称: {', '.join(unknown + undefined)}")
+        if expr.has(sympy.I):
+            raise ValueError("表达式的值不能是复数")
+
+        args = (x, *params)
+        kernel = sympy.lambdify(args, expr, modules='numpy')
+
+        # 无法求导或导数无法转换为 NumPy 函数时（如含未求值的导数），细化时退回割线法
+        derivative_text = ""
+        derivative_kernel = second_derivative_kernel = None
+        try:
+            first = sympy.diff(expr, x)
+            second = sympy.diff(first, x)
+            if not first.has(sympy.Derivative) and not second.has(sympy.Derivative):
+                derivative_kernel = sympy.lambdify(args, first, modules='numpy')
+                second_derivative_kernel = sympy.lambdify(args, second, modules='numpy')
+                derivative_text = sympy.sstr(first)
+        except Exception:
+            derivative_kernel = second_derivative_kernel = None
+
+        parameters = [str(p) for p in params if p in expr.free_symbols]
+        return CompiledExpression(text, derivative_text, parameters,
+                                  kernel, derivative_kernel, second_derivative_kernel)
+
+    @staticmethod
+    def _log10_magnitude(sympy, value) -> float:
+        """常数子表达式绝对值的常用对数，无法求出有限值时返回无穷大"""
+        try:
+            magnitude = abs(sympy.N(value))
+            if magnitude == 0:
+                return -math.inf
+            digits = float(sympy.log(magnitude, 10).evalf())
+        except (TypeError, ValueError, ArithmeticError):
+            return math.inf
+        return math.inf if math.isnan(digits) else digits
+
+    @staticmethod
+    def _check_constants(sympy, expr) -> None:
+        """
+        检查未求值的表达式树中常数和常数指数的大小
+
+        自底向上遍历，只对已通过检查的子表达式求近似值，因此检查本身的代价有上限。
+
+        Raises:
+            ValueError: 常数超过 EXPRESSION_MAX_DIGITS 位或常数指数超过 EXPRESSION_MAX_EXPONENT
+        """
+        max_exponent_digits = math.log10(EXPRESSION_MAX_EXPONENT)
+        for node in sympy.postorder_traversal(expr):
+            if node.is_Number:
+                if ExpressionCompiler._log10_magnitude(sympy, node) > EXPRESSION_MAX_DIGITS:
+                    raise ValueError("表达式中的常数过大")
+            elif node.is_Pow:
+                base, exponent = node.args
+                if exponent.free_symbols:
+                    continue
+                exponent_digits = ExpressionCompiler._log10_magnitude(sympy, exponent)
+                if exponent_digits > max_exponent_digits:
+                    raise ValueError(f"表达式中的指数过大（绝对值不能超过 {EXPRESSION_MAX_EXPONENT}）")
+                if not base.free_symbols:
+                    base_digits = ExpressionCompiler._log10_magnitude(sympy, base)
+                    if 10 ** exponent_digits * abs(base_digits) > EXPRESSION_MAX_DIGITS:
+                        raise ValueError("表达式中的常数过大")
+
+    @staticmethod
+    def clear_cache() -> None:
+        """清空编译缓存"""
+        with ExpressionCompiler._lock:
+            ExpressionCompiler._cache.clear()
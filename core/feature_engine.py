@@ -0,0 +1,409 @@
+# -*- coding: utf-8 -*-
+"""
+特征点数值求解引擎 - 基于数组掩码的向量化实现
+"""
+
+import numpy as np
+from typing import Callable, Optional, Sequence
+from config.settings import (
+    MAX_ROOTS, MAX_EXTREMA, MAX_INTERSECTIONS, ROOT_TOLERANCE,
+    ROOT_REFINE_ITERATIONS, INTERSECTION_CHUNK_SIZE
+)
+
+
+# 极值点结构化数组类型：kind 为 1 表示极大值，-1 表示极小值
+EXTREMUM_MAX = 1
+EXTREMUM_MIN = -1
+EXTREMA_DTYPE = np.dtype([('x', 'f8'), ('y', 'f8'), ('kind', 'i1')])
+
+# 交点结构化数组类型：i, j 为两条曲线在矩阵中的行号（i < j）
+INTERSECTION_DTYPE = np.dtype([('i', 'i4'), ('j', 'i4'), ('x', 'f8'), ('y', 'f8')])
+
+
+class FeatureEngine:
+    """特征点求解引擎类（零点、极值点、交点）"""
+
+    @staticmethod
+    def find_sign_changes(y: np.ndarray) -> np.ndarray:
+        """
+        一次性找出数组中所有的变号区间
+
+        Args:
+            y: y坐标数组
+
+        Returns:
+            区间左端点下标数组，区间为 [i, i+1]
+        """
+        y0 = y[:-1]
+        y1 = y[1:]
+        mask = np.isfinite(y0) & np.isfinite(y1)
+        mask &= (y0 * y1 <= 0)
+        mask &= np.abs(y1 - y0) > 1e-10
+        return np.flatnonzero(mask)
+
+    @staticmethod
+    def refine_brackets(func: Callable[[np.ndarray], np.ndarray],
+                        a: np.ndarray, b: np.ndarray, fa: np.ndarray, fb: np.ndarray,
+                        iterations: int = ROOT_REFINE_ITERATIONS) -> np.ndarray:
+        """
+        对所有变号区间同时进行割线（Illinois）迭代细化
+
+        Args:
+            func: 向量化求值函数
+            a, b: 区间左右端点数组
+            fa, fb: 端点处的函数值数组
+            iterations: 最大迭代次数
+
+        Returns:
+            细化后的零点数组
+        """
+        a = np.array(a, dtype=float)
+        b = np.array(b, dtype=float)
+        fa = np.array(fa, dtype=float)
+        fb = np.array(fb, dtype=float)
+        side = np.zeros(a.shape, dtype=np.int8)
+        c = a - fa * (b - a) / (fb - fa)
+
+        for _ in range(iterations):
+            fc = np.asarray(func(c), dtype=float)
+
+            # fc与fb同号：用c替换b，连续保留a时将fa减半（Illinois修正）
+            keep_a = fc * fb > 0
+            fa = np.where(keep_a & (side == -1), fa * 0.5, fa)
+            b = np.where(keep_a, c, b)
+            fb = np.where(keep_a, fc, fb)
+
+            # fc与fa同号：用c替换a
+            keep_b = fc * fa > 0
+            fb = np.where(keep_b & (side == 1), fb * 0.5, fb)
+            a = np.where(keep_b, c, a)
+            fa = np.where(keep_b, fc, fa)
+
+            side = np.where(keep_a, -1, np.where(keep_b, 1, side)).astype(np.int8)
+
+            # fc恰为0或无法比较（NaN）时区间收缩为该点
+            done = ~(keep_a | keep_b)
+            a = np.where(done, c, a)
+            b = np.where(done, c, b)
+
+            denom = fb - fa
+            with np.errstate(invalid='ignore', divide='ignore'):
+                c_next = a - fa * (b - a) / denom
+            c = np.where(done | (denom == 0) | ~np.isfinite(c_next), c, c_next)
+
+            if np.all(np.abs(b - a) <= 1e-12 * (1.0 + np.abs(c))):
+                break
+
+        return c
+
+    @staticmethod
+    def newton_brackets(func: Callable[[np.ndarray], np.ndarray],
+                        derivative: Callable[[np.ndarray], np.ndarray],
+                        a: np.ndarray, b: np.ndarray, fa: np.ndarray, fb: np.ndarray,
+                        iterations: int = ROOT_REFINE_ITERATIONS) -> np.ndarray:
+        """
+        对所有变号区间同时进行带区间保护的牛顿迭代
+
+        牛顿步落在当前区间之外或导数无效时改用二分，因此与割线法一样不会跑出区间，
+        而在单根附近二次收敛。
+
+        Args:
+            func: 向量化求值函数
+            derivative: 向量化导数函数
+            a, b: 区间左右端点数组
+            fa, fb: 端点处的函数值数组
+            iterations: 最大迭代次数
+
+        Returns:
+            细化后的零点数组
+        """
+        a = np.array(a, dtype=float)
+        b = np.array(b, dtype=float)
+        fa = np.array(fa, dtype=float)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            c = a - fa * (b - a) / (np.asarray(fb, dtype=float) - fa)
+        c = np.where(np.isfinite(c), np.clip(c, np.minimum(a, b), np.maximum(a, b)), 0.5 * (a + b))
+
+        for _ in range(iterations):
+            fc = np.asarray(func(c), dtype=float)
+            dc = np.asarray(derivative(c), dtype=float)
+
+            # 保持 [a, b] 为变号区间
+            same = fc * fa > 0
+            a = np.where(same, c, a)
+            fa = np.where(same, fc, fa)
+            b = np.where(same, b, c)
+
+            with np.errstate(invalid='ignore', divide='ignore'):
+                c_next = c - fc / dc
+            lo, hi = np.minimum(a, b), np.maximum(a, b)
+            inside = np.isfinite(c_next) & (c_next > lo) & (c_next < hi)
+            c_next = np.where(inside, c_next, 0.5 * (a + b))
+            c_next = np.where(fc == 0, c, c_next)
+
+            converged = np.abs(c_next - c) <= 1e-12 * (1.0 + np.abs(c))
+            c = c_next
+            if np.all(converged):
+                break
+
+        return c
+
+    @staticmethod
+    def find_roots(x: np.ndarray, y: np.ndarray,
+                   func: Optional[Callable[[np.ndarray], np.ndarray]] = None,
+                   tolerance: float = ROOT_TOLERANCE,
+                   max_count: Optional[int] = MAX_ROOTS,
+                   derivative: Optional[Callable[[np.ndarray], np.ndarray]] = None) -> np.ndarray:
+        """
+        寻找采样曲线的全部零点
+
+        Args:
+            x: x坐标数组
+            y: y坐标数组
+            func: 向量化求值函数（可选）。提供时对区间做割线细化，并按残差剔除间断点
+            tolerance: 容差
+            max_count: 最多返回的零点数量，None表示不限制
+            derivative: 向量化导数函数（可选，需同时提供func）。提供时改用牛顿迭代细化
+
+        Returns:
+            升序排列的零点数组
+        """
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        if len(y) < 2:
+            return np.empty(0)
+
+        idx = FeatureEngine.find_sign_changes(y)
+        x0, x1 = x[idx], x[idx + 1]
+        y0, y1 = y[idx], y[idx + 1]
+
+        if func is None:
+            # 只有采样值时：线性插值，并用端点幅值过滤跨越间断点的区间
+            keep = np.minimum(np.abs(y0), np.abs(y1)) < tolerance
+            x0, x1, y0, y1 = x0[keep], x1[keep], y0[keep], y1[keep]
+            roots = x0 - y0 * (x1 - x0) / (y1 - y0)
+        else:
+            if derivative is not None:
+                roots = FeatureEngine.newton_brackets(func, derivative, x0, x1, y0, y1)
+            else:
+                roots = FeatureEngine.refine_brackets(func, x0, x1, y0, y1)
+            # 收敛到极点（如正切函数）的区间残差很大，予以剔除
+            with np.errstate(invalid='ignore'):
+                residual = np.abs(np.asarray(func(roots), dtype=float))
+            roots = roots[np.isfinite(residual) & (residual < tolerance)]
+
+        # 去重（采样点恰为零时相邻两个区间会给出同一零点）
+        roots = np.sort(roots)
+        if len(roots) > 1:
+            span = max(abs(x[-1] - x[0]), 1.0)
+            roots = roots[np.concatenate(([True], np.diff(roots) > 1e-9 * span))]
+
+        if max_count is not None:
+            roots = roots[:max_count]
+        return roots
+
+    @staticmethod
+    def find_extrema(x: np.ndarray, y: np.ndarray, max_count: Optional[int] = MAX_EXTREMA,
+                     refine: bool = True,
+                     func: Optional[Callable[[np.ndarray], np.ndarray]] = None,
+                     derivative: Optional[Callable[[np.ndarray], np.ndarray]] = None,
+                     second_derivative: Optional[Callable[[np.ndarray], np.ndarray]] = None) -> np.ndarray:
+        """
+        寻找采样曲线的全部极值点
+
+        Args:
+            x: x坐标数组（可以是非均匀网格）
+            y: y坐标数组
+            max_count: 最多返回的极值点数量，None表示不限制
+            refine: 是否用三点抛物线拟合细化到亚采样精度
+            func, derivative: 向量化求值函数与导数（可选）。同时提供时求导数在三点区间内的零点，
+                              代替抛物线拟合
+            second_derivative: 二阶导数（可选），提供时用牛顿迭代求导数的零点，否则用割线法
+
+        Returns:
+            EXTREMA_DTYPE 结构化数组，字段为 (x, y, kind)
+        """
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        if len(y) < 3:
+            return np.empty(0, dtype=EXTREMA_DTYPE)
+
+        # 一阶差分的变号位置：跳过差分为0的平台（如对称网格上的峰值两侧），
+        # 但不允许跨越NaN（间断点或定义域之外）
+        dy = np.diff(y)
+        nan_count = np.cumsum(np.isnan(dy))
+        nz = np.flatnonzero(dy != 0)
+        nz = nz[~np.isnan(dy[nz])]
+        sign = np.sign(dy[nz])
+        k = np.flatnonzero(sign[:-1] * sign[1:] < 0)
+        left, right = nz[k], nz[k + 1]
+        k = k[nan_count[right] == nan_count[left]]
+        if max_count is not None:
+            k = k[:max_count]
+        left, right = nz[k], nz[k + 1]
+        idx = (left + 1 + right) // 2
+
+        result = np.empty(len(idx), dtype=EXTREMA_DTYPE)
+        result['kind'] = np.where(sign[k] > 0, EXTREMUM_MAX, EXTREMUM_MIN)
+
+        x0, x1, x2 = x[idx - 1], x[idx], x[idx + 1]
+        y0, y1, y2 = y[idx - 1], y[idx], y[idx + 1]
+        if not refine:
+            result['x'] = x1
+            result['y'] = y1
+            return result
+
+        # 过三点的抛物线顶点
+        d1 = x1 - x0
+        d2 = x1 - x2
+        num = d1**2 * (y1 - y2) - d2**2 * (y1 - y0)
+        den = d1 * (y1 - y2) - d2 * (y1 - y0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            xv = x1 - 0.5 * num / den
+        xv = np.where(np.isfinite(xv), np.clip(xv, x0, x2), x1)
+
+        # 拉格朗日插值求顶点处的函数值
+        yv = (y0 * (xv - x1) * (xv - x2) / ((x0 - x1) * (x0 - x2))
+              + y1 * (xv - x0) * (xv - x2) / ((x1 - x0) * (x1 - x2))
+              + y2 * (xv - x0) * (xv - x1) / ((x2 - x0) * (x2 - x1)))
+
+        if func is not None and derivative is not None:
+            # 导数在 [x0, x2] 两端变号时求其零点；不变号（平台、间断点）时保留抛物线结果
+            with np.errstate(invalid='ignore'):
+                g0 = np.asarray(derivative(x0), dtype=float)
+                g2 = np.asarray(derivative(x2), dtype=float)
+                bracketed = np.isfinite(g0) & np.isfinite(g2) & (g0 * g2 < 0)
+            if np.any(bracketed):
+                args = (x0[bracketed], x2[bracketed], g0[bracketed], g2[bracketed])
+                if second_derivative is not None:
+                    xr = FeatureEngine.newton_brackets(derivative, second_derivative, *args)
+                else:
+                    xr = FeatureEngine.refine_brackets(derivative, *args)
+                with np.errstate(invalid='ignore'):
+                    yr = np.asarray(func(xr), dtype=float)
+                ok = np.isfinite(yr)
+                sel = np.flatnonzero(bracketed)[ok]
+                xv[sel] = xr[ok]
+                yv[sel] = yr[ok]
+
+        result['x'] = xv
+        result['y'] = yv
+        return result
+
+    @staticmethod
+    def extremum_label(kind: int) -> str:
+        """
+        获取极值类型的显示文本
+
+        Args:
+            kind: 极值类型（EXTREMUM_MAX 或 EXTREMUM_MIN）
+
+        Returns:
+            "最大值" 或 "最小值"
+        """
+        return "最大值" if kind == EXTREMUM_MAX else "最小值"
+
+    @staticmethod
+    def find_intersections(x: np.ndarray, values: np.ndarray,
+                           funcs: Optional[Sequence[Callable[[np.ndarray], np.ndarray]]] = None,
+                           tolerance: float = ROOT_TOLERANCE,
+                           max_per_pair: Optional[int] = MAX_INTERSECTIONS) -> np.ndarray:
+        """
+        批量求解多条曲线两两之间的全部交点
+
+        Args:
+            x: x坐标数组，长度为P
+            values: (N, P) 函数值矩阵，每行一条曲线
+            funcs: 与各行对应的向量化求值函数列表（可选）。提供时统一做割线细化，
+                   并按残差剔除间断点处的伪交点
+            tolerance: 细化后允许的最大残差
+            max_per_pair: 每对曲线最多返回的交点数量，None表示不限制
+
+        Returns:
+            INTERSECTION_DTYPE 结构化数组，按 (i, j, x) 排序
+        """
+        x = np.asarray(x, dtype=float)
+        values = np.asarray(values, dtype=float)
+        n, p = values.shape
+        if n < 2 or p < 2:
+            return np.empty(0, dtype=INTERSECTION_DTYPE)
+
+        pair_i, pair_j = np.triu_indices(n, 1)
+        pairs_per_chunk = max(1, INTERSECTION_CHUNK_SIZE // p)
+
+        rows_i, rows_j, cols, d0s, d1s = [], [], [], [], []
+        for start in range(0, len(pair_i), pairs_per_chunk):
+            ci = pair_i[start:start + pairs_per_chunk]
+            cj = pair_j[start:start + pairs_per_chunk]
+
+            # 广播得到本块所有曲线对的差值矩阵，并一次性找出变号区间
+            diff = values[ci] - values[cj]
+            d0 = diff[:, :-1]
+            d1 = diff[:, 1:]
+            mask = np.isfinite(d0) & np.isfinite(d1)
+            mask &= (d0 * d1 <= 0)
+            mask &= np.abs(d1 - d0) > 1e-10
+            pair_idx, col = np.nonzero(mask)
+
+            rows_i.append(ci[pair_idx])
+            rows_j.append(cj[pair_idx])
+            cols.append(col)
+            d0s.append(d0[pair_idx, col])
+            d1s.append(d1[pair_idx, col])
+
+        rows_i = np.concatenate(rows_i)
+        rows_j = np.concatenate(rows_j)
+        cols = np.concatenate(cols)
+        d0 = np.concatenate(d0s)
+        d1 = np.concatenate(d1s)
+        x0, x1 = x[cols], x[cols + 1]
+
+        if funcs is None:
+            xs = x0 - d0 * (x1 - x0) / (d1 - d0)
+            t = (xs - x0) / (x1 - x0)
+            ys = values[rows_i, cols] * (1 - t) + values[rows_i, cols + 1] * t
+        else:
+            def pair_diff(xq):
+                return (FeatureEngine._evaluate_rows(funcs, rows_i, xq)
+                        - FeatureEngine._evaluate_rows(funcs, rows_j, xq))
+
+            xs = FeatureEngine.refine_brackets(pair_diff, x0, x1, d0, d1)
+            with np.errstate(invalid='ignore'):
+                residual = np.abs(pair_diff(xs))
+            keep = np.isfinite(residual) & (residual < tolerance)
+            rows_i, rows_j, xs = rows_i[keep], rows_j[keep], xs[keep]
+            ys = FeatureEngine._evaluate_rows(funcs, rows_i, xs)
+
+        result = np.empty(len(xs), dtype=INTERSECTION_DTYPE)
+        result['i'] = rows_i
+        result['j'] = rows_j
+        result['x'] = xs
+        result['y'] = ys
+        result = result[np.lexsort((result['x'], result['j'], result['i']))]
+        if len(result) == 0:
+            return result
+
+        # 去重（采样点恰为交点时相邻两个区间会给出同一交点）
+        span = max(abs(x[-1] - x[0]), 1.0)
+        same_pair = (result['i'][1:] == result['i'][:-1]) & (result['j'][1:] == result['j'][:-1])
+        duplicate = same_pair & (np.diff(result['x']) <= 1e-9 * span)
+        result = result[np.concatenate(([True], ~duplicate))]
+
+        if max_per_pair is not None:
+            # 组内序号 = 全局序号 - 所在组的起始序号
+            new_pair = np.concatenate(([True], (result['i'][1:] != result['i'][:-1]) |
+                                               (result['j'][1:] != result['j'][:-1])))
+            group_start = np.maximum.accumulate(np.where(new_pair, np.arange(len(result)), 0))
+            result = result[np.arange(len(result)) - group_start < max_per_pair]
+
+        return result
+
+    @staticmethod
+    def _evaluate_rows(funcs: Sequence[Callable[[np.ndarray], np.ndarray]],
+                       rows: np.ndarray, xq: np.ndarray) -> np.ndarray:
+        """按行号分组求值：每个函数只调用一次，处理所有属于它的点"""
+        out = np.empty(len(xq), dtype=float)
+        for row in np.unique(rows):
+            mask = rows == row
+            out[mask] = funcs[row](xq[mask])
+        return out
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""
+字体缓存模块 - 将中文字体的发现结果保存到磁盘，按平台和字体目录指纹判断是否失效
+"""
+
+import os
+import json
+import hashlib
+import platform
+import threading
+import matplotlib
+import matplotlib.font_manager as fm
+from typing import Dict, List, Optional
+from config.settings import FONT_CACHE_APP_DIR, FONT_CACHE_FILENAME, FONT_CACHE_VERSION
+
+
+class FontCache:
+    """字体发现结果的磁盘缓存类"""
+
+    @staticmethod
+    def get_cache_path() -> str:
+        """
+        获取缓存文件路径（位于用户缓存目录下）
+
+        Returns:
+            缓存文件的完整路径
+        """
+        system = platform.system()
+        if system == "Windows":
+            base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+        elif system == "Darwin":
+            base = os.path.expanduser('~/Library/Caches')
+        else:
+            base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+        return os.path.join(base, FONT_CACHE_APP_DIR, FONT_CACHE_FILENAME)
+
+    @staticmethod
+    def get_font_directories() -> List[str]:
+        """
+        获取当前平台的系统和用户字体目录
+
+        Returns:
+            存在的字体目录列表
+        """
+        system = platform.system()
+        if system == "Windows":
+            directories = [os.path.join(os.environ.get('WINDIR', 'C:\\Windows'), 'Fonts')]
+            directories += fm.MSUserFontDirectories
+        elif system == "Darwin":
+            directories = fm.OSXFontDirectories + fm.X11FontDirectories
+        else:
+            directories = fm.X11FontDirectories
+        return [directory for directory in directories if os.path.isdir(directory)]
+
+    @staticmethod
+    def compute_fingerprint() -> str:
+        """
+        计算字体目录指纹
+
+        安装或删除字体会改变所在目录的修改时间和文件数，只读取目录元数据，不打开字体文件。
+
+        Returns:
+            十六进制指纹字符串
+        """
+        digest = hashlib.sha1()
+        digest.update(f"{platform.system()}|{matplotlib.__version__}".encode('utf-8'))
+        for directory in FontCache.get_font_directories():
+            for root, dirs, files in os.walk(directory):
+                dirs.sort()
+                try:
+                    mtime = os.stat(root).st_mtime_ns
+                except OSError:
+                    continue
+                digest.update(f"{root}|{mtime}|{len(files)}\n".encode('utf-8', 'surrogateescape'))
+        return digest.hexdigest()
+
+    @staticmethod
+    def _read() -> Dict:
+        """读取整个缓存文件，不存在、损坏或版本不符时返回空字典"""
+        try:
+            with open(FontCache.get_cache_path(), 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get('version') != FONT_CACHE_VERSION:
+            return {}
+        return data
+
+    @staticmethod
+    def _write(data: Dict) -> bool:
+        """写入整个缓存文件"""
+        path = FontCache.get_cache_path()
+        data['version'] = FONT_CACHE_VERSION
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # 先写临时文件再替换，避免并发启动或后台线程写入时读到写了一半的缓存
+            temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            os.replace(temp_path, path)
+            return True
+        except OSError as e:
+            print(f"保存字体缓存失败: {e}")
+            return False
+
+    @staticmethod
+    def load() -> Optional[Dict]:
+        """
+        读取当前平台的缓存条目
+
+        Returns:
+            包含 fingerprint 和 chinese_fonts 的字典，缓存不存在或损坏时返回None
+        """
+        entry = FontCache._read().get('platforms', {}).get(platform.system())
+        if not entry or not isinstance(entry.get('chinese_fonts'), list):
+            return None
+        return entry
+
+    @staticmethod
+    def save(fingerprint: str, chinese_fonts: List[str]) -> bool:
+        """
+        写入当前平台的缓存条目（保留其他平台的条目）
+
+        Args:
+            fingerprint: 字体目录指纹
+            chinese_fonts: 发现的中文字体列表
+
+        Returns:
+            是否写入成功
+        """
+        data = FontCache._read()
+        data.setdefault('platforms', {})[platform.system()] = {
+            'fingerprint': fingerprint,
+            'chinese_fonts': list(chinese_fonts),
+        }
+        return FontCache._write(data)
+
+    @staticmethod
+    def load_coverage() -> Dict[str, list]:
+        """
+        读取当前平台按字体文件缓存的字形覆盖率
+
+        Returns:
+            {字体文件路径: [修改时间ns, 文件大小, 测试字符集签名, 覆盖率]}
+        """
+        coverage = FontCache._read().get('coverage', {}).get(platform.system(), {})
+        return coverage if isinstance(coverage, dict) else {}
+
+    @staticmethod
+    def save_coverage(coverage: Dict[str, list]) -> bool:
+        """
+        写入当前平台的字形覆盖率缓存
+
+        Args:
+            coverage: load_coverage() 格式的覆盖率字典
+
+        Returns:
+            是否写入成功
+        """
+        data = FontCache._read()
+        data.setdefault('coverage', {})[platform.system()] = coverage
+        return FontCache._write(data)
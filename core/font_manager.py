@@ -4,13 +4,16 @@
 """
 
 import platform
-import matplotlib.pyplot as plt
+import threading
+import matplotlib
 import matplotlib.font_manager as fm
 from typing import List
 from config.settings import (
     WINDOWS_CHINESE_FONTS, MACOS_CHINESE_FONTS, LINUX_CHINESE_FONTS,
-    CHINESE_FONT_KEYWORDS, FALLBACK_FONTS, MATPLOTLIB_CONFIG
+    CHINESE_FONT_KEYWORDS, FALLBACK_FONTS, MATPLOTLIB_CONFIG, FONT_CACHE_ENABLED
 )
+from core.font_cache import FontCache
+from core.font_verifier import FontVerifier
 
 
 class FontManager:
@@ -20,12 +23,16 @@ class FontManager:
         """初始化字体管理器"""
         self.chinese_font = None
         self.available_chinese_fonts = []
+        self.discovery_thread = None  # 字体目录变化时在后台重新发现字体的线程
+        self.verifier = FontVerifier(cache=FontCache.load_coverage() if FONT_CACHE_ENABLED else None)
         self.setup_chinese_font()
     
     def test_font_chinese_support(self, font_name: str) -> bool:
         """
         测试字体是否支持中文显示
         
+        直接读取字体文件的cmap表检查测试字符的字形覆盖率，不创建图形也不修改rcParams。
+        
         Args:
             font_name: 字体名称
             
@@ -33,27 +40,7 @@ class FontManager:
             是否支持中文
         """
         try:
-            # 创建一个小的测试图形
-            test_fig = plt.figure(figsize=(1, 1))
-            test_ax = test_fig.add_subplot(111)
-            
-            # 临时设置字体
-            original_font = plt.rcParams['font.sans-serif'][0] if plt.rcParams['font.sans-serif'] else 'DejaVu Sans'
-            plt.rcParams['font.sans-serif'] = [font_name]
-            
-            # 尝试渲染中文文本
-            test_text = test_ax.text(0.5, 0.5, "中文测试", fontsize=12)
-            
-            # 获取渲染后的字体信息
-            actual_font = test_text.get_fontname()
-            
-            # 恢复原字体设置
-            plt.rcParams['font.sans-serif'] = [original_font]
-            plt.close(test_fig)
-            
-            # 如果实际使用的字体与设置的字体相同或相近，则认为支持中文
-            return font_name.lower() in actual_font.lower() or actual_font.lower() in font_name.lower()
-            
+            return self.verifier.supports(font_name)
         except Exception as e:
             print(f"测试字体 {font_name} 时出错: {e}")
             return False
@@ -79,17 +66,20 @@ class FontManager:
         # 获取系统中所有可用字体
         available_fonts = set([f.name for f in fm.fontManager.ttflist])
         
-        # 筛选出系统中存在的已知中文字体
-        verified_fonts = []
-        for font in known_chinese_fonts:
-            if font in available_fonts:
-                verified_fonts.append(font)
+        # 筛选出系统中存在、且字形覆盖率达标的已知中文字体
+        candidates = [font for font in known_chinese_fonts if font in available_fonts]
+        verified_fonts = self.verifier.filter_fonts(candidates)
         
-        # 如果没有找到已知的中文字体，尝试通过关键词筛选
+        # 如果没有找到已知的中文字体，尝试通过关键词筛选（关键词会误中如 Source Code Pro 等西文字体，同样需要验证）
         if not verified_fonts:
-            for font in available_fonts:
-                if any(keyword in font for keyword in CHINESE_FONT_KEYWORDS):
-                    verified_fonts.append(font)
+            candidates = sorted(font for font in available_fonts
+                                if any(keyword in font for keyword in CHINESE_FONT_KEYWORDS))
+            verified_fonts = self.verifier.filter_fonts(candidates)
+        
+        # 保存按字体文件缓存的覆盖率
+        if FONT_CACHE_ENABLED and self.verifier.dirty:
+            self.verifier.dirty = False
+            FontCache.save_coverage(dict(self.verifier.cache))
         
         # 添加一些通用的Unicode字体作为备用
         for font in FALLBACK_FONTS:
@@ -98,15 +88,71 @@ class FontManager:
         
         return verified_fonts[:20]  # 限制返回数量
     
+    def load_chinese_fonts(self) -> List[str]:
+        """
+        获取中文字体列表，优先读取磁盘缓存
+        
+        有缓存时直接使用缓存结果，并在后台线程中校验字体目录指纹，
+        只有指纹变化时才重新发现字体；没有缓存时同步发现并写入缓存。
+        
+        Returns:
+            支持中文的字体列表
+        """
+        if not FONT_CACHE_ENABLED:
+            return self.get_verified_chinese_fonts()
+        
+        entry = FontCache.load()
+        if entry is None:
+            chinese_fonts = self.get_verified_chinese_fonts()
+            FontCache.save(FontCache.compute_fingerprint(), chinese_fonts)
+            return chinese_fonts
+        
+        self.discovery_thread = threading.Thread(
+            target=self.revalidate_font_cache,
+            args=(entry.get('fingerprint'),),
+            daemon=True
+        )
+        self.discovery_thread.start()
+        return entry['chinese_fonts']
+    
+    def revalidate_font_cache(self, cached_fingerprint: str) -> None:
+        """
+        后台校验字体缓存，字体目录变化时重新发现字体并更新缓存
+        
+        Args:
+            cached_fingerprint: 缓存中记录的字体目录指纹
+        """
+        try:
+            fingerprint = FontCache.compute_fingerprint()
+            if fingerprint == cached_fingerprint:
+                return
+            
+            # 把新安装的字体文件登记到matplotlib的字体列表中
+            known_files = set(f.fname for f in fm.fontManager.ttflist)
+            for path in fm.findSystemFonts():
+                if path not in known_files:
+                    try:
+                        fm.fontManager.addfont(path)
+                    except Exception:
+                        pass
+            
+            chinese_fonts = self.get_verified_chinese_fonts()
+            FontCache.save(fingerprint, chinese_fonts)
+            # 只替换可用字体列表，当前字体保持不变，避免在后台线程中修改rcParams
+            self.available_chinese_fonts = chinese_fonts
+            print(f"字体目录已变化，重新发现 {len(chinese_fonts)} 个中文字体")
+        except Exception as e:
+            print(f"后台更新字体缓存失败: {e}")
+    
     def setup_chinese_font(self) -> None:
         """设置中文字体"""
         try:
             # 配置matplotlib设置
             for key, value in MATPLOTLIB_CONFIG.items():
-                plt.rcParams[key] = value
+                matplotlib.rcParams[key] = value
             
-            # 获取经过验证的中文字体
-            chinese_fonts = self.get_verified_chinese_fonts()
+            # 获取经过验证的中文字体（优先使用磁盘缓存）
+            chinese_fonts = self.load_chinese_fonts()
             
             # 选择第一个可用的字体
             if chinese_fonts:
@@ -116,7 +162,7 @@ class FontManager:
                 selected_font = 'DejaVu Sans'  # 备用字体
             
             # 配置matplotlib的中文字体
-            plt.rcParams['font.sans-serif'] = [selected_font]
+            matplotlib.rcParams['font.sans-serif'] = [selected_font]
             
             # 保存字体信息和字体列表
             self.chinese_font = selected_font
@@ -126,9 +172,9 @@ class FontManager:
         except Exception as e:
             print(f"设置中文字体时出错: {e}")
             # 使用默认设置作为备用方案
-            plt.rcParams['font.sans-serif'] = ['DejaVu Sans']
+            matplotlib.rcParams['font.sans-serif'] = ['DejaVu Sans']
             for key, value in MATPLOTLIB_CONFIG.items():
-                plt.rcParams[key] = value
+                matplotlib.rcParams[key] = value
             self.chinese_font = 'DejaVu Sans'
             self.available_chinese_fonts = ['DejaVu Sans']
     
@@ -144,7 +190,7 @@ class FontManager:
         """
         try:
             if font_name in self.available_chinese_fonts:
-                plt.rcParams['font.sans-serif'] = [font_name]
+                matplotlib.rcParams['font.sans-serif'] = [font_name]
                 self.chinese_font = font_name
                 print(f"字体已更改为: {font_name}")
                 return True
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""
+字体验证模块 - 直接读取字体文件的cmap表，按字形覆盖率判断字体是否支持中文
+"""
+
+import os
+import hashlib
+import threading
+import matplotlib.font_manager as fm
+from concurrent.futures import ThreadPoolExecutor
+from matplotlib.ft2font import FT2Font
+from typing import Dict, Iterable, List, Optional
+from config.settings import FONT_COVERAGE_TEST_CHARS, FONT_COVERAGE_MIN_RATIO, FONT_VERIFY_WORKERS
+
+
+class FontVerifier:
+    """字形覆盖率验证器类
+
+    不创建图形、不修改 rcParams，可以在多个线程中同时使用；
+    结果按字体文件缓存，文件的修改时间或大小变化时重新读取。
+    """
+
+    def __init__(self, test_chars: str = FONT_COVERAGE_TEST_CHARS,
+                 min_ratio: float = FONT_COVERAGE_MIN_RATIO,
+                 cache: Optional[Dict[str, list]] = None):
+        """
+        初始化验证器
+
+        Args:
+            test_chars: 需要检查的字符
+            min_ratio: 判定为支持所需的最低覆盖率
+            cache: 已有的覆盖率缓存（FontCache.load_coverage() 的格式）
+        """
+        self.codepoints = frozenset(ord(ch) for ch in test_chars if not ch.isspace())
+        self.min_ratio = min_ratio
+        # 测试字符集变化后旧的覆盖率不再有效
+        self.signature = hashlib.sha1(
+            ''.join(chr(cp) for cp in sorted(self.codepoints)).encode('utf-8')
+        ).hexdigest()[:12]
+        self.cache = dict(cache or {})
+        self.dirty = False
+        self._lock = threading.Lock()
+
+    def get_coverage(self, path: str) -> float:
+        """
+        获取字体文件对测试字符的覆盖率
+
+        Args:
+            path: 字体文件路径
+
+        Returns:
+            0到1之间的覆盖率，文件无法读取时返回0
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return 0.0
+        file_key = [stat.st_mtime_ns, stat.st_size, self.signature]
+
+        with self._lock:
+            entry = self.cache.get(path)
+        if entry is not None and entry[:3] == file_key:
+            return entry[3]
+
+        try:
+            charmap = FT2Font(path).get_charmap()
+            covered = sum(1 for cp in self.codepoints if cp in charmap)
+            coverage = covered / len(self.codepoints) if self.codepoints else 1.0
+        except Exception:
+            coverage = 0.0
+
+        with self._lock:
+            self.cache[path] = file_key + [coverage]
+            self.dirty = True
+        return coverage
+
+    def verify_files(self, paths: Iterable[str], workers: int = FONT_VERIFY_WORKERS) -> Dict[str, float]:
+        """
+        并行获取多个字体文件的覆盖率
+
+        Args:
+            paths: 字体文件路径
+            workers: 线程数
+
+        Returns:
+            {字体文件路径: 覆盖率}
+        """
+        paths = list(dict.fromkeys(paths))
+        if len(paths) <= 1:
+            return {path: self.get_coverage(path) for path in paths}
+        with ThreadPoolExecutor(max_workers=min(workers, len(paths))) as executor:
+            return dict(zip(paths, executor.map(self.get_coverage, paths)))
+
+    def verify_fonts(self, font_names: Iterable[str], workers: int = FONT_VERIFY_WORKERS) -> Dict[str, bool]:
+        """
+        判断多个字体族是否支持测试字符
+
+        同一字体族有多个文件（如粗体、斜体）时，任一文件达到覆盖率要求即视为支持。
+
+        Args:
+            font_names: 字体族名称
+            workers: 线程数
+
+        Returns:
+            {字体族名称: 是否支持}
+        """
+        font_names = list(font_names)
+        wanted = set(font_names)
+        files = {}
+        for entry in fm.fontManager.ttflist:
+            if entry.name in wanted:
+                files.setdefault(entry.name, []).append(entry.fname)
+
+        coverage = self.verify_files([path for paths in files.values() for path in paths], workers)
+        return {
+            name: any(coverage[path] >= self.min_ratio for path in files.get(name, []))
+            for name in font_names
+        }
+
+    def supports(self, font_name: str) -> bool:
+        """判断单个字体族是否支持测试字符"""
+        return self.verify_fonts([font_name])[font_name]
+
+    def filter_fonts(self, font_names: List[str]) -> List[str]:
+        """保持原有顺序，筛选出支持测试字符的字体族"""
+        results = self.verify_fonts(font_names)
+        return [name for name in font_names if results[name]]
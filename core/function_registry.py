@@ -0,0 +1,589 @@
+# -*- coding: utf-8 -*-
+"""
+函数族注册表模块 - 每种函数类型由一个函数族对象描述，按名称查表分发
+
+函数族提供向量化求值、导数、解析特征、参数验证、默认显示范围和表达式格式化；
+新增函数类型只需定义一个 FunctionFamily 子类并调用 FunctionRegistry.register()。
+用户输入的表达式由 ExpressionFamily 表示，其函数类型为 "自定义函数: 表达式"。
+"""
+
+import numpy as np
+from typing import Callable, Dict, List, Optional, Tuple
+from config.settings import DEFAULT_X_RANGE, DEFAULT_Y_RANGE, CUSTOM_FUNCTION_TYPE, FUNCTION_PANEL_INFO
+from core.analytic_solver import AnalyticSolver
+from core.fused_evaluator import FusedEvaluator
+from core.feature_engine import EXTREMUM_MAX, EXTREMUM_MIN
+
+
+class FunctionFamily:
+    """函数族基类
+
+    所有函数族都使用 (a, b, c) 三个参数；求值与导数方法接受x数组并返回新数组，
+    求值时也可以传入 out 数组直接写入结果。参数也可以是数组，按NumPy规则与x广播。
+    """
+
+    name = ""                           # 函数类型名称（即函数信息中的 'type'）
+    formula = ""                        # 控制面板显示的通用公式
+    default_params = (1.0, 0.0, 0.0)    # 控制面板中参数 (a, b, c) 的默认值
+    extremum_label = None               # 极值点的标注文字，None 表示按极大值/极小值标注
+    has_analytic_features = True        # 是否可以直接求出零点、极值点等特征
+    has_derivatives = True              # 是否提供一阶、二阶导数
+    fused_expressions = ()              # 函数值的 numexpr 表达式（见 FusedEvaluator.evaluate），为空时只用NumPy
+
+    def evaluate(self, x: np.ndarray, a: float, b: float, c: float,
+                 out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        计算函数值
+
+        点数较多且可以使用 numexpr 时单遍融合求值，否则调用 evaluate_into。
+
+        Args:
+            x: x坐标数组
+            a, b, c: 函数参数
+            out: 写入结果的数组（可选，形状与x和参数广播后的形状相同，不能是x本身）
+
+        Returns:
+            y坐标数组（定义域外为NaN）
+        """
+        x = np.asarray(x, dtype=float)
+        if out is None:
+            out = np.empty(np.broadcast_shapes(x.shape, np.shape(a), np.shape(b), np.shape(c)))
+        if self.fused_expressions and FusedEvaluator.should_use(out.size):
+            return FusedEvaluator.evaluate(self.fused_expressions, x, a, b, c, out)
+        self.evaluate_into(x, a, b, c, out)
+        return out
+
+    def evaluate_batch(self, x: np.ndarray, params: np.ndarray,
+                       out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        一次广播计算同一函数族的多条曲线
+
+        Args:
+            x: x坐标数组，形状为 (P,)
+            params: (N, 3) 参数矩阵，每行为一条曲线的 (a, b, c)
+            out: 写入结果的 (N, P) 数组（可选）
+
+        Returns:
+            (N, P) 函数值矩阵
+        """
+        params = np.asarray(params, dtype=float).reshape(-1, 3)
+        x = np.asarray(x, dtype=float).reshape(1, -1)
+        if out is None:
+            out = np.empty((len(params), x.shape[1]))
+        return self.evaluate(x, params[:, 0:1], params[:, 1:2], params[:, 2:3], out)
+
+    def evaluate_into(self, x: np.ndarray, a: float, b: float, c: float, out: np.ndarray) -> None:
+        """
+        用NumPy计算函数值并写入 out（尽量原地运算，避免中间数组）
+
+        Args:
+            x: x坐标数组
+            a, b, c: 函数参数
+            out: 输出数组
+        """
+        raise NotImplementedError
+
+    def derivative(self, x: np.ndarray, a: float, b: float, c: float) -> np.ndarray:
+        """
+        计算导数值
+
+        Args:
+            x: x坐标数组
+            a, b, c: 函数参数
+
+        Returns:
+            导数数组（定义域外为NaN）
+        """
+        raise NotImplementedError
+
+    def second_derivative(self, x: np.ndarray, a: float, b: float, c: float) -> np.ndarray:
+        """
+        计算二阶导数
+
+        Args:
+            x: x坐标数组
+            a, b, c: 函数参数
+
+        Returns:
+            二阶导数数组（定义域外为NaN）
+        """
+        raise NotImplementedError
+
+    def bind(self, params: Tuple[float, float, float], order: int = 0) -> Callable[[np.ndarray], np.ndarray]:
+        """
+        绑定参数，生成只接受x数组的向量化函数
+
+        Args:
+            params: 函数参数 (a, b, c)
+            order: 0 为函数值，1、2 为一阶、二阶导数
+
+        Returns:
+            向量化函数
+        """
+        method = (self.evaluate, self.derivative, self.second_derivative)[order]
+        a, b, c = params
+        return lambda xq: method(np.asarray(xq, dtype=float), a, b, c)
+
+    def solve_features(self, features: Dict[str, np.ndarray], a: float, b: float, c: float,
+                       x_min: float, x_max: float, max_count: Optional[int]) -> None:
+        """
+        求解x范围内的解析特征，结果写入 features（格式见 AnalyticSolver.empty_features）
+
+        Args:
+            features: 待填写的特征字典
+            a, b, c: 函数参数
+            x_min, x_max: x范围
+            max_count: 每类特征最多枚举的数量，None表示不限制
+        """
+
+    def describe(self, a: float, b: float, c: float) -> List[str]:
+        """生成在界面中显示的特征信息列表"""
+        return []
+
+    def validate(self, a: float, b: float, c: float) -> Tuple[bool, str]:
+        """验证参数，返回 (是否有效, 错误消息)"""
+        return True, ""
+
+    def default_range(self, a: float, b: float, c: float) -> Tuple[Tuple[float, float], Tuple[float, float]]:
+        """获取适合显示该函数的 ((x_min, x_max), (y_min, y_max))"""
+        return DEFAULT_X_RANGE, DEFAULT_Y_RANGE
+
+    def format_expression(self, a: float, b: float, c: float) -> str:
+        """生成图例中的函数表达式"""
+        return ""
+
+
+class FunctionRegistry:
+    """函数族注册表类（按名称查表）"""
+
+    families: Dict[str, FunctionFamily] = {}
+
+    @staticmethod
+    def register(family: FunctionFamily) -> FunctionFamily:
+        """
+        注册函数族，同名的函数族会被替换
+
+        Args:
+            family: 函数族实例
+
+        Returns:
+            注册的函数族
+        """
+        FunctionRegistry.families[family.name] = family
+        return family
+
+    @staticmethod
+    def get(name: str) -> Optional[FunctionFamily]:
+        """根据名称获取函数族，"自定义函数: 表达式" 返回对应的表达式函数族，未注册时返回None"""
+        family = FunctionRegistry.families.get(name)
+        if family is None and ExpressionFamily.is_expression_type(name):
+            family = ExpressionFamily(ExpressionFamily.parse_type(name))
+        return family
+
+    @staticmethod
+    def names() -> List[str]:
+        """按注册顺序获取全部函数类型名称"""
+        return list(FunctionRegistry.families)
+
+
+class QuadraticFamily(FunctionFamily):
+    """二次函数 y = a·x² + b·x + c"""
+
+    name = "二次函数"
+    formula, default_params = FUNCTION_PANEL_INFO[name]
+    extremum_label = "顶点"
+
+    fused_expressions = ("(a * x + b) * x + c",)
+
+    def evaluate_into(self, x, a, b, c, out):
+        # 秦九韶算法：(a·x + b)·x + c
+        np.multiply(x, a, out=out)
+        out += b
+        out *= x
+        out += c
+
+    def derivative(self, x, a, b, c):
+        return 2 * a * x + b
+
+    def second_derivative(self, x, a, b, c):
+        return np.full(np.shape(x), 2.0 * a)
+
+    def solve_features(self, features, a, b, c, x_min, x_max, max_count):
+        # a=0 时退化为一次函数
+        if a == 0:
+            if b != 0:
+                features['roots'] = AnalyticSolver.in_range([-c / b], x_min, x_max)
+            return
+
+        vertex_x = -b / (2 * a)
+        vertex_y = a * vertex_x**2 + b * vertex_x + c
+        vertex = AnalyticSolver.in_range([vertex_x], x_min, x_max)
+        features['extrema'] = AnalyticSolver.make_extrema(
+            vertex, np.full(len(vertex), vertex_y), EXTREMUM_MIN if a > 0 else EXTREMUM_MAX)
+
+        discriminant = b**2 - 4 * a * c
+        if discriminant > 0:
+            sqrt_d = np.sqrt(discriminant)
+            roots = [(-b - sqrt_d) / (2 * a), (-b + sqrt_d) / (2 * a)]
+        elif discriminant == 0:
+            roots = [vertex_x]
+        else:
+            roots = []
+        features['roots'] = AnalyticSolver.in_range(roots, x_min, x_max)
+
+    def describe(self, a, b, c):
+        key_points = []
+
+        # 顶点
+        vertex_x = -b / (2 * a)
+        vertex_y = a * vertex_x**2 + b * vertex_x + c
+        key_points.append(f"顶点: ({vertex_x:.2f}, {vertex_y:.2f})")
+
+        # 判别式和零点
+        discriminant = b**2 - 4 * a * c
+        if discriminant > 0:
+            root1 = (-b + np.sqrt(discriminant)) / (2 * a)
+            root2 = (-b - np.sqrt(discriminant)) / (2 * a)
+            key_points.append(f"零点: x₁={root1:.2f}, x₂={root2:.2f}")
+        elif discriminant == 0:
+            root = -b / (2 * a)
+            key_points.append(f"零点: x={root:.2f} (二重根)")
+        else:
+            key_points.append("无实数零点")
+
+        # y轴交点
+        key_points.append(f"y轴交点: (0, {c:.2f})")
+        return key_points
+
+    def validate(self, a, b, c):
+        if a == 0:
+            return False, "二次函数的参数a不能为0"
+        return True, ""
+
+    def default_range(self, a, b, c):
+        vertex_x = -b / (2 * a)
+        vertex_y = a * vertex_x**2 + b * vertex_x + c
+        return (vertex_x - 5, vertex_x + 5), (vertex_y - 10, vertex_y + 10)
+
+    def format_expression(self, a, b, c):
+        return f"$y = {a:.2f}x^2 + {b:.2f}x + {c:.2f}$"
+
+
+class SinusoidFamily(FunctionFamily):
+    """正弦型函数基类 y = a·f(b·x + c)，f 为 sin 或 cos"""
+
+    root_phase = 0.0            # 零点处的相位 u = root_phase + kπ
+    extremum_phase = np.pi / 2  # 极值点处的相位 u = extremum_phase + kπ
+
+    def solve_features(self, features, a, b, c, x_min, x_max, max_count):
+        if a == 0 or b == 0:
+            return
+        features['roots'], _ = AnalyticSolver.periodic_solutions(
+            b, c, x_min, x_max, self.root_phase, np.pi, max_count)
+
+        ext_x, k = AnalyticSolver.periodic_solutions(b, c, x_min, x_max, self.extremum_phase, np.pi, max_count)
+        # sin 和 cos 在极值处的值均为 (-1)^k
+        values = a * np.where(k % 2 == 0, 1.0, -1.0)
+        features['extrema'] = AnalyticSolver.make_extrema(ext_x, values)
+
+        features['period_boundaries'], _ = AnalyticSolver.periodic_solutions(
+            b, c, x_min, x_max, 0.0, 2 * np.pi, max_count)
+
+    def describe(self, a, b, c):
+        period = 2 * np.pi / abs(b) if b != 0 else float('inf')
+        return [f"振幅: {abs(a):.2f}", f"周期: {period:.2f}", f"相位: {c:.2f}"]
+
+    def validate(self, a, b, c):
+        if b == 0:
+            return False, f"{self.name}的参数b不能为0"
+        return True, ""
+
+    def default_range(self, a, b, c):
+        period = 2 * np.pi / abs(b) if b != 0 else 2 * np.pi
+        amplitude = abs(a)
+        return (-2 * period, 2 * period), (-amplitude * 1.5, amplitude * 1.5)
+
+
+class SineFamily(SinusoidFamily):
+    """正弦函数 y = a·sin(b·x + c)"""
+
+    name = "正弦函数"
+    formula, default_params = FUNCTION_PANEL_INFO[name]
+
+    fused_expressions = ("a * sin(b * x + c)",)
+
+    def evaluate_into(self, x, a, b, c, out):
+        np.multiply(x, b, out=out)
+        out += c
+        np.sin(out, out=out)
+        out *= a
+
+    def derivative(self, x, a, b, c):
+        return a * b * np.cos(b * x + c)
+
+    def second_derivative(self, x, a, b, c):
+        return -a * b**2 * np.sin(b * x + c)
+
+    def format_expression(self, a, b, c):
+        return f"y = {a:.2f}·sin({b:.2f}x + {c:.2f})"
+
+
+class CosineFamily(SinusoidFamily):
+    """余弦函数 y = a·cos(b·x + c)"""
+
+    name = "余弦函数"
+    formula, default_params = FUNCTION_PANEL_INFO[name]
+    root_phase = np.pi / 2
+    extremum_phase = 0.0
+
+    fused_expressions = ("a * cos(b * x + c)",)
+
+    def evaluate_into(self, x, a, b, c, out):
+        np.multiply(x, b, out=out)
+        out += c
+        np.cos(out, out=out)
+        out *= a
+
+    def derivative(self, x, a, b, c):
+        return -a * b * np.sin(b * x + c)
+
+    def second_derivative(self, x, a, b, c):
+        return -a * b**2 * np.cos(b * x + c)
+
+    def format_expression(self, a, b, c):
+        return f"y = {a:.2f}·cos({b:.2f}x + {c:.2f})"
+
+
+class TangentFamily(FunctionFamily):
+    """正切函数 y = a·tan(b·x + c)"""
+
+    name = "正切函数"
+    formula, default_params = FUNCTION_PANEL_INFO[name]
+
+    fused_expressions = ("a * tan(b * x + c)", "where(abs(y) > 50, nan, y)")
+
+    def evaluate_into(self, x, a, b, c, out):
+        np.multiply(x, b, out=out)
+        out += c
+        np.tan(out, out=out)
+        out *= a
+        out[(out > 50) | (out < -50)] = np.nan  # 限制极值（不产生 abs 的中间数组）
+
+    def derivative(self, x, a, b, c):
+        return a * b / np.cos(b * x + c)**2
+
+    def second_derivative(self, x, a, b, c):
+        u = b * x + c
+        return 2 * a * b**2 * np.tan(u) / np.cos(u)**2
+
+    def solve_features(self, features, a, b, c, x_min, x_max, max_count):
+        if a == 0 or b == 0:
+            return
+        features['roots'], _ = AnalyticSolver.periodic_solutions(b, c, x_min, x_max, 0.0, np.pi, max_count)
+        poles, _ = AnalyticSolver.periodic_solutions(b, c, x_min, x_max, np.pi / 2, np.pi, max_count)
+        features['vertical_asymptotes'] = poles
+        features['period_boundaries'] = poles
+
+    def validate(self, a, b, c):
+        if b == 0:
+            return False, f"{self.name}的参数b不能为0"
+        return True, ""
+
+    def default_range(self, a, b, c):
+        period = np.pi / abs(b) if b != 0 else np.pi
+        return (-2 * period, 2 * period), (-10, 10)
+
+    def format_expression(self, a, b, c):
+        return f"y = {a:.2f}·tan({b:.2f}x + {c:.2f})"
+
+
+class ExponentialFamily(FunctionFamily):
+    """指数函数 y = a·e^(b·x) + c"""
+
+    name = "指数函数"
+    formula, default_params = FUNCTION_PANEL_INFO[name]
+
+    fused_expressions = ("a * exp(b * x) + c",)
+
+    def evaluate_into(self, x, a, b, c, out):
+        np.multiply(x, b, out=out)
+        np.exp(out, out=out)
+        out *= a
+        out += c
+
+    def derivative(self, x, a, b, c):
+        return a * b * np.exp(b * x)
+
+    def second_derivative(self, x, a, b, c):
+        return a * b**2 * np.exp(b * x)
+
+    def solve_features(self, features, a, b, c, x_min, x_max, max_count):
+        if b == 0:
+            return
+        features['horizontal_asymptotes'] = np.array([c], dtype=float)
+        # a·e^(bx) + c = 0  =>  x = ln(-c/a) / b
+        if a != 0 and -c / a > 0:
+            features['roots'] = AnalyticSolver.in_range([np.log(-c / a) / b], x_min, x_max)
+
+    def describe(self, a, b, c):
+        key_points = []
+        if b < 0:
+            key_points.append(f"水平渐近线: y={c:.2f}")
+        y_intercept = a * np.exp(0) + c
+        key_points.append(f"y轴交点: (0, {y_intercept:.2f})")
+        return key_points
+
+    def validate(self, a, b, c):
+        if a == 0:
+            return False, "指数函数的参数a不能为0"
+        return True, ""
+
+    def default_range(self, a, b, c):
+        if b > 0:
+            return (-5, 5), (c - 2, c + 20)
+        return (-5, 5), (c - 20, c + 2)
+
+    def format_expression(self, a, b, c):
+        return f"y = {a:.2f}·e^({b:.2f}x) + {c:.2f}"
+
+
+class LogarithmFamily(FunctionFamily):
+    """对数函数 y = a·log(b·x + c)"""
+
+    name = "对数函数"
+    formula, default_params = FUNCTION_PANEL_INFO[name]
+
+    fused_expressions = ("where(b * x + c > 0, a * log(b * x + c), nan)",)
+
+    def evaluate_into(self, x, a, b, c, out):
+        np.multiply(x, b, out=out)
+        out += c
+        out[out <= 0] = np.nan  # 处理定义域
+        np.log(out, out=out)
+        out *= a
+
+    def derivative(self, x, a, b, c):
+        arg = b * x + c
+        arg = np.where(arg > 0, arg, np.nan)
+        return a * b / arg
+
+    def second_derivative(self, x, a, b, c):
+        arg = b * x + c
+        arg = np.where(arg > 0, arg, np.nan)
+        return -a * b**2 / arg**2
+
+    def solve_features(self, features, a, b, c, x_min, x_max, max_count):
+        if b == 0:
+            return
+        features['vertical_asymptotes'] = AnalyticSolver.in_range([-c / b], x_min, x_max)
+        # a·ln(bx + c) = 0  =>  bx + c = 1
+        if a != 0:
+            features['roots'] = AnalyticSolver.in_range([(1 - c) / b], x_min, x_max)
+
+    def describe(self, a, b, c):
+        if b == 0:
+            return ["无零点"]
+        return [f"零点: ({(1 - c) / b:.2f}, 0)", f"垂直渐近线: x={-c / b:.2f}"]
+
+    def validate(self, a, b, c):
+        if a == 0:
+            return False, "对数函数的参数a不能为0"
+        if b == 0:
+            return False, "对数函数的参数b不能为0"
+        return True, ""
+
+    def default_range(self, a, b, c):
+        return (0.1, 10), (-5, 5)
+
+    def format_expression(self, a, b, c):
+        return f"y = {a:.2f}·log({b:.2f}x + {c:.2f})"
+
+
+class ExpressionFamily(FunctionFamily):
+    """用户输入的表达式 y = f(x)，可以使用参数 a、b、c
+
+    表达式在第一次使用时由 ExpressionCompiler 编译（之后从缓存读取），
+    没有解析特征，零点和极值点由采样点结合符号导数细化得到。
+    """
+
+    formula, default_params = FUNCTION_PANEL_INFO[CUSTOM_FUNCTION_TYPE]
+    has_analytic_features = False
+
+    def __init__(self, expression: str = ""):
+        """
+        Args:
+            expression: 表达式文本，为空时表示界面中的"自定义函数"选项
+        """
+        self.expression = ' '.join(expression.split())
+        self.name = ExpressionFamily.make_type(self.expression) if self.expression else CUSTOM_FUNCTION_TYPE
+        self._compiled = None
+
+    @staticmethod
+    def make_type(expression: str) -> str:
+        """生成表达式对应的函数类型名称"""
+        return f"{CUSTOM_FUNCTION_TYPE}: {' '.join(expression.split())}"
+
+    @staticmethod
+    def is_expression_type(name: str) -> bool:
+        """判断函数类型名称是否表示自定义表达式"""
+        return name.startswith(CUSTOM_FUNCTION_TYPE + ":")
+
+    @staticmethod
+    def parse_type(name: str) -> str:
+        """从函数类型名称中取出表达式文本"""
+        return name[len(CUSTOM_FUNCTION_TYPE) + 1:].strip()
+
+    @property
+    def compiled(self):
+        """编译后的表达式（表达式无效时抛出 ValueError）"""
+        if self._compiled is None:
+            from core.expression_compiler import ExpressionCompiler
+            self._compiled = ExpressionCompiler.compile(self.expression)
+        return self._compiled
+
+    def evaluate(self, x, a, b, c, out=None):
+        # lambdify 生成的函数总是返回新数组，只在需要时复制到 out
+        y = self.compiled.evaluate(x, a, b, c)
+        if out is None:
+            return y
+        out[...] = y
+        return out
+
+    def derivative(self, x, a, b, c):
+        return self.compiled.derivative(x, a, b, c)
+
+    def second_derivative(self, x, a, b, c):
+        return self.compiled.second_derivative(x, a, b, c)
+
+    @property
+    def has_derivatives(self) -> bool:
+        """表达式是否有可用的符号导数"""
+        return self.compiled.has_derivatives
+
+    def describe(self, a, b, c):
+        compiled = self.compiled
+        key_points = [f"表达式: y = {compiled.text}"]
+        if compiled.derivative_text:
+            key_points.append(f"导数: y' = {compiled.derivative_text}")
+        return key_points
+
+    def validate(self, a, b, c):
+        try:
+            self.compiled
+        except ValueError as e:
+            return False, str(e)
+        return True, ""
+
+    def format_expression(self, a, b, c):
+        compiled = self.compiled
+        values = dict(zip(('a', 'b', 'c'), (a, b, c)))
+        if not compiled.parameters:
+            return f"y = {compiled.text}"
+        assigned = ", ".join(f"{name}={values[name]:.2f}" for name in compiled.parameters)
+        return f"y = {compiled.text} ({assigned})"
+
+
+# 内置函数族（注册顺序即界面中的显示顺序）
+for _family in (QuadraticFamily(), SineFamily(), CosineFamily(),
+                TangentFamily(), ExponentialFamily(), LogarithmFamily(), ExpressionFamily()):
+    FunctionRegistry.register(_family)
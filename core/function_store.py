@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+"""
+函数存储模块 - 按列存放已添加的函数，代替逐个函数的字典列表
+
+每一列都是按槽位编号的数组：类型编号、(N, 3) 参数矩阵、颜色和稳定ID。
+追加写入末尾的空槽位（容量不足时加倍），删除只在类型编号列写入墓碑，
+两者均为 O(1)；墓碑过多时再整体压缩。同类型函数的参数可以一次取出，按函数族批量求值。
+records() 返回的快照同时带有按类型分组的参数矩阵，计算器直接用它批量求值。
+"""
+
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+from config.settings import FUNCTION_STORE_CAPACITY
+
+# 已删除槽位的类型编号
+_TOMBSTONE = -1
+
+
+class FunctionRecords(list):
+    """
+    函数信息快照：按添加顺序排列的函数信息字典列表
+
+    groups 为创建快照时的 FunctionStore.groups()，与列表内容一致，不随存储的后续修改变化。
+    """
+
+    def __init__(self, records: List[Dict], groups: List[Tuple[str, np.ndarray, np.ndarray]]):
+        super().__init__(records)
+        self.groups = groups
+
+
+class FunctionStore:
+    """列式函数存储类"""
+
+    def __init__(self, capacity: int = FUNCTION_STORE_CAPACITY):
+        """
+        初始化存储
+
+        Args:
+            capacity: 初始容量（槽位数）
+        """
+        capacity = max(int(capacity), 1)
+        self.type_codes = np.full(capacity, _TOMBSTONE, dtype=np.int32)  # 类型编号，墓碑为-1
+        self.params = np.zeros((capacity, 3), dtype=np.float64)          # 参数 (a, b, c)
+        self.colors = np.empty(capacity, dtype=object)                   # 线条颜色
+        self.ids = np.zeros(capacity, dtype=np.int64)                    # 稳定ID
+        self.type_names = []       # 类型编号 -> 函数类型名称
+        self._type_index = {}      # 函数类型名称 -> 类型编号
+        self._slots = {}           # 函数ID -> 槽位
+        self._size = 0             # 已使用的槽位数（包括墓碑）
+        self._next_id = 1          # 下一个函数ID，用于绘图区域增量更新对应的图形对象
+        self._records = None       # records() 的缓存，内容变化时失效
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def _type_code(self, func_type: str) -> int:
+        """获取函数类型的编号，新类型追加到类型表"""
+        code = self._type_index.get(func_type)
+        if code is None:
+            code = len(self.type_names)
+            self.type_names.append(func_type)
+            self._type_index[func_type] = code
+        return code
+
+    def _grow(self) -> None:
+        """容量加倍"""
+        capacity = 2 * len(self.type_codes)
+        type_codes = np.full(capacity, _TOMBSTONE, dtype=np.int32)
+        params = np.zeros((capacity, 3), dtype=np.float64)
+        colors = np.empty(capacity, dtype=object)
+        ids = np.zeros(capacity, dtype=np.int64)
+        type_codes[:self._size] = self.type_codes[:self._size]
+        params[:self._size] = self.params[:self._size]
+        colors[:self._size] = self.colors[:self._size]
+        ids[:self._size] = self.ids[:self._size]
+        self.type_codes, self.params, self.colors, self.ids = type_codes, params, colors, ids
+
+    def _compact(self) -> None:
+        """移除墓碑，保持函数的先后顺序"""
+        live = self.live_slots()
+        count = len(live)
+        self.type_codes[:count] = self.type_codes[live]
+        self.params[:count] = self.params[live]
+        self.colors[:count] = self.colors[live]
+        self.ids[:count] = self.ids[live]
+        self.type_codes[count:self._size] = _TOMBSTONE
+        self.colors[count:self._size] = None
+        self._size = count
+        self._slots = {int(func_id): slot for slot, func_id in enumerate(self.ids[:count])}
+
+    def append(self, func_type: str, params: Tuple[float, float, float], color: str) -> int:
+        """
+        追加函数
+
+        Args:
+            func_type: 函数类型
+            params: 函数参数 (a, b, c)
+            color: 线条颜色
+
+        Returns:
+            新函数的ID
+        """
+        if self._size == len(self.type_codes):
+            if len(self._slots) <= self._size // 2:
+                self._compact()
+            else:
+                self._grow()
+        slot = self._size
+        func_id = self._next_id
+        self._next_id += 1
+        self.type_codes[slot] = self._type_code(func_type)
+        self.params[slot] = params
+        self.colors[slot] = color
+        self.ids[slot] = func_id
+        self._slots[func_id] = slot
+        self._size += 1
+        self._records = None
+        return func_id
+
+    def remove(self, func_id: int) -> bool:
+        """
+        根据ID删除函数（写入墓碑）
+
+        Args:
+            func_id: 函数ID
+
+        Returns:
+            是否删除成功
+        """
+        slot = self._slots.pop(func_id, None)
+        if slot is None:
+            return False
+        self.type_codes[slot] = _TOMBSTONE
+        self.colors[slot] = None
+        self._records = None
+        return True
+
+    def update_params(self, func_id: int, params: Tuple[float, float, float]) -> bool:
+        """
+        更新函数参数（ID和位置不变）
+
+        Args:
+            func_id: 函数ID
+            params: 新的函数参数 (a, b, c)
+
+        Returns:
+            是否更新成功
+        """
+        slot = self._slots.get(func_id)
+        if slot is None:
+            return False
+        self.params[slot] = params
+        self._records = None
+        return True
+
+    def clear(self) -> None:
+        """删除全部函数（ID继续递增，不会与之前的函数重复）"""
+        self.type_codes[:self._size] = _TOMBSTONE
+        self.colors[:self._size] = None
+        self._size = 0
+        self._slots = {}
+        self._records = None
+
+    def live_slots(self) -> np.ndarray:
+        """按添加顺序返回未删除的槽位"""
+        return np.flatnonzero(self.type_codes[:self._size] != _TOMBSTONE)
+
+    def make_record(self, slot: int) -> Dict:
+        """将一个槽位转换为函数信息字典（id、type、params、color）"""
+        return {
+            'id': int(self.ids[slot]),
+            'type': self.type_names[self.type_codes[slot]],
+            'params': tuple(float(v) for v in self.params[slot]),
+            'color': self.colors[slot],
+        }
+
+    def get(self, func_id: int) -> Optional[Dict]:
+        """根据ID获取函数信息，不存在时返回None"""
+        slot = self._slots.get(func_id)
+        if slot is None:
+            return None
+        return self.make_record(slot)
+
+    def records(self) -> FunctionRecords:
+        """
+        按添加顺序返回全部函数信息字典（附带 groups() 的结果）
+
+        内容不变时返回同一个快照；调用方不应修改其中的字典，应使用 update_params()。
+        """
+        if self._records is None:
+            records = [self.make_record(slot) for slot in self.live_slots()]
+            self._records = FunctionRecords(records, self.groups())
+        return self._records
+
+    def groups(self) -> List[Tuple[str, np.ndarray, np.ndarray]]:
+        """
+        按函数类型分组
+
+        Returns:
+            [(函数类型, 位置下标, (k, 3) 参数矩阵)]，位置下标为函数在 records() 中的位置
+        """
+        live = self.live_slots()
+        codes = self.type_codes[live]
+        groups = []
+        for code in np.unique(codes):
+            positions = np.flatnonzero(codes == code)
+            groups.append((self.type_names[code], positions, self.params[live[positions]]))
+        return groups
+
+    @staticmethod
+    def group_records(functions: List[Dict]) -> List[Tuple[str, np.ndarray, np.ndarray]]:
+        """
+        按函数类型分组任意的函数信息列表，返回格式与 groups() 相同
+
+        functions 是 records() 的快照时直接返回其中的分组，不再逐个读取字典。
+        """
+        if isinstance(functions, FunctionRecords):
+            return functions.groups
+        rows = {}
+        for row, func in enumerate(functions):
+            rows.setdefault(func['type'], []).append(row)
+        return [(func_type, np.array(positions),
+                 np.array([functions[row]['params'] for row in positions], dtype=float).reshape(-1, 3))
+                for func_type, positions in rows.items()]
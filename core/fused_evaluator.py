@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""
+融合求值模块 - 可选地使用 numexpr 单遍计算整个表达式
+
+numexpr 按块遍历输入数组，在块内一次算完整个表达式并直接写入输出数组，
+不产生 NumPy 逐步运算时的中间数组，并可使用多线程。
+未安装 numexpr 或在设置中关闭时，函数族自行用NumPy原地运算求值。
+"""
+
+import numpy as np
+from typing import Optional, Sequence
+from config.settings import FUSED_EVALUATION, FUSED_MIN_POINTS, FUSED_THREADS
+
+
+class FusedEvaluator:
+    """融合求值器类（numexpr 只在第一次使用时导入）"""
+
+    _numexpr = None
+    _checked = False
+
+    @staticmethod
+    def backend():
+        """
+        获取 numexpr 模块
+
+        Returns:
+            numexpr 模块，未安装或已在设置中关闭时返回None
+        """
+        if not FusedEvaluator._checked:
+            FusedEvaluator._checked = True
+            if FUSED_EVALUATION:
+                try:
+                    import numexpr
+                except ImportError:
+                    numexpr = None
+                if numexpr is not None and FUSED_THREADS:
+                    numexpr.set_num_threads(FUSED_THREADS)
+                FusedEvaluator._numexpr = numexpr
+        return FusedEvaluator._numexpr
+
+    @staticmethod
+    def should_use(size: int) -> bool:
+        """判断给定点数的求值是否值得使用融合内核"""
+        return size >= FUSED_MIN_POINTS and FusedEvaluator.backend() is not None
+
+    @staticmethod
+    def set_threads(count: Optional[int]) -> None:
+        """
+        设置 numexpr 的线程数（多进程批量渲染时每个进程应只用一个线程）
+
+        Args:
+            count: 线程数，None 表示不修改
+        """
+        numexpr = FusedEvaluator.backend()
+        if numexpr is not None and count:
+            numexpr.set_num_threads(count)
+
+    @staticmethod
+    def evaluate(expressions: Sequence[str], x: np.ndarray, a: float, b: float, c: float,
+                 out: np.ndarray) -> np.ndarray:
+        """
+        依次计算表达式并写入 out
+
+        表达式中可以使用 x、a、b、c 和 nan；从第二个表达式起，
+        y 表示上一个表达式的结果（即 out 本身，原地更新）。
+
+        Args:
+            expressions: numexpr 表达式序列
+            x: x坐标数组（float64）
+            a, b, c: 函数参数（数字，或可与x广播的数组）
+            out: 输出数组，形状与x和参数广播后的形状相同
+
+        Returns:
+            out
+        """
+        numexpr = FusedEvaluator.backend()
+        local_dict = {'x': x, 'a': np.asarray(a, dtype=float), 'b': np.asarray(b, dtype=float),
+                      'c': np.asarray(c, dtype=float), 'nan': np.float64(np.nan)}
+        for expression in expressions:
+            numexpr.evaluate(expression, local_dict=local_dict, out=out)
+            local_dict['y'] = out
+        return out
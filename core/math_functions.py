@@ -4,17 +4,44 @@
 """
 
 import numpy as np
-from typing import Tuple, List, Dict, Any
+from typing import Tuple, List, Dict, Any, Optional
+from config.settings import (
+    MAX_ROOTS, MAX_EXTREMA, MAX_INTERSECTIONS, ROOT_TOLERANCE, PLOT_POINTS, ADAPTIVE_SAMPLING,
+    BATCH_EVAL_CHUNK_ELEMENTS, BATCH_SAMPLING_MIN_CURVES, BATCH_POINTS_PER_PIXEL,
+    SWEEP_PARAMETERS, SWEEP_POINTS_PER_PIXEL
+)
+from core.adaptive_sampler import AdaptiveSampler
+from core.feature_engine import FeatureEngine
+from core.analytic_solver import AnalyticSolver
+from core.function_registry import FunctionRegistry
+from core.function_store import FunctionStore
+from core.evaluation_cache import EvaluationCache
+from core.tile_cache import TileCache
 
 
 class MathFunctionCalculator:
     """数学函数计算器类"""
     
-    def __init__(self):
-        """初始化计算器"""
-        self.functions = []  # 存储所有已添加的函数信息
+    def __init__(self, evaluation_cache: Optional[EvaluationCache] = None,
+                 tile_cache: Optional[TileCache] = None):
+        """
+        初始化计算器
+        
+        Args:
+            evaluation_cache: 求值缓存（可选），提供时均匀网格上的求值结果会被缓存
+            tile_cache: 瓦片缓存（可选），提供时自适应采样以缓存的瓦片作为初始采样点
+        """
+        self.store = FunctionStore()  # 按列存储所有已添加的函数
+        self.evaluation_cache = evaluation_cache
+        self.tile_cache = tile_cache
+    
+    @property
+    def functions(self) -> List[Dict]:
+        """按添加顺序排列的函数信息字典列表（id、type、params、color），只读"""
+        return self.store.records()
     
-    def get_function_values(self, x: np.ndarray, func_type: str, a: float, b: float, c: float) -> np.ndarray:
+    def get_function_values(self, x: np.ndarray, func_type: str, a: float, b: float, c: float,
+                            out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         根据函数类型和参数计算y值
         
@@ -22,27 +49,18 @@ class MathFunctionCalculator:
             x: x坐标数组
             func_type: 函数类型
             a, b, c: 函数参数
+            out: 写入结果的数组（可选，形状与x相同）
             
         Returns:
             y坐标数组
         """
-        if func_type == "二次函数":
-            return a * x**2 + b * x + c
-        elif func_type == "正弦函数":
-            return a * np.sin(b * x + c)
-        elif func_type == "余弦函数":
-            return a * np.cos(b * x + c)
-        elif func_type == "正切函数":
-            y = a * np.tan(b * x + c)
-            y[np.abs(y) > 50] = np.nan  # 限制极值
-            return y
-        elif func_type == "指数函数":
-            return a * np.exp(b * x) + c
-        elif func_type == "对数函数":
-            arg = b * x + c
-            arg[arg <= 0] = np.nan  # 处理定义域
-            return a * np.log(arg)
-        return np.zeros_like(x)
+        family = FunctionRegistry.get(func_type)
+        if family is None:
+            if out is None:
+                return np.zeros_like(x, dtype=float)
+            out.fill(0.0)
+            return out
+        return family.evaluate(x, a, b, c, out)
     
     def get_function_expression(self, func_type: str, a: float, b: float, c: float) -> str:
         """
@@ -55,42 +73,61 @@ class MathFunctionCalculator:
         Returns:
             函数表达式字符串
         """
-        if func_type == "二次函数":
-            return f"$y = {a:.2f}x^2 + {b:.2f}x + {c:.2f}$"
-        elif func_type == "正弦函数":
-            return f"y = {a:.2f}·sin({b:.2f}x + {c:.2f})"
-        elif func_type == "余弦函数":
-            return f"y = {a:.2f}·cos({b:.2f}x + {c:.2f})"
-        elif func_type == "正切函数":
-            return f"y = {a:.2f}·tan({b:.2f}x + {c:.2f})"
-        elif func_type == "指数函数":
-            return f"y = {a:.2f}·e^({b:.2f}x) + {c:.2f}"
-        elif func_type == "对数函数":
-            return f"y = {a:.2f}·log({b:.2f}x + {c:.2f})"
-        return ""
+        family = FunctionRegistry.get(func_type)
+        if family is None:
+            return ""
+        return family.format_expression(a, b, c)
     
-    def add_function(self, func_type: str, params: Tuple[float, float, float], color: str) -> None:
+    def add_function(self, func_type: str, params: Tuple[float, float, float], color: str) -> int:
         """
-        添加函数到列表
+        添加函数到函数存储
         
         Args:
             func_type: 函数类型
             params: 函数参数 (a, b, c)
             color: 函数颜色
+            
+        Returns:
+            新函数的ID
         """
-        self.functions.append({
-            'type': func_type,
-            'params': params,
-            'color': color
-        })
+        return self.store.append(func_type, params, color)
+    
+    def get_function(self, func_id: int) -> Optional[Dict]:
+        """根据ID获取函数信息，不存在时返回None"""
+        return self.store.get(func_id)
+    
+    def remove_function(self, func_id: int) -> bool:
+        """
+        根据ID移除函数
+        
+        Args:
+            func_id: 函数ID
+            
+        Returns:
+            是否移除成功
+        """
+        return self.store.remove(func_id)
+    
+    def update_function(self, func_id: int, params: Tuple[float, float, float]) -> bool:
+        """
+        更新函数参数（ID保持不变）
+        
+        Args:
+            func_id: 函数ID
+            params: 新的函数参数 (a, b, c)
+            
+        Returns:
+            是否更新成功
+        """
+        return self.store.update_params(func_id, params)
     
     def clear_functions(self) -> None:
         """清除所有函数"""
-        self.functions = []
+        self.store.clear()
     
     def get_function_count(self) -> int:
         """获取函数数量"""
-        return len(self.functions)
+        return len(self.store)
     
     def calculate_quadratic_features(self, a: float, b: float, c: float) -> Dict[str, Any]:
         """
@@ -143,7 +180,23 @@ class MathFunctionCalculator:
         
         return features
     
-    def find_roots(self, x: np.ndarray, y: np.ndarray, tolerance: float = 0.1) -> List[float]:
+    def calculate_analytic_features(self, func_type: str, params: Tuple[float, float, float],
+                                    x_range: Tuple[float, float]) -> Dict[str, np.ndarray]:
+        """
+        计算函数在x范围内的解析特征（零点、极值点、渐近线、周期边界）
+        
+        Args:
+            func_type: 函数类型
+            params: 函数参数 (a, b, c)
+            x_range: x轴范围
+            
+        Returns:
+            特征字典，详见 AnalyticSolver.solve
+        """
+        return AnalyticSolver.solve(func_type, params, x_range)
+    
+    def find_roots(self, x: np.ndarray, y: np.ndarray, tolerance: float = ROOT_TOLERANCE,
+                   max_count: Optional[int] = MAX_ROOTS) -> List[float]:
         """
         寻找函数的零点
         
@@ -151,49 +204,300 @@ class MathFunctionCalculator:
             x: x坐标数组
             y: y坐标数组
             tolerance: 容差
+            max_count: 最多返回的零点数量，None表示不限制
             
         Returns:
             零点列表
         """
-        roots = []
-        
-        for i in range(1, len(y)):
-            if not (np.isnan(y[i]) or np.isnan(y[i-1])):
-                if y[i-1] * y[i] <= 0 and abs(y[i]) < tolerance:
-                    if abs(y[i] - y[i-1]) > 1e-10:
-                        root_x = x[i-1] - y[i-1] * (x[i] - x[i-1]) / (y[i] - y[i-1])
-                        roots.append(root_x)
-        
-        # 去重并排序
-        roots = list(set([round(r, 2) for r in roots]))
-        roots.sort()
-        
-        return roots[:5]  # 最多返回5个零点
+        roots = FeatureEngine.find_roots(x, y, tolerance=tolerance, max_count=max_count)
+        return roots.tolist()
     
-    def find_extrema(self, x: np.ndarray, y: np.ndarray) -> List[Tuple[float, float, str]]:
+    def find_extrema(self, x: np.ndarray, y: np.ndarray,
+                     max_count: Optional[int] = MAX_EXTREMA) -> List[Tuple[float, float, str]]:
         """
         寻找函数的极值点
         
         Args:
             x: x坐标数组
             y: y坐标数组
+            max_count: 最多返回的极值点数量，None表示不限制
             
         Returns:
             极值点列表，每个元素为 (x, y, type)
         """
-        extrema = []
-        dy = np.diff(y)
+        extrema = FeatureEngine.find_extrema(x, y, max_count=max_count)
+        return [(float(e['x']), float(e['y']), FeatureEngine.extremum_label(e['kind'])) for e in extrema]
+    
+    def evaluate_batch(self, x: np.ndarray, func_type: str, params: np.ndarray,
+                       out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        用一次广播计算同一函数类型的多条曲线
         
-        for i in range(1, len(dy)):
-            if dy[i-1] * dy[i] < 0:
-                x_ext = x[i]
-                y_ext = y[i]
-                ext_type = "最大值" if dy[i-1] > 0 else "最小值"
-                extrema.append((x_ext, y_ext, ext_type))
+        按 BATCH_EVAL_CHUNK_ELEMENTS 分块，每块一次广播求值，限制中间数组的内存。
+        
+        Args:
+            x: x坐标数组，形状为 (P,)
+            func_type: 函数类型
+            params: (N, 3) 参数矩阵
+            out: 写入结果的 (N, P) 数组（可选）
+            
+        Returns:
+            (N, P) 函数值矩阵
+        """
+        x = np.asarray(x, dtype=float)
+        params = np.asarray(params, dtype=float).reshape(-1, 3)
+        if out is None:
+            out = np.empty((len(params), len(x)), dtype=float)
+        family = FunctionRegistry.get(func_type)
+        if family is None:
+            out.fill(0.0)
+            return out
         
-        return extrema[:5]  # 最多返回5个极值点
+        rows = max(1, BATCH_EVAL_CHUNK_ELEMENTS // max(len(x), 1))
+        for start in range(0, len(params), rows):
+            family.evaluate_batch(x, params[start:start + rows], out[start:start + rows])
+        return out
     
-    def find_intersections(self, x: np.ndarray, func1: Dict, func2: Dict) -> List[Tuple[float, float]]:
+    def evaluate_functions(self, x: np.ndarray, functions: List[Dict]) -> np.ndarray:
+        """
+        一次性计算多个函数在同一网格上的值（同类型的函数一次广播求值）
+        
+        functions 为 self.functions 等 FunctionStore.records() 快照时，直接使用存储中
+        按类型分组的 (k, 3) 参数矩阵，不再逐个读取函数信息字典。
+        
+        Args:
+            x: x坐标数组
+            functions: 函数信息列表
+            
+        Returns:
+            (N, P) 函数值矩阵，每行对应一个函数
+        """
+        values = np.empty((len(functions), len(x)), dtype=float)
+        for func_type, positions, params in FunctionStore.group_records(functions):
+            if positions[-1] - positions[0] == len(positions) - 1:
+                # 同类型的函数相邻时直接写入结果矩阵
+                self.evaluate_batch(x, func_type, params, out=values[positions[0]:positions[-1] + 1])
+            else:
+                values[positions] = self.evaluate_batch(x, func_type, params)
+        return values
+    
+    def evaluate_on_grid(self, functions: List[Dict], x_range: Tuple[float, float],
+                         count: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        在均匀网格上计算多个函数的值，优先使用求值缓存
+        
+        Args:
+            functions: 函数信息列表
+            x_range: x轴范围
+            count: 网格点数
+            
+        Returns:
+            (x, values)，values 为 (N, P) 函数值矩阵
+        """
+        x = np.linspace(x_range[0], x_range[1], count)
+        if self.evaluation_cache is None:
+            return x, self.evaluate_functions(x, functions)
+        
+        grid = EvaluationCache.grid_key(x_range[0], x_range[1], count)
+        values = np.empty((len(functions), count), dtype=float)
+        keys = [EvaluationCache.make_key(func['type'], func['params'], grid) for func in functions]
+        missing = []
+        for row, key in enumerate(keys):
+            cached = self.evaluation_cache.get(key)
+            if cached is None:
+                missing.append(row)
+            else:
+                values[row] = cached[0]
+        
+        # 未命中的函数批量求值后逐行写入缓存；全部未命中时整体求值，保留 records() 快照中的分组
+        if len(missing) == len(functions):
+            values = self.evaluate_functions(x, functions)
+        elif missing:
+            values[missing] = self.evaluate_functions(x, [functions[row] for row in missing])
+        for row in missing:
+            self.evaluation_cache.put(keys[row], (values[row].copy(),))
+        return x, values
+    
+    def sample_curves(self, functions: List[Dict], x_range: Tuple[float, float],
+                      y_range: Tuple[float, float], pixel_width: int,
+                      pixel_height: int) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """
+        计算绘制多条曲线所需的采样点
+        
+        曲线少于 BATCH_SAMPLING_MIN_CURVES 条时逐条调用 sample_curve()；
+        更多时在每像素 BATCH_POINTS_PER_PIXEL 个点的共享均匀网格上按函数族批量求值，
+        不做自适应细分，避免逐条曲线的Python开销成为瓶颈。
+        
+        Args:
+            functions: 函数信息列表
+            x_range: x轴范围
+            y_range: y轴范围
+            pixel_width, pixel_height: 绘图区域的像素尺寸
+            
+        Returns:
+            与 functions 对应的 (x, y) 采样点列表，数组均为只读
+        """
+        if len(functions) < BATCH_SAMPLING_MIN_CURVES:
+            return [self.sample_curve(func, x_range, y_range, pixel_width, pixel_height)
+                    for func in functions]
+        
+        count = max(int(pixel_width * BATCH_POINTS_PER_PIXEL), 2)
+        x, values = self.evaluate_on_grid(functions, x_range, count)
+        x.setflags(write=False)
+        values.setflags(write=False)
+        return [(x, y) for y in values]
+    
+    @staticmethod
+    def get_sweep_values(sweep: Dict) -> np.ndarray:
+        """
+        获取参数扫描中被扫描参数的取值
+        
+        Args:
+            sweep: 扫描信息（type、params、param、start、stop、steps）
+        
+        Returns:
+            长度为 steps 的等距取值数组
+        """
+        return np.linspace(sweep['start'], sweep['stop'], int(sweep['steps']))
+    
+    @staticmethod
+    def get_sweep_params(sweep: Dict) -> np.ndarray:
+        """
+        生成参数扫描的参数矩阵：被扫描的参数依次取各值，其余参数保持不变
+        
+        Args:
+            sweep: 扫描信息（type、params、param、start、stop、steps）
+        
+        Returns:
+            (steps, 3) 参数矩阵
+        """
+        values = MathFunctionCalculator.get_sweep_values(sweep)
+        params = np.empty((len(values), 3), dtype=float)
+        params[:] = sweep['params']
+        params[:, SWEEP_PARAMETERS.index(sweep['param'])] = values
+        return params
+    
+    def sample_sweep(self, sweep: Dict, x_range: Tuple[float, float],
+                     pixel_width: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        计算参数扫描中全部曲线的采样点
+        
+        所有曲线共享每像素 SWEEP_POINTS_PER_PIXEL 个点的均匀网格，按函数族一次批量求值。
+        中间参数的结果不写入求值缓存，避免大量一次性的条目挤掉常用条目。
+        
+        Args:
+            sweep: 扫描信息（type、params、param、start、stop、steps）
+            x_range: x轴范围
+            pixel_width: 绘图区域的像素宽度
+        
+        Returns:
+            (x, values)，values 为 (steps, P) 函数值矩阵
+        """
+        count = max(int(pixel_width * SWEEP_POINTS_PER_PIXEL), 2)
+        x = np.linspace(x_range[0], x_range[1], count)
+        return x, self.evaluate_batch(x, sweep['type'], self.get_sweep_params(sweep))
+    
+    def sample_curve(self, func: Dict, x_range: Tuple[float, float], y_range: Tuple[float, float],
+                     pixel_width: int, pixel_height: int,
+                     use_cache: bool = True,
+                     seed: Optional[Tuple[np.ndarray, np.ndarray]] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        计算绘制一条曲线所需的采样点
+        
+        启用自适应采样时在平坦处少取点、在陡峭处和极点附近多取点，
+        否则在 PLOT_POINTS 个点的均匀网格上求值。
+        有瓦片缓存时，先由瓦片拼出约每像素一个点的等距采样，只在弯曲剧烈处继续细分。
+        
+        Args:
+            func: 函数信息
+            x_range: x轴范围
+            y_range: y轴范围（用于换算像素误差）
+            pixel_width, pixel_height: 绘图区域的像素尺寸
+            use_cache: 是否读写求值缓存（实时调节的中间参数不应写入）
+            seed: 相邻视图中同一函数的采样点（可选，仅自适应采样且不使用瓦片时使用）
+            
+        Returns:
+            (x, y) 采样点数组
+        """
+        if not ADAPTIVE_SAMPLING:
+            if use_cache:
+                x, values = self.evaluate_on_grid([func], x_range, PLOT_POINTS)
+                return x, values[0]
+            x = np.linspace(x_range[0], x_range[1], PLOT_POINTS)
+            return x, self.get_function_values(x, func['type'], *func['params'])
+        
+        evaluator = self.get_function_evaluator(func)
+        if (use_cache and self.tile_cache is not None
+                and TileCache.is_precise_enough(y_range, pixel_height)):
+            compute = lambda: self.sample_from_tiles(func, evaluator, x_range, y_range,
+                                                     pixel_width, pixel_height)
+        else:
+            compute = lambda: AdaptiveSampler.sample(
+                evaluator, x_range, y_range, pixel_width, pixel_height, seed=seed
+            )
+        if not use_cache or self.evaluation_cache is None:
+            return compute()
+        grid = ('adaptive', tuple(x_range), tuple(y_range), pixel_width, pixel_height)
+        return self.evaluation_cache.get_or_compute(
+            EvaluationCache.make_key(func['type'], func['params'], grid), compute
+        )
+    
+    def sample_from_tiles(self, func: Dict, evaluator, x_range: Tuple[float, float],
+                          y_range: Tuple[float, float], pixel_width: int,
+                          pixel_height: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        以瓦片缓存中的等距采样点为基础进行自适应细分
+        
+        Args:
+            func: 函数信息
+            evaluator: 向量化求值函数
+            x_range: x轴范围
+            y_range: y轴范围
+            pixel_width, pixel_height: 绘图区域的像素尺寸
+            
+        Returns:
+            (x, y) 采样点数组
+        """
+        func_key = (func['type'], tuple(float(p) for p in func['params']))
+        x, y = self.tile_cache.sample(evaluator, func_key, x_range, pixel_width)
+        active = AdaptiveSampler.rough_intervals(x, y, y_range, pixel_height)
+        return AdaptiveSampler.refine(evaluator, x, y, y_range, pixel_width, pixel_height,
+                                      active=active)
+    
+    def get_function_evaluator(self, func: Dict):
+        """
+        获取函数的向量化求值闭包，供零点/交点细化使用
+        
+        Args:
+            func: 函数信息
+            
+        Returns:
+            接受x数组并返回y数组的函数
+        """
+        family = FunctionRegistry.get(func['type'])
+        if family is None:
+            return lambda xq: np.zeros_like(np.asarray(xq, dtype=float))
+        # 函数族在创建闭包时查找一次，采样和细化的每次调用都不再分发
+        return family.bind(func['params'])
+    
+    def get_derivative_evaluator(self, func: Dict, order: int = 1):
+        """
+        获取函数导数的向量化求值闭包
+        
+        Args:
+            func: 函数信息
+            order: 导数阶数（1 或 2）
+            
+        Returns:
+            接受x数组并返回导数数组的函数，函数类型未注册时返回None
+        """
+        family = FunctionRegistry.get(func['type'])
+        if family is None:
+            return None
+        return family.bind(func['params'], order)
+    
+    def find_intersections(self, x: np.ndarray, func1: Dict, func2: Dict,
+                           max_count: Optional[int] = MAX_INTERSECTIONS) -> List[Tuple[float, float]]:
         """
         寻找两个函数的交点
         
@@ -201,22 +505,30 @@ class MathFunctionCalculator:
             x: x坐标数组
             func1: 第一个函数信息
             func2: 第二个函数信息
+            max_count: 最多返回的交点数量，None表示不限制
             
         Returns:
             交点列表
         """
-        y1 = self.get_function_values(x, func1['type'], *func1['params'])
-        y2 = self.get_function_values(x, func2['type'], *func2['params'])
-        
-        diff = y1 - y2
-        intersections = []
-        
-        for i in range(1, len(diff)):
-            if not (np.isnan(diff[i]) or np.isnan(diff[i-1])):
-                if diff[i-1] * diff[i] <= 0:
-                    if abs(diff[i] - diff[i-1]) > 1e-10:
-                        int_x = x[i-1] - diff[i-1] * (x[i] - x[i-1]) / (diff[i] - diff[i-1])
-                        int_y = self.get_function_values(np.array([int_x]), func1['type'], *func1['params'])[0]
-                        intersections.append((int_x, int_y))
+        intersections = self.find_all_intersections(x, [func1, func2], max_per_pair=max_count)
+        return [(float(p['x']), float(p['y'])) for p in intersections]
+    
+    def find_all_intersections(self, x: np.ndarray, functions: List[Dict],
+                               max_per_pair: Optional[int] = MAX_INTERSECTIONS,
+                               values: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        批量寻找多个函数两两之间的交点
         
-        return intersections[:3]  # 最多返回3个交点
+        Args:
+            x: x坐标数组
+            functions: 函数信息列表
+            max_per_pair: 每对函数最多返回的交点数量，None表示不限制
+            values: 预先计算好的 (N, P) 函数值矩阵（可选）
+            
+        Returns:
+            结构化数组，字段为 (i, j, x, y)，i、j 为函数在列表中的下标
+        """
+        if values is None:
+            values = self.evaluate_functions(x, functions)
+        funcs = [self.get_function_evaluator(func) for func in functions]
+        return FeatureEngine.find_intersections(x, values, funcs, max_per_pair=max_per_pair)
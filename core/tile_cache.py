@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""
+多分辨率瓦片缓存模块 - 将x轴按2的幂划分为瓦片，按瓦片缓存函数值
+
+第 L 级的瓦片宽度为 2**L，第 k 个瓦片覆盖 [k·2**L, (k+1)·2**L]，
+包含 TILE_SAMPLES + 1 个等距采样点（两端都包含，便于拼接）。
+任意视图都由同一级的相邻瓦片拼成，只需计算缺失的瓦片。
+"""
+
+import math
+import numpy as np
+from typing import Callable, Dict, Hashable, List, Tuple
+from config.settings import TILE_SAMPLES, TILE_CACHE_MAX_BYTES
+from core.evaluation_cache import EvaluationCache
+
+# float32 能表示的最大有限值，超出部分截断而不是变成无穷大
+_FLOAT32_MAX = float(np.finfo(np.float32).max)
+_FLOAT32_EPS = float(np.finfo(np.float32).eps)
+
+
+class TileCache:
+    """多分辨率瓦片缓存类
+
+    瓦片只保存 float32 的y值（x由级别和序号推出），
+    存放在独立的LRU求值缓存中，超出内存预算时淘汰最久未使用的瓦片。
+    """
+
+    def __init__(self, max_bytes: int = TILE_CACHE_MAX_BYTES, samples: int = TILE_SAMPLES):
+        """
+        初始化瓦片缓存
+
+        Args:
+            max_bytes: 瓦片占用的最大字节数
+            samples: 每个瓦片的采样间隔数（须为偶数，便于由下一级瓦片合成）
+        """
+        self.samples = int(samples) + int(samples) % 2
+        self.store = EvaluationCache(max_bytes)
+        self.evaluated_tiles = 0  # 实际求值的瓦片数
+        self.derived_tiles = 0    # 由更细一级瓦片合成的瓦片数
+
+    def choose_level(self, x_range: Tuple[float, float], pixel_width: int) -> int:
+        """
+        选择采样间距不超过一个像素宽度的最粗级别
+
+        Args:
+            x_range: x轴范围
+            pixel_width: 画布宽度（像素）
+
+        Returns:
+            瓦片级别
+        """
+        pixel_dx = abs(x_range[1] - x_range[0]) / max(pixel_width, 1)
+        return math.floor(math.log2(pixel_dx * self.samples))
+
+    def tile_x(self, level: int, index: int) -> np.ndarray:
+        """计算瓦片的采样点x坐标"""
+        width = math.ldexp(1.0, level)
+        return (index + np.arange(self.samples + 1) / self.samples) * width
+
+    @staticmethod
+    def is_precise_enough(y_range: Tuple[float, float], pixel_height: int) -> bool:
+        """
+        判断 float32 的精度是否足以在当前视图中绘制
+
+        y值远大于可见范围的宽度时（如在很大的y值附近放大），
+        float32 的舍入误差会超过一个像素，此时不应使用瓦片。
+
+        Args:
+            y_range: y轴范围
+            pixel_height: 画布高度（像素）
+
+        Returns:
+            是否可以使用瓦片
+        """
+        pixel_dy = abs(y_range[1] - y_range[0]) / max(pixel_height, 1)
+        return max(abs(y_range[0]), abs(y_range[1])) * _FLOAT32_EPS < pixel_dy
+
+    def _derive_from_children(self, func_key: Tuple, level: int, index: int):
+        """两个更细一级的子瓦片都已缓存时，隔点抽取合成当前瓦片"""
+        left = self.store.get(func_key + (level - 1, 2 * index))
+        if left is None:
+            return None
+        right = self.store.get(func_key + (level - 1, 2 * index + 1))
+        if right is None:
+            return None
+        self.derived_tiles += 1
+        return np.concatenate((left[0][0::2], right[0][2::2]))
+
+    def get_tiles(self, func: Callable[[np.ndarray], np.ndarray], func_key: Hashable,
+                  level: int, indices: List[int]) -> Dict[int, np.ndarray]:
+        """
+        获取一组瓦片的y值，缺失的瓦片一次性批量求值
+
+        Args:
+            func: 向量化求值函数
+            func_key: 函数键（函数类型与参数）
+            level: 瓦片级别
+            indices: 瓦片序号
+
+        Returns:
+            {瓦片序号: float32 y值数组}
+        """
+        func_key = tuple(func_key)
+        tiles = {}
+        missing = []
+        for index in indices:
+            entry = self.store.get(func_key + (level, index))
+            if entry is not None:
+                tiles[index] = entry[0]
+                continue
+            derived = self._derive_from_children(func_key, level, index)
+            if derived is not None:
+                tiles[index] = self.store.put(func_key + (level, index), (derived,))[0]
+            else:
+                missing.append(index)
+
+        if missing:
+            x = np.concatenate([self.tile_x(level, index) for index in missing])
+            with np.errstate(all='ignore'):
+                y = np.asarray(func(x), dtype=float)
+                y = np.clip(y, -_FLOAT32_MAX, _FLOAT32_MAX, out=y).astype(np.float32)
+            for index, values in zip(missing, np.split(y, len(missing))):
+                tiles[index] = self.store.put(func_key + (level, index), (values,))[0]
+            self.evaluated_tiles += len(missing)
+        return tiles
+
+    def sample(self, func: Callable[[np.ndarray], np.ndarray], func_key: Hashable,
+               x_range: Tuple[float, float], pixel_width: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        由瓦片拼出覆盖视图的等距采样点
+
+        Args:
+            func: 向量化求值函数
+            func_key: 函数键（函数类型与参数）
+            x_range: x轴范围
+            pixel_width: 画布宽度（像素）
+
+        Returns:
+            (x, y) 采样点数组，两端各多保留一个视图外的点，使曲线画到边缘
+        """
+        x_lo, x_hi = min(x_range), max(x_range)
+        level = self.choose_level((x_lo, x_hi), pixel_width)
+        width = math.ldexp(1.0, level)
+        first, last = math.floor(x_lo / width), math.floor(x_hi / width)
+        indices = list(range(first, last + 1))
+        tiles = self.get_tiles(func, func_key, level, indices)
+
+        # 相邻瓦片共享端点，拼接时去掉后一个瓦片的第一个点
+        x = np.concatenate([self.tile_x(level, index)[(i > 0):] for i, index in enumerate(indices)])
+        y = np.concatenate([tiles[index][(i > 0):] for i, index in enumerate(indices)]).astype(float)
+
+        start = max(int(np.searchsorted(x, x_lo, side='right')) - 1, 0)
+        stop = min(int(np.searchsorted(x, x_hi, side='left')) + 1, len(x))
+        return x[start:stop], y[start:stop]
+
+    def clear(self) -> None:
+        """清空全部瓦片"""
+        self.store.clear()
+
+    def get_memory_usage(self) -> int:
+        """获取瓦片占用的字节数"""
+        return self.store.get_memory_usage()
+
+    def __len__(self) -> int:
+        return len(self.store)
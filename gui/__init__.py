@@ -3,7 +3,19 @@
 GUI模块初始化文件
 """
 
-from .main_window import MathVisualizerApp
-from .control_panel import ControlPanel
-from .plot_area import PlotArea
-from .font_settings import FontSettingsWindow
+# 按需导入：绘图区域依赖 matplotlib，延迟到首次访问时加载以加快启动
+_LAZY_EXPORTS = {
+    'MathVisualizerApp': '.main_window',
+    'ControlPanel': '.control_panel',
+    'PlotArea': '.plot_area',
+    'FontSettingsWindow': '.font_settings',
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        from importlib import import_module
+        return getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,7 +6,11 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 from gui.font_settings import FontSettingsWindow
-from utils.math_utils import MathUtils
+from config.settings import (
+    LIVE_SCRUB_FRAME_MS, LIVE_SCRUB_IDLE_MS, SCRUB_STEP, SCRUB_FINE_STEP, SCRUB_COARSE_STEP,
+    CUSTOM_FUNCTION_TYPE, FUNCTION_PANEL_INFO, SWEEP_PARAMETERS, SWEEP_DEFAULT_PARAMETER, SWEEP_DEFAULT_RANGE,
+    SWEEP_DEFAULT_STEPS, SWEEP_MAX_STEPS
+)
 
 
 class ControlPanel:
@@ -20,6 +24,20 @@ class ControlPanel:
         self.plot_area = plot_area
         self.font_changed_callback = font_changed_callback
         
+        # 实时调节状态
+        self.live_function_id = None
+        self.live_frame_job = None
+        self.live_idle_job = None
+        
+        # 自定义函数的表达式（切换函数类型时保留）
+        self.expression = tk.StringVar(value="x**3 - sin(2*x)/x")
+        
+        # 参数扫描设置（切换函数类型时保留）
+        self.sweep_param = tk.StringVar(value=SWEEP_DEFAULT_PARAMETER)
+        self.sweep_start = tk.DoubleVar(value=SWEEP_DEFAULT_RANGE[0])
+        self.sweep_stop = tk.DoubleVar(value=SWEEP_DEFAULT_RANGE[1])
+        self.sweep_steps = tk.IntVar(value=SWEEP_DEFAULT_STEPS)
+        
         self.create_control_content()
         
     def create_control_content(self):
@@ -41,6 +59,12 @@ class ControlPanel:
         self.param_frame = tk.Frame(self.parent, bg=self.theme['surface'])
         self.param_frame.pack(fill=tk.X, padx=10, pady=10)
         
+        # 实时调节开关
+        self.create_live_toggle()
+        
+        # 参数扫描设置
+        self.create_sweep_controls()
+        
         # 操作按钮
         self.create_buttons()
         
@@ -67,13 +91,66 @@ class ControlPanel:
         function_menu = ttk.Combobox(
             type_frame,
             textvariable=self.function_type,
-            values=["二次函数", "正弦函数", "余弦函数", "正切函数", "指数函数", "对数函数"],
+            values=list(FUNCTION_PANEL_INFO),
             state="readonly",
             width=25
         )
         function_menu.pack(fill=tk.X, pady=5)
         function_menu.bind("<<ComboboxSelected>>", self.update_parameters)
     
+    def create_live_toggle(self):
+        """创建实时调节开关"""
+        self.live_mode = tk.BooleanVar(value=False)
+        tk.Checkbutton(
+            self.parent,
+            text="⚡ 实时调节 (滚轮调整参数, Shift微调/Ctrl粗调)",
+            variable=self.live_mode,
+            command=self.on_live_mode_changed,
+            font=('Segoe UI', 9),
+            fg=self.theme['on_surface'],
+            bg=self.theme['surface'],
+            activebackground=self.theme['surface'],
+            anchor=tk.W
+        ).pack(fill=tk.X, padx=10)
+    
+    def create_sweep_controls(self):
+        """创建参数扫描设置（扫描的参数、起点、终点和步数）"""
+        sweep_frame = tk.Frame(self.parent, bg=self.theme['surface'])
+        sweep_frame.pack(fill=tk.X, padx=10, pady=(10, 0))
+        
+        tk.Label(
+            sweep_frame,
+            text="🌈 参数扫描 (曲线族):",
+            font=('Segoe UI', 9),
+            fg=self.theme['on_surface'],
+            bg=self.theme['surface']
+        ).pack(anchor=tk.W)
+        
+        row = tk.Frame(sweep_frame, bg=self.theme['surface'])
+        row.pack(fill=tk.X, pady=2)
+        ttk.Combobox(
+            row,
+            textvariable=self.sweep_param,
+            values=SWEEP_PARAMETERS,
+            state="readonly",
+            width=3
+        ).pack(side=tk.LEFT)
+        
+        for text, var in (("从", self.sweep_start), ("到", self.sweep_stop), ("步数", self.sweep_steps)):
+            tk.Label(
+                row,
+                text=text,
+                font=('Segoe UI', 9),
+                fg=self.theme['on_surface'],
+                bg=self.theme['surface']
+            ).pack(side=tk.LEFT, padx=(5, 2))
+            tk.Entry(
+                row,
+                textvariable=var,
+                font=('Segoe UI', 9),
+                width=6
+            ).pack(side=tk.LEFT)
+    
     def create_buttons(self):
         """创建操作按钮"""
         button_frame = tk.Frame(self.parent, bg=self.theme['surface'])
@@ -82,11 +159,15 @@ class ControlPanel:
         buttons = [
             ("📊 绘制函数", self.plot_function, self.theme['primary']),
             ("➕ 添加函数", self.add_function, self.theme['secondary']),
+            ("🌈 参数扫描", self.sweep_function, self.theme['warning']),
             ("🗑️ 清除图形", self.clear_plot, self.theme['danger']),
             ("💾 保存图像", self.save_plot, self.theme['success']),
             ("🔤 字体设置", self.show_font_settings, self.theme['accent'])
         ]
 
+        # 绘图组件加载完成前禁用按钮
+        self.action_buttons = []
+        state = tk.NORMAL if self.is_ready() else tk.DISABLED
         for i, (text, command, color) in enumerate(buttons):
             btn = tk.Button(
                 button_frame,
@@ -98,9 +179,31 @@ class ControlPanel:
                 relief='flat',
                 padx=5,
                 pady=3,
-                cursor='hand2'
+                cursor='hand2',
+                state=state
             )
             btn.pack(fill=tk.X, pady=2)
+            self.action_buttons.append(btn)
+    
+    def is_ready(self):
+        """绘图组件是否已加载完成"""
+        return self.plot_area is not None
+    
+    def attach_components(self, font_manager, math_calculator, plot_area):
+        """
+        后台加载完成后接入字体管理器、计算器和绘图区域
+        
+        Args:
+            font_manager: 字体管理器
+            math_calculator: 数学计算器
+            plot_area: 绘图区域
+        """
+        self.font_manager = font_manager
+        self.math_calculator = math_calculator
+        self.plot_area = plot_area
+        for btn in self.action_buttons:
+            btn.config(state=tk.NORMAL)
+        self.update_font_info()
     
     def create_font_info(self):
         """创建字体信息显示区域"""
@@ -116,8 +219,9 @@ class ControlPanel:
             bg=self.theme['surface']
         ).pack(anchor=tk.W)
 
-        # 当前字体显示
-        current_font = self.font_manager.get_current_font()
+        # 当前字体显示（字体发现在后台完成前显示加载提示）
+        current_font = self.font_manager.get_current_font() if self.font_manager else "加载中..."
+        preview_font = (current_font, 9) if self.font_manager else ('Segoe UI', 9)
         self.font_info_label = tk.Label(
             font_frame,
             text=current_font,
@@ -131,7 +235,7 @@ class ControlPanel:
         self.font_preview_label = tk.Label(
             font_frame,
             text="中文测试: 数学函数",
-            font=(current_font, 9),
+            font=preview_font,
             fg=self.theme['primary'],
             bg=self.theme['surface']
         )
@@ -139,6 +243,8 @@ class ControlPanel:
 
     def update_font_info(self):
         """更新字体信息显示"""
+        if self.font_manager is None:
+            return
         try:
             current_font = self.font_manager.get_current_font()
             self.font_info_label.config(text=current_font)
@@ -165,10 +271,33 @@ class ControlPanel:
         )
         formula_label.pack(anchor=tk.W, pady=(0, 10))
         
-        # 参数输入
-        self.a = tk.DoubleVar(value=1.0)
-        self.b = tk.DoubleVar(value=1.0 if func_type in ["正弦函数", "余弦函数", "指数函数", "对数函数"] else 0.0)
-        self.c = tk.DoubleVar(value=0.0)
+        # 自定义函数的表达式输入
+        if func_type == CUSTOM_FUNCTION_TYPE:
+            expression_frame = tk.Frame(self.param_frame, bg=self.theme['surface'])
+            expression_frame.pack(fill=tk.X, pady=(0, 5))
+            tk.Label(
+                expression_frame,
+                text="y =",
+                font=('Segoe UI', 9),
+                fg=self.theme['on_surface'],
+                bg=self.theme['surface'],
+                width=3
+            ).pack(side=tk.LEFT)
+            tk.Entry(
+                expression_frame,
+                textvariable=self.expression,
+                font=('Consolas', 9),
+                width=28
+            ).pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(5, 0))
+        
+        # 重建参数变量前结束正在进行的实时调节
+        self.finish_live_update()
+        
+        # 参数输入（默认值取自 FUNCTION_PANEL_INFO，窗口显示前不导入计算模块）
+        default_a, default_b, default_c = FUNCTION_PANEL_INFO.get(func_type, ("", (1.0, 0.0, 0.0)))[1]
+        self.a = tk.DoubleVar(value=default_a)
+        self.b = tk.DoubleVar(value=default_b)
+        self.c = tk.DoubleVar(value=default_c)
         
         params = [("a", self.a), ("b", self.b), ("c", self.c)]
         
@@ -192,54 +321,192 @@ class ControlPanel:
                 width=15
             )
             entry.pack(side=tk.LEFT, padx=(5, 0))
+            
+            # 鼠标滚轮调整参数（Windows/macOS 使用 MouseWheel，X11 使用 Button-4/5）
+            entry.bind("<MouseWheel>", lambda e, v=var: self.on_param_wheel(e, v))
+            entry.bind("<Button-4>", lambda e, v=var: self.on_param_wheel(e, v, 1))
+            entry.bind("<Button-5>", lambda e, v=var: self.on_param_wheel(e, v, -1))
+            var.trace_add("write", self.on_param_changed)
+    
+    def on_param_wheel(self, event, var, direction=None):
+        """鼠标滚轮调整参数值"""
+        try:
+            value = var.get()
+        except (tk.TclError, ValueError):
+            return "break"
+        
+        if direction is None:
+            direction = 1 if event.delta > 0 else -1
+        if event.state & 0x0001:      # Shift
+            step = SCRUB_FINE_STEP
+        elif event.state & 0x0004:    # Control
+            step = SCRUB_COARSE_STEP
+        else:
+            step = SCRUB_STEP
+        
+        var.set(round(value + direction * step, 6))
+        return "break"
+    
+    def on_live_mode_changed(self):
+        """切换实时调节模式"""
+        if self.live_mode.get() and self.is_ready():
+            self.schedule_live_update()
+        else:
+            self.finish_live_update()
+    
+    def on_param_changed(self, *args):
+        """参数变量改变时的回调"""
+        if self.live_mode.get() and self.is_ready():
+            self.schedule_live_update()
+    
+    def schedule_live_update(self):
+        """
+        合并参数变化，按帧间隔调度一次快速重绘
+        
+        连续的滚轮事件在同一帧内只触发一次重绘；停止调节 LIVE_SCRUB_IDLE_MS 毫秒后
+        再执行一次完整重绘（包括交点、图例等）。
+        """
+        if self.live_frame_job is None:
+            self.live_frame_job = self.parent.after(LIVE_SCRUB_FRAME_MS, self.apply_live_update)
+        if self.live_idle_job is not None:
+            self.parent.after_cancel(self.live_idle_job)
+        self.live_idle_job = self.parent.after(LIVE_SCRUB_IDLE_MS, self.finish_live_update)
+    
+    def get_live_params(self):
+        """读取当前参数，输入不完整（如只输入了负号）时返回None"""
+        try:
+            return (self.a.get(), self.b.get(), self.c.get())
+        except (tk.TclError, ValueError):
+            return None
+    
+    def get_live_function(self):
+        """获取实时调节的目标函数及其位置"""
+        functions = self.math_calculator.functions
+        for index, func in enumerate(functions):
+            if func.get('id') == self.live_function_id:
+                return func, index
+        return None, -1
+    
+    def apply_live_update(self):
+        """执行一帧实时重绘"""
+        self.live_frame_job = None
+        params = self.get_live_params()
+        if params is None:
+            return
+        
+        func_type = self.get_function_type()
+        is_valid, _ = self.validate_parameters(func_type, params)
+        if not is_valid:
+            return
+        
+        func, index = self.get_live_function()
+        if func is None or func['type'] != func_type:
+            # 只调节最近绘制/添加的函数；切换了函数类型时需先重新绘制
+            return
+        
+        self.plot_area.scrub_function(func, index, params)
+    
+    def finish_live_update(self):
+        """结束实时调节：写入最终参数并完整重绘"""
+        for job in (self.live_frame_job, self.live_idle_job):
+            if job is not None:
+                self.parent.after_cancel(job)
+        self.live_frame_job = None
+        self.live_idle_job = None
+        
+        if not self.is_ready() or self.plot_area.scrub_key is None:
+            return
+        self.plot_area.end_scrub()
+        
+        func, _ = self.get_live_function()
+        params = self.get_live_params()
+        if func is not None and params is not None:
+            is_valid, _ = self.validate_parameters(func['type'], params)
+            if is_valid:
+                self.math_calculator.update_function(func['id'], params)
+        self.plot_area.redraw(self.math_calculator.functions)
+    
+    @staticmethod
+    def validate_parameters(func_type, params):
+        """验证函数参数，返回 (是否有效, 错误信息)"""
+        from core.function_registry import FunctionRegistry
+        family = FunctionRegistry.get(func_type)
+        if family is None:
+            return False, f"未知的函数类型: {func_type}"
+        return family.validate(*params)
+    
+    @staticmethod
+    def validate_sweep(sweep):
+        """验证参数扫描设置及每一条曲线的参数，返回 (是否有效, 错误信息)"""
+        if not 2 <= sweep['steps'] <= SWEEP_MAX_STEPS:
+            return False, f"扫描步数应在 2 到 {SWEEP_MAX_STEPS} 之间"
+        if sweep['start'] == sweep['stop']:
+            return False, "扫描的起点和终点不能相同"
+        from core.function_registry import FunctionRegistry
+        from core.math_functions import MathFunctionCalculator
+        family = FunctionRegistry.get(sweep['type'])
+        if family is None:
+            return False, f"未知的函数类型: {sweep['type']}"
+        index = SWEEP_PARAMETERS.index(sweep['param'])
+        for params in MathFunctionCalculator.get_sweep_params(sweep):
+            is_valid, error_msg = family.validate(*params)
+            if not is_valid:
+                return False, f"{sweep['param']} = {params[index]:g} 时: {error_msg}"
+        return True, ""
     
     def get_formula_text(self, func_type):
         """获取函数公式文本"""
-        formulas = {
-            "二次函数": "📐 y = a·x² + b·x + c",
-            "正弦函数": "〰️ y = a·sin(b·x + c)",
-            "余弦函数": "〰️ y = a·cos(b·x + c)",
-            "正切函数": "📈 y = a·tan(b·x + c)",
-            "指数函数": "📊 y = a·e^(b·x) + c",
-            "对数函数": "📉 y = a·log(b·x + c)"
-        }
-        return formulas.get(func_type, "")
+        return FUNCTION_PANEL_INFO.get(func_type, ("", None))[0]
+    
+    def get_function_type(self):
+        """获取要绘制的函数类型（自定义函数返回 "自定义函数: 表达式" 形式的类型）"""
+        func_type = self.function_type.get()
+        if func_type == CUSTOM_FUNCTION_TYPE:
+            from core.function_registry import ExpressionFamily
+            return ExpressionFamily.make_type(self.expression.get())
+        return func_type
     
     def plot_function(self):
         """绘制函数"""
+        if not self.is_ready():
+            return
         try:
-            func_type = self.function_type.get()
+            func_type = self.get_function_type()
             params = (self.a.get(), self.b.get(), self.c.get())
             
             # 验证参数
-            is_valid, error_msg = MathUtils.validate_function_parameters(func_type, *params)
+            is_valid, error_msg = self.validate_parameters(func_type, params)
             if not is_valid:
                 messagebox.showerror("参数错误", error_msg)
                 return
             
-            # 清除之前的函数
+            # 清除之前的函数和参数扫描
             self.math_calculator.clear_functions()
+            self.plot_area.set_sweep(None)
             
             # 添加当前函数
-            self.math_calculator.add_function(func_type, params, 'b')
+            self.live_function_id = self.math_calculator.add_function(func_type, params, 'b')
             
-            # 绘制函数
-            ranges = {'x_range': (-5, 5), 'y_range': (-5, 5)}
+            # 绘制函数（保持当前的视图范围）
+            ranges = self.plot_area.get_view_ranges()
             options = {'show_extrema': True, 'show_roots': True, 'show_intersection': False, 'show_grid_points': False}
             
-            self.plot_area.plot_functions(self.math_calculator.functions, ranges, options)
+            self.plot_area.request_redraw(('curves', 'features', 'legend'),
+                                          self.math_calculator.functions, ranges, options)
             
         except Exception as e:
             messagebox.showerror("绘制错误", f"绘制函数时发生错误: {str(e)}")
     
     def add_function(self):
         """添加函数"""
+        if not self.is_ready():
+            return
         try:
-            func_type = self.function_type.get()
+            func_type = self.get_function_type()
             params = (self.a.get(), self.b.get(), self.c.get())
             
             # 验证参数
-            is_valid, error_msg = MathUtils.validate_function_parameters(func_type, *params)
+            is_valid, error_msg = self.validate_parameters(func_type, params)
             if not is_valid:
                 messagebox.showerror("参数错误", error_msg)
                 return
@@ -249,24 +516,74 @@ class ControlPanel:
             color = FUNCTION_COLORS[self.math_calculator.get_function_count() % len(FUNCTION_COLORS)]
             
             # 添加函数
-            self.math_calculator.add_function(func_type, params, color)
+            self.live_function_id = self.math_calculator.add_function(func_type, params, color)
             
-            # 重新绘制
-            ranges = {'x_range': (-5, 5), 'y_range': (-5, 5)}
+            # 重新绘制（保持当前的视图范围）
+            ranges = self.plot_area.get_view_ranges()
             options = {'show_extrema': True, 'show_roots': True, 'show_intersection': True, 'show_grid_points': False}
             
-            self.plot_area.plot_functions(self.math_calculator.functions, ranges, options)
+            self.plot_area.request_redraw(('curves', 'features', 'legend'),
+                                          self.math_calculator.functions, ranges, options)
             
         except Exception as e:
             messagebox.showerror("添加错误", f"添加函数时发生错误: {str(e)}")
     
+    def sweep_function(self):
+        """
+        参数扫描：被扫描的参数在给定范围内等距取值，其余参数取当前值，
+        全部曲线批量求值后绘制为一个按参数值着色的曲线族（用颜色条代替图例）
+        """
+        if not self.is_ready():
+            return
+        try:
+            try:
+                sweep = {
+                    'type': self.get_function_type(),
+                    'params': (self.a.get(), self.b.get(), self.c.get()),
+                    'param': self.sweep_param.get(),
+                    'start': self.sweep_start.get(),
+                    'stop': self.sweep_stop.get(),
+                    'steps': self.sweep_steps.get(),
+                }
+            except (tk.TclError, ValueError):
+                messagebox.showerror("参数错误", "请输入有效的扫描范围和整数步数")
+                return
+            
+            # 验证参数
+            is_valid, error_msg = self.validate_sweep(sweep)
+            if not is_valid:
+                messagebox.showerror("参数错误", error_msg)
+                return
+            
+            # 曲线族代替之前的函数
+            self.finish_live_update()
+            self.live_function_id = None
+            self.math_calculator.clear_functions()
+            self.plot_area.set_sweep(sweep)
+            
+            # 绘制曲线族（保持当前的视图范围）
+            ranges = self.plot_area.get_view_ranges()
+            options = {'show_extrema': False, 'show_roots': False, 'show_intersection': False, 'show_grid_points': False}
+            
+            self.plot_area.request_redraw(('curves', 'features', 'legend'),
+                                          self.math_calculator.functions, ranges, options)
+            
+        except Exception as e:
+            messagebox.showerror("扫描错误", f"参数扫描时发生错误: {str(e)}")
+    
     def clear_plot(self):
         """清除图形"""
+        if not self.is_ready():
+            return
+        self.finish_live_update()
+        self.live_function_id = None
         self.math_calculator.clear_functions()
         self.plot_area.clear_plot()
     
     def save_plot(self):
         """保存图像"""
+        if not self.is_ready():
+            return
         success, message = self.plot_area.save_plot()
         if success:
             messagebox.showinfo("保存成功", message)
@@ -275,6 +592,8 @@ class ControlPanel:
 
     def show_font_settings(self):
         """显示字体设置窗口"""
+        if not self.is_ready():
+            return
         try:
             FontSettingsWindow(
                 self.parent,
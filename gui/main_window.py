@@ -3,31 +3,45 @@
 主窗口模块 - 负责创建和管理主界面
 """
 
+import threading
+import importlib
 import tkinter as tk
 from tkinter import ttk, messagebox
-from config.settings import THEMES, DEFAULT_THEME, APP_TITLE
-from core.font_manager import FontManager
-from core.math_functions import MathFunctionCalculator
-from gui.plot_area import PlotArea
-from gui.font_settings import FontSettingsWindow
+from config.settings import THEMES, DEFAULT_THEME, APP_TITLE, DEFERRED_STARTUP, STARTUP_POLL_MS
 from gui.control_panel import ControlPanel
-from utils.math_utils import MathUtils
+from utils.profiling import startup_timer
+
+# 后台加载的重量级模块（按顺序导入，分别计时）
+HEAVY_MODULES = [
+    ("导入 matplotlib", "matplotlib.figure"),
+    ("导入 TkAgg 后端", "matplotlib.backends.backend_tkagg"),
+    ("导入计算模块", "core.math_functions"),
+    ("导入绘图区域", "gui.plot_area"),
+    ("导入字体管理", "core.font_manager"),
+]
 
 
 class MathVisualizerApp:
     """数学函数可视化应用主窗口"""
     
     def __init__(self):
-        self.root = tk.Tk()
-        self.current_theme = DEFAULT_THEME
-        self.themes = THEMES
-        
-        # 初始化核心组件
-        self.font_manager = FontManager()
-        self.math_calculator = MathFunctionCalculator()
+        with startup_timer.phase("创建主窗口"):
+            self.root = tk.Tk()
+            self.current_theme = DEFAULT_THEME
+            self.themes = THEMES
+            
+            # 核心组件依赖 matplotlib，由 start_loading() 加载完成后再创建
+            self.font_manager = None
+            self.math_calculator = None
+            self.plot_area = None
+            self.loading_thread = None
+            self.loading_error = None
+            self.loaded_font_manager = None
+            
+            self.setup_window()
+            self.create_interface()
         
-        self.setup_window()
-        self.create_interface()
+        self.start_loading()
         
     def setup_window(self):
         """设置窗口"""
@@ -85,7 +99,7 @@ class MathVisualizerApp:
         # 创建绘图区域
         self.create_plot_content(plot_frame, theme)
         
-        # 创建控制面板
+        # 创建控制面板（绘图组件加载完成前按钮处于禁用状态）
         self.control_panel = ControlPanel(
             control_frame, 
             theme, 
@@ -94,9 +108,6 @@ class MathVisualizerApp:
             self.plot_area,
             self.on_font_changed
         )
-        
-        # 设置默认函数
-        self.control_panel.set_default_function()
     
     def create_plot_content(self, parent, theme):
         """创建绘图区域内容"""
@@ -114,19 +125,92 @@ class MathVisualizerApp:
         plot_container = tk.Frame(parent, bg=theme['surface'])
         plot_container.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
         
-        # 创建绘图区域
-        self.plot_area = PlotArea(plot_container, self.font_manager)
+        # 加载完成前显示占位内容
+        self.plot_container = plot_container
+        self.placeholder = tk.Label(
+            plot_container,
+            text="⏳ 正在加载绘图组件...",
+            font=('Segoe UI', 11),
+            fg=theme['secondary'],
+            bg=theme['surface_variant']
+        )
+        self.placeholder.pack(fill=tk.BOTH, expand=True)
+    
+    def start_loading(self):
+        """加载绘图组件：延迟启动模式下在后台线程中导入模块和发现字体"""
+        if not DEFERRED_STARTUP:
+            self.load_heavy_modules()
+            self.finish_loading()
+            return
+        
+        self.loading_thread = threading.Thread(target=self.load_heavy_modules, daemon=True)
+        self.loading_thread.start()
+        self.root.after(STARTUP_POLL_MS, self.check_loading)
+    
+    def load_heavy_modules(self):
+        """
+        导入 matplotlib 等重量级模块并发现中文字体
+        
+        可在后台线程中运行，因此这里只做导入和字体配置，不创建任何 Tk 控件。
+        """
+        try:
+            for phase_name, module_name in HEAVY_MODULES:
+                with startup_timer.phase(phase_name):
+                    importlib.import_module(module_name)
+            
+            from core.font_manager import FontManager
+            with startup_timer.phase("字体发现"):
+                self.loaded_font_manager = FontManager()
+        except Exception as e:
+            self.loading_error = e
+    
+    def check_loading(self):
+        """轮询后台加载线程，完成后在主线程中创建绘图区域"""
+        if self.loading_thread.is_alive():
+            self.root.after(STARTUP_POLL_MS, self.check_loading)
+            return
+        self.finish_loading()
+    
+    def finish_loading(self):
+        """用真正的绘图区域替换占位内容，并绘制默认函数"""
+        if self.loading_error is not None:
+            print(f"❌ 加载绘图组件失败: {self.loading_error}")
+            self.placeholder.config(text=f"❌ 加载绘图组件失败: {self.loading_error}")
+            return
+        
+        from core.math_functions import MathFunctionCalculator
+        from gui.plot_area import PlotArea
+        
+        with startup_timer.phase("创建绘图区域"):
+            self.placeholder.destroy()
+            self.placeholder = None
+            self.font_manager = self.loaded_font_manager
+            self.math_calculator = MathFunctionCalculator()
+            self.plot_area = PlotArea(self.plot_container, self.font_manager)
+            self.control_panel.attach_components(self.font_manager, self.math_calculator, self.plot_area)
+            # F9 开关绘图耗时记录，Shift+F9 导出 Chrome trace
+            self.root.bind('<F9>', lambda event: self.plot_area.toggle_profiling())
+            self.root.bind('<Shift-F9>', lambda event: self.plot_area.dump_trace())
+        
+        with startup_timer.phase("绘制默认函数"):
+            self.control_panel.set_default_function()
+        
+        # 在后台预先导入 sympy，第一次输入自定义表达式时不在界面线程中导入
+        from core.expression_compiler import ExpressionCompiler
+        threading.Thread(target=ExpressionCompiler.preload, daemon=True).start()
+        
+        print(startup_timer.format_report())
 
     def on_font_changed(self):
         """字体更改后的回调"""
         try:
-            # 重新绘制图形以应用新字体
-            if self.math_calculator.functions:
-                ranges = {'x_range': (-5, 5), 'y_range': (-5, 5)}
-                options = {'show_extrema': True, 'show_roots': True, 'show_intersection': True, 'show_grid_points': False}
-                self.plot_area.plot_functions(self.math_calculator.functions, ranges, options)
+            # 原地更新已有文本的字体，无需重建图形
+            if self.plot_area is None:
+                return
+            if self.math_calculator.functions or self.plot_area.sweep is not None:
+                self.plot_area.refresh_fonts()
             else:
-                # 如果没有函数，重新绘制默认函数以显示字体效果
+                # 既没有函数也没有参数扫描时，重新绘制默认函数以显示字体效果
                 self.control_panel.plot_function()
         except Exception as e:
             print(f"字体更改回调错误: {e}")
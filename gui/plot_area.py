@@ -3,15 +3,31 @@
 绘图区域模块
 """
 
+import time
+import queue
 import tkinter as tk
 from tkinter import ttk
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
 from typing import List, Dict, Tuple, Any
-from config.settings import FIGURE_SIZE, FIGURE_DPI, FIGURE_FACECOLOR, AXES_FACECOLOR, PLOT_POINTS
+from config.settings import (
+    FIGURE_SIZE, FIGURE_DPI, FIGURE_FACECOLOR, AXES_FACECOLOR, PLOT_POINTS,
+    ASYNC_COMPUTE, ASYNC_POLL_MS, COMPUTE_WORKERS, REDRAW_FRAME_MS,
+    DEFAULT_X_RANGE, DEFAULT_Y_RANGE, ZOOM_STEP, MIN_VIEW_SPAN, MAX_VIEW_SPAN, TILE_CACHE_ENABLED,
+    PROFILE_STATUS_READOUT, PROFILE_TRACE_FILE
+)
 from utils.plot_utils import PlotUtils
+from utils.profiling import plot_profiler
 from core.math_functions import MathFunctionCalculator
+from core.evaluation_cache import EvaluationCache
+from core.function_store import FunctionRecords
+from core.tile_cache import TileCache
+
+
+# 重绘调度器可以单独标记的部分
+REDRAW_PARTS = ('curves', 'features', 'legend', 'fonts')
 
 
 class PlotArea:
@@ -28,6 +44,55 @@ class PlotArea:
         self.parent = parent
         self.font_manager = font_manager
         
+        # 跨重绘共享的求值缓存与计算器
+        self.evaluation_cache = EvaluationCache()
+        self.tile_cache = TileCache() if TILE_CACHE_ENABLED else None
+        self.calculator = MathFunctionCalculator(self.evaluation_cache, self.tile_cache)
+        
+        # 持久的图形对象注册表：函数ID -> {'line', 'signature'}，增量更新时只改动变化的部分
+        self.function_artists = {}
+        self.feature_artists = []
+        self.intersection_artists = {}
+        self.grid_artists = []
+        self.legend = None
+        self.axes_ready = False
+        self.current_ranges = None
+        self.current_pixel_size = None
+        self.feature_signature = None
+        self.grid_signature = None
+        self.legend_signature = None
+        self.current_font = None
+        self.current_options = {}
+        
+        # 参数扫描：扫描信息、曲线族图形对象 (LineCollection, 颜色条) 及其签名
+        self.sweep = None
+        self.sweep_artists = None
+        self.sweep_signature = None
+        
+        # 后台计算：每次绘图请求分配递增的代号，只应用最新一代的结果
+        self.executor = ThreadPoolExecutor(max_workers=COMPUTE_WORKERS, thread_name_prefix="plot-compute")
+        self.result_queue = queue.Queue()
+        self.generation = 0
+        self.pending_future = None
+        self.polling = False
+        
+        # 重绘调度：标记需要重绘的部分，每帧最多执行一次
+        self.dirty_parts = set()
+        self.flush_job = None
+        self.last_flush_time = 0.0
+        self.redraw_functions = []
+        self.redraw_ranges = None
+        self.redraw_options = None
+        
+        # 平移状态：(按下时的像素坐标, 按下时的x范围, 按下时的y范围)
+        self.pan_start = None
+        
+        # 实时调节（blitting）状态
+        self.scrub_key = None
+        self.scrub_background = None
+        self.scrub_markers = {}      # 特征点名称（extrema、roots）-> 动画标记
+        self.scrub_hidden = []
+        
         # 创建绘图区域
         self.create_plot_area()
     
@@ -46,6 +111,13 @@ class PlotArea:
         # 创建tkinter画布并嵌入matplotlib图形
         self.canvas = FigureCanvasTkAgg(self.fig, master=self.plot_frame)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self.canvas.mpl_connect('draw_event', self.on_canvas_draw)
+        
+        # 鼠标滚轮缩放、左键拖动平移、双击恢复默认范围
+        self.canvas.mpl_connect('scroll_event', self.on_scroll)
+        self.canvas.mpl_connect('button_press_event', self.on_press)
+        self.canvas.mpl_connect('motion_notify_event', self.on_motion)
+        self.canvas.mpl_connect('button_release_event', self.on_release)
         
         # 创建状态栏
         self.status_bar = ttk.Label(
@@ -67,124 +139,790 @@ class PlotArea:
     def plot_functions(self, functions: List[Dict], ranges: Dict[str, Tuple[float, float]], 
                       options: Dict[str, bool]):
         """
-        绘制所有函数
+        绘制所有函数（增量更新，数值计算在后台线程中进行）
+        
+        在主线程中确定哪些曲线需要重新采样、哪些特征点和交点需要重建，
+        把数值计算交给后台线程池，结果通过 after() 轮询回到主线程后再更新图形对象。
+        每次请求分配新的代号，过期请求的结果直接丢弃。
+        开启 plot_profiler 时，各阶段耗时记录在任务的 'timings' 中。
         
         Args:
             functions: 函数列表
             ranges: 绘图范围
             options: 显示选项
         """
+        timings = plot_profiler.new_frame()
         try:
-            # 获取范围
-            x_range = ranges['x_range']
-            y_range = ranges['y_range']
+            with plot_profiler.span("准备", timings):
+                job = self.prepare_plot_job(functions, ranges, options)
+        except Exception as e:
+            self.status_bar.config(text=f"错误: {str(e)}")
+            raise e
+        job['timings'] = timings
+        
+        if not ASYNC_COMPUTE:
+            self.apply_plot_result(job, self.compute_plot_job(job))
+            return
+        
+        # 尚未开始的旧请求不再需要计算
+        if self.pending_future is not None:
+            self.pending_future.cancel()
+        self.pending_future = self.executor.submit(self.compute_plot_job, job)
+        # 回调在工作线程中执行，只把结果放入队列，由主线程轮询取回
+        self.pending_future.add_done_callback(lambda future, job=job: self.result_queue.put((job, future)))
+        self.status_bar.config(text=f"⏳ 计算中… ({len(functions)} 个函数)")
+        if not self.polling:
+            self.polling = True
+            self.plot_frame.after(ASYNC_POLL_MS, self.poll_results)
+    
+    def prepare_plot_job(self, functions: List[Dict], ranges: Dict[str, Tuple[float, float]],
+                         options: Dict[str, bool]) -> Dict:
+        """
+        在主线程中生成绘图任务（只读取图形对象的状态，不做数值计算）
+        
+        Args:
+            functions: 函数列表
+            ranges: 绘图范围
+            options: 显示选项
             
-            # 设置坐标轴
-            PlotUtils.setup_axes(
-                self.ax, 
-                x_range[0], x_range[1], 
-                y_range[0], y_range[1],
-                chinese_font=self.font_manager.get_current_font()
+        Returns:
+            可交给后台线程计算的任务字典
+        """
+        self.generation += 1
+        x_range = tuple(ranges['x_range'])
+        y_range = tuple(ranges['y_range'])
+        view_changed = (x_range, y_range) != self.current_ranges
+        if not isinstance(functions, FunctionRecords):
+            # 函数存储的快照不会被修改，可以直接交给后台线程；其他列表复制一份
+            functions = [dict(func) for func in functions]
+        
+        keys = [self.get_function_key(func, i) for i, func in enumerate(functions)]
+        signatures = [(func['type'], tuple(func['params']), func['color']) for func in functions]
+        
+        # 新增、参数变化或视图变化的函数需要重新采样。
+        # 平移或缩小时旧视图的采样点精度足够，可以复用；放大时需要更细的采样，不复用。
+        # 启用瓦片缓存时由瓦片负责复用
+        reuse_samples = False
+        if view_changed and self.current_ranges is not None and self.tile_cache is None:
+            (old_x0, old_x1), (old_y0, old_y1) = self.current_ranges
+            reuse_samples = (x_range[1] - x_range[0] >= (old_x1 - old_x0) * (1 - 1e-9) and
+                             y_range[1] - y_range[0] >= (old_y1 - old_y0) * (1 - 1e-9) and
+                             self.get_axes_pixel_size() == self.current_pixel_size)
+        resample = []
+        seeds = {}
+        for i, (key, signature) in enumerate(zip(keys, signatures)):
+            entry = self.function_artists.get(key)
+            if entry is None or entry['signature'] != signature:
+                resample.append(i)
+            elif view_changed:
+                resample.append(i)
+                if reuse_samples:
+                    seeds[i] = entry['line'].get_data()
+        
+        # 极值点和零点只跟随最后一个函数
+        feature_signature = None
+        last_samples = None
+        if functions:
+            feature_signature = (
+                (keys[-1], signatures[-1]), x_range, y_range,
+                options.get('show_extrema', False),
+                options.get('show_roots', False),
             )
+            if len(functions) - 1 not in resample:
+                last_samples = self.function_artists[keys[-1]]['line'].get_data()
+        rebuild_features = feature_signature != self.feature_signature
+        
+        # 交点按函数对登记，键包含双方的ID、签名和视图范围
+        entries = list(zip(keys, signatures))
+        wanted = {}
+        if options.get('show_intersection', False) and len(functions) >= 2:
+            for i in range(len(entries)):
+                for j in range(i + 1, len(entries)):
+                    wanted[(entries[i], entries[j], x_range, y_range)] = (i, j)
+        missing = {pair: ij for pair, ij in wanted.items() if pair not in self.intersection_artists}
+        
+        # 参数扫描的曲线族只在扫描信息、x范围或像素宽度变化时重新采样
+        sweep_signature = None
+        if self.sweep is not None:
+            sweep_signature = (self.get_sweep_key(self.sweep), x_range, self.get_axes_pixel_size()[0])
+        
+        return {
+            'generation': self.generation,
+            'functions': functions,
+            'keys': keys,
+            'signatures': signatures,
+            'x_range': x_range,
+            'y_range': y_range,
+            'options': dict(options),
+            'pixel_size': self.get_axes_pixel_size(),
+            'resample': resample,
+            'seeds': seeds,
+            'last_samples': last_samples,
+            'feature_signature': feature_signature,
+            'rebuild_features': rebuild_features,
+            'wanted_pairs': set(wanted),
+            'missing_pairs': missing,
+            'sweep': dict(self.sweep) if self.sweep is not None else None,
+            'sweep_signature': sweep_signature,
+            'resample_sweep': sweep_signature is not None and sweep_signature != self.sweep_signature,
+        }
+    
+    def compute_plot_job(self, job: Dict) -> Dict:
+        """
+        执行绘图任务中的数值计算（在后台线程中运行，不访问任何图形对象）
+        
+        Args:
+            job: prepare_plot_job() 生成的任务
             
-            # 生成x坐标数组
-            x = np.linspace(x_range[0], x_range[1], PLOT_POINTS)
-            
-            # 创建数学计算器实例
-            calculator = MathFunctionCalculator()
-            
-            # 绘制所有函数
-            for i, func in enumerate(functions):
-                func_type = func['type']
-                a, b, c = func['params']
-                color = func['color']
-                
-                # 计算y值
-                y = calculator.get_function_values(x, func_type, a, b, c)
-                
-                # 生成函数表达式
-                expression = calculator.get_function_expression(func_type, a, b, c)
-                
-                # 绘制函数曲线
-                self.ax.plot(x, y, color + '-', linewidth=2, label=expression)
-                
-                # 如果是最后一个函数，保存其信息用于显示特征点
-                if i == len(functions) - 1:
-                    self.current_x = x
-                    self.current_y = y
-                    self.current_func_type = func_type
-                    self.current_params = (a, b, c)
-            
-            # 根据选项显示特征点
-            if options.get('show_extrema', False) and functions:
-                self.plot_extrema(x_range)
-            
-            if options.get('show_roots', False) and functions:
-                self.plot_roots(x_range)
-            
-            if options.get('show_intersection', False) and len(functions) >= 2:
-                PlotUtils.plot_intersections(
-                    self.ax, functions, x_range, y_range,
-                    self.font_manager.get_current_font()
+        Returns:
+            包含 samples、features、intersections、sweep 的结果字典
+        """
+        functions = job['functions']
+        x_range, y_range = job['x_range'], job['y_range']
+        timings = job.get('timings')
+        result = {'samples': {}, 'features': None, 'intersections': None, 'sweep': None}
+        
+        with plot_profiler.span("采样", timings):
+            # 有复用采样点的曲线逐条细分，其余曲线较多时批量求值
+            fresh = [i for i in job['resample'] if i not in job['seeds']]
+            for i in job['seeds']:
+                result['samples'][i] = self.sample_function(functions[i], x_range, y_range, job['pixel_size'],
+                                                            job['seeds'][i])
+            # 全部重新采样时直接传入原列表，保留函数存储快照中的分组
+            fresh_functions = functions if len(fresh) == len(functions) else [functions[i] for i in fresh]
+            samples = self.calculator.sample_curves(fresh_functions, x_range, y_range, *job['pixel_size'])
+            result['samples'].update(zip(fresh, samples))
+        
+        if job['resample_sweep']:
+            # 曲线族的全部成员在共享网格上一次批量求值
+            with plot_profiler.span("扫描", timings):
+                result['sweep'] = self.calculator.sample_sweep(job['sweep'], x_range, job['pixel_size'][0])
+        
+        if job['rebuild_features'] and functions:
+            last = functions[-1]
+            x, y = result['samples'].get(len(functions) - 1, job['last_samples'])
+            options = job['options']
+            features = {'extrema': None, 'roots': None}
+            if options.get('show_extrema', False):
+                with plot_profiler.span("极值点", timings):
+                    features['extrema'] = PlotUtils.compute_extrema(x, y, last['type'], last['params'], x_range)
+            if options.get('show_roots', False):
+                with plot_profiler.span("零点", timings):
+                    features['roots'] = PlotUtils.compute_roots(x, y, x_range, last['type'], last['params'])
+            result['features'] = features
+        
+        if job['missing_pairs']:
+            # 所有函数只求值一次，两两交点批量求解
+            with plot_profiler.span("交点", timings):
+                x, values = self.calculator.evaluate_on_grid(functions, x_range, PLOT_POINTS)
+                result['intersections'] = self.calculator.find_all_intersections(x, functions, values=values)
+        
+        return result
+    
+    def poll_results(self):
+        """在主线程中取回后台计算结果，丢弃过期的结果"""
+        while not self.result_queue.empty():
+            job, future = self.result_queue.get_nowait()
+            if job['generation'] != self.generation or future.cancelled():
+                continue
+            self.pending_future = None
+            try:
+                self.apply_plot_result(job, future.result())
+            except Exception as e:
+                self.status_bar.config(text=f"错误: {str(e)}")
+                print(f"绘图错误: {e}")
+        
+        if self.pending_future is not None:
+            self.plot_frame.after(ASYNC_POLL_MS, self.poll_results)
+        else:
+            self.polling = False
+            # 计算期间积累的重绘请求
+            if self.dirty_parts:
+                self.schedule_flush()
+    
+    def apply_plot_result(self, job: Dict, result: Dict):
+        """
+        根据计算结果更新图形对象并重绘（在主线程中运行）
+        
+        Args:
+            job: 绘图任务
+            result: compute_plot_job() 的结果
+        """
+        functions = job['functions']
+        x_range, y_range, options = job['x_range'], job['y_range'], job['options']
+        timings = job.get('timings')
+        chinese_font = self.font_manager.get_current_font()
+        
+        # 首次绘制时完整设置坐标轴，之后只原地更新范围
+        with plot_profiler.span("坐标轴", timings):
+            if not self.axes_ready:
+                PlotUtils.setup_axes(
+                    self.ax, 
+                    x_range[0], x_range[1], 
+                    y_range[0], y_range[1],
+                    chinese_font=chinese_font
                 )
+                self.axes_ready = True
+                self.current_font = chinese_font
+            elif (x_range, y_range) != self.current_ranges:
+                PlotUtils.update_axes_limits(self.ax, x_range[0], x_range[1], y_range[0], y_range[1])
+        self.current_ranges = (x_range, y_range)
+        self.current_pixel_size = job['pixel_size']
+        self.current_options = dict(options)
+        
+        with plot_profiler.span("曲线", timings):
+            self.update_function_lines(job, result['samples'])
+            self.update_sweep(job, result['sweep'], chinese_font)
+        with plot_profiler.span("标注", timings):
+            if job['rebuild_features']:
+                self.update_feature_points(job, result['features'], chinese_font)
+            self.update_intersection_points(job, result['intersections'], chinese_font)
+            self.update_grid_points(x_range, y_range, options)
+        with plot_profiler.span("图例", timings):
+            self.update_legend(functions)
+            if chinese_font != self.current_font:
+                self.update_fonts()
+        
+        # 更新画布显示
+        with plot_profiler.span("绘制", timings):
+            self.canvas.draw()
+        
+        status = f"已绘制 {len(functions)} 个函数"
+        if job['sweep'] is not None:
+            status += f"，扫描 {job['sweep']['steps']} 条曲线"
+        if timings is not None:
+            plot_profiler.finish_frame(timings)
+            if PROFILE_STATUS_READOUT:
+                status += f"  ⏱️ {plot_profiler.format_frame(timings)}  |  {plot_profiler.format_summary()}"
+        self.status_bar.config(text=status)
+    
+    def toggle_profiling(self) -> bool:
+        """
+        开启或关闭各阶段耗时记录
+        
+        Returns:
+            切换后是否开启
+        """
+        enabled = not plot_profiler.enabled
+        plot_profiler.set_enabled(enabled)
+        self.status_bar.config(text="⏱️ 已开启绘图耗时记录" if enabled else "已关闭绘图耗时记录")
+        return enabled
+    
+    def dump_trace(self, filename: str = PROFILE_TRACE_FILE) -> Tuple[bool, str]:
+        """
+        将记录的各阶段耗时导出为 Chrome trace JSON
+        
+        Args:
+            filename: 输出文件路径
             
-            if options.get('show_grid_points', False):
-                PlotUtils.plot_grid_points(self.ax, x_range, y_range)
+        Returns:
+            (成功标志, 消息)
+        """
+        success, message = plot_profiler.dump_chrome_trace(filename)
+        self.status_bar.config(text=message)
+        return success, message
+    
+    def sample_function(self, func: Dict, x_range: Tuple[float, float],
+                        y_range: Tuple[float, float], pixel_size: Tuple[int, int],
+                        seed: Tuple[np.ndarray, np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        计算函数在当前视图中的采样点
+        
+        Args:
+            func: 函数信息
+            x_range: x轴范围
+            y_range: y轴范围
+            pixel_size: 坐标轴区域的像素尺寸
+            seed: 相邻视图中的采样点（可选）
             
-            # 添加图例
-            self.ax.legend(loc='best', prop={
-                'family': self.font_manager.get_current_font(), 
-                'size': 9
-            })
+        Returns:
+            (x, y) 只读采样点数组
+        """
+        # 结果按 (函数类型, 参数, 网格) 缓存，未改变的函数重绘时无需重新求值
+        pixel_width, pixel_height = pixel_size
+        return self.calculator.sample_curve(func, x_range, y_range, pixel_width, pixel_height, seed=seed)
+    
+    def update_function_lines(self, job: Dict, samples: Dict[int, Tuple[np.ndarray, np.ndarray]]):
+        """
+        同步函数曲线与注册表
+        
+        Args:
+            job: 绘图任务
+            samples: 需要更新的曲线的采样点 {函数位置: (x, y)}
+        """
+        functions, keys = job['functions'], job['keys']
+        
+        # 移除已删除函数的曲线
+        for key in set(self.function_artists) - set(keys):
+            self.function_artists.pop(key)['line'].remove()
+        
+        for i, (key, func) in enumerate(zip(keys, functions)):
+            func_type = func['type']
+            a, b, c = func['params']
+            color = func['color']
             
-            # 更新画布显示
-            self.canvas.draw()
-            self.status_bar.config(text=f"已绘制 {len(functions)} 个函数")
+            if i in samples:
+                x, y = samples[i]
+                expression = self.calculator.get_function_expression(func_type, a, b, c)
+                entry = self.function_artists.get(key)
+                
+                if entry is None:
+                    line = PlotUtils.plot_function_curve(self.ax, x, y, color, expression)
+                    self.function_artists[key] = {'line': line, 'signature': job['signatures'][i]}
+                else:
+                    line = entry['line']
+                    line.set_data(x, y)
+                    line.set_color(color)
+                    line.set_label(expression)
+                    entry['signature'] = job['signatures'][i]
+    
+    def set_sweep(self, sweep: Dict = None):
+        """
+        设置或移除参数扫描（调用方随后应请求重绘）
         
-        except Exception as e:
-            self.status_bar.config(text=f"错误: {str(e)}")
-            raise e
+        Args:
+            sweep: 扫描信息（type、params、param、start、stop、steps），None表示移除
+        """
+        self.sweep = dict(sweep) if sweep is not None else None
     
-    def plot_extrema(self, x_range: Tuple[float, float]):
-        """绘制极值点"""
-        if hasattr(self, 'current_func_type'):
-            PlotUtils.plot_extrema_points(
-                self.ax, 
-                self.current_x, 
-                self.current_y, 
-                self.current_func_type,
-                self.current_params,
-                x_range,
-                self.font_manager.get_current_font()
-            )
+    @staticmethod
+    def get_sweep_key(sweep: Dict) -> Tuple:
+        """获取扫描信息的签名"""
+        return (sweep['type'], tuple(sweep['params']), sweep['param'],
+                sweep['start'], sweep['stop'], int(sweep['steps']))
     
-    def plot_roots(self, x_range: Tuple[float, float]):
-        """绘制零点"""
-        if hasattr(self, 'current_y'):
-            PlotUtils.plot_roots(
-                self.ax, 
-                self.current_x, 
-                self.current_y, 
-                x_range,
-                self.font_manager.get_current_font()
+    def update_sweep(self, job: Dict, samples: Tuple[np.ndarray, np.ndarray], chinese_font: str):
+        """
+        同步参数扫描的曲线族：首次绘制时创建 LineCollection 和颜色条，之后原地更新
+        
+        Args:
+            job: 绘图任务
+            samples: 后台求出的 (x, values)，曲线族无需重新采样时为None
+            chinese_font: 中文字体
+        """
+        if job['sweep_signature'] is None:
+            # 扫描已移除；颜色条移除后绘图区域恢复原来的大小
+            if self.sweep_artists is not None:
+                collection, colorbar = self.sweep_artists
+                colorbar.remove()
+                collection.remove()
+                self.sweep_artists = None
+            self.sweep_signature = None
+            return
+        if samples is None:
+            return
+        
+        self.sweep_signature = job['sweep_signature']
+        sweep = job['sweep']
+        x, values = samples
+        sweep_values = self.calculator.get_sweep_values(sweep)
+        label = f"参数 {sweep['param']}"
+        if self.sweep_artists is None:
+            self.sweep_artists = PlotUtils.plot_sweep(self.ax, x, values, sweep_values, label, chinese_font)
+        else:
+            collection, colorbar = self.sweep_artists
+            PlotUtils.update_sweep(collection, colorbar, x, values, sweep_values, label, chinese_font)
+    
+    def update_feature_points(self, job: Dict, features: Dict, chinese_font: str):
+        """
+        重建极值点和零点标注
+        
+        Args:
+            job: 绘图任务
+            features: 后台求出的 extrema、roots（未显示的项为None），没有函数时为None
+            chinese_font: 中文字体
+        """
+        self.feature_signature = job['feature_signature']
+        
+        for artist in self.feature_artists:
+            artist.remove()
+        self.feature_artists = []
+        
+        # 根据选项显示特征点
+        if features is None:
+            return
+        if features['extrema'] is not None:
+            last = job['functions'][-1]
+            self.feature_artists += PlotUtils.draw_extrema_points(
+                self.ax, features['extrema'], last['type'], chinese_font)
+        if features['roots'] is not None:
+            self.feature_artists += PlotUtils.draw_roots(self.ax, features['roots'], chinese_font)
+    
+    def update_intersection_points(self, job: Dict, intersections, chinese_font: str):
+        """
+        按函数对增量更新交点标注
+        
+        Args:
+            job: 绘图任务
+            intersections: 后台求出的交点结构化数组，没有新的函数对时为None
+            chinese_font: 中文字体
+        """
+        for pair in set(self.intersection_artists) - job['wanted_pairs']:
+            for artist in self.intersection_artists.pop(pair):
+                artist.remove()
+        
+        if intersections is None:
+            return
+        
+        # 只为新的函数对创建标注
+        for pair, (i, j) in job['missing_pairs'].items():
+            points = intersections[(intersections['i'] == i) & (intersections['j'] == j)]
+            self.intersection_artists[pair] = PlotUtils.draw_intersection_points(
+                self.ax, points, job['x_range'], job['y_range'], chinese_font
             )
     
+    def update_grid_points(self, x_range: Tuple[float, float], y_range: Tuple[float, float],
+                           options: Dict[str, bool]):
+        """在范围或选项变化时重建坐标网格点"""
+        show = options.get('show_grid_points', False)
+        pixel_size = self.get_axes_pixel_size()
+        signature = (x_range, y_range, pixel_size) if show else None
+        if signature == self.grid_signature:
+            return
+        self.grid_signature = signature
+        
+        for artist in self.grid_artists:
+            artist.remove()
+        self.grid_artists = []
+        if show:
+            self.grid_artists = PlotUtils.plot_grid_points(self.ax, x_range, y_range, pixel_size)
+    
+    def update_legend(self, functions: List[Dict]):
+        """在曲线集合或标签变化时重建图例"""
+        handles = [self.function_artists[self.get_function_key(func, i)]['line']
+                   for i, func in enumerate(functions)]
+        signature = tuple((id(line), line.get_label()) for line in handles)
+        if signature == self.legend_signature:
+            return
+        self.legend_signature = signature
+        
+        # 添加图例
+        self.legend = PlotUtils.add_legend(self.ax, handles, self.font_manager.get_current_font())
+    
+    def update_fonts(self):
+        """原地更新标题、特征点标注和图例的字体，不重建任何图形对象"""
+        chinese_font = self.font_manager.get_current_font()
+        self.current_font = chinese_font
+        
+        texts = [self.ax.title]
+        feature_artists = list(self.feature_artists)
+        for artists in self.intersection_artists.values():
+            feature_artists += artists
+        texts += [artist for artist in feature_artists if hasattr(artist, 'set_fontfamily')]
+        if self.legend is not None:
+            texts += self.legend.get_texts()
+        if self.sweep_artists is not None:
+            texts.append(self.sweep_artists[1].ax.yaxis.label)
+        PlotUtils.update_text_font(texts, chinese_font)
+    
+    def get_view_ranges(self) -> Dict[str, Tuple[float, float]]:
+        """
+        获取当前视图范围（包括已请求但尚未绘制的范围）
+        
+        Returns:
+            {'x_range': (x_min, x_max), 'y_range': (y_min, y_max)}
+        """
+        if self.redraw_ranges is not None:
+            return dict(self.redraw_ranges)
+        if self.current_ranges is not None:
+            return {'x_range': self.current_ranges[0], 'y_range': self.current_ranges[1]}
+        return {'x_range': DEFAULT_X_RANGE, 'y_range': DEFAULT_Y_RANGE}
+    
+    def set_view(self, x_range: Tuple[float, float], y_range: Tuple[float, float]):
+        """
+        改变视图范围：坐标轴立即更新，曲线按新范围的像素分辨率重新采样
+        
+        Args:
+            x_range: 新的x轴范围
+            y_range: 新的y轴范围
+        """
+        if not self.axes_ready:
+            return
+        x_range = self.clamp_span(x_range)
+        y_range = self.clamp_span(y_range)
+        PlotUtils.update_axes_limits(self.ax, x_range[0], x_range[1], y_range[0], y_range[1])
+        self.canvas.draw_idle()
+        self.request_redraw(('curves', 'features', 'legend'),
+                            ranges={'x_range': x_range, 'y_range': y_range})
+    
+    @staticmethod
+    def clamp_span(value_range: Tuple[float, float]) -> Tuple[float, float]:
+        """把范围宽度限制在 [MIN_VIEW_SPAN, MAX_VIEW_SPAN] 内，保持中心不变"""
+        low, high = float(value_range[0]), float(value_range[1])
+        span = min(max(high - low, MIN_VIEW_SPAN), MAX_VIEW_SPAN)
+        center = (low + high) / 2
+        return (center - span / 2, center + span / 2)
+    
+    def on_scroll(self, event):
+        """鼠标滚轮以光标为中心缩放"""
+        if event.inaxes is not self.ax or self.scrub_key is not None:
+            return
+        factor = 1 / ZOOM_STEP if event.button == 'up' else ZOOM_STEP
+        (x_min, x_max), (y_min, y_max) = self.ax.get_xlim(), self.ax.get_ylim()
+        x, y = event.xdata, event.ydata
+        self.set_view((x + (x_min - x) * factor, x + (x_max - x) * factor),
+                      (y + (y_min - y) * factor, y + (y_max - y) * factor))
+    
+    def on_press(self, event):
+        """左键按下开始平移，双击恢复默认范围"""
+        if event.inaxes is not self.ax or event.button != 1 or self.scrub_key is not None:
+            return
+        if event.dblclick:
+            self.pan_start = None
+            self.set_view(DEFAULT_X_RANGE, DEFAULT_Y_RANGE)
+            return
+        self.pan_start = ((event.x, event.y), self.ax.get_xlim(), self.ax.get_ylim())
+    
+    def on_motion(self, event):
+        """拖动时按像素位移平移视图"""
+        if self.pan_start is None:
+            return
+        (start_x, start_y), (x_min, x_max), (y_min, y_max) = self.pan_start
+        pixel_width, pixel_height = self.get_axes_pixel_size()
+        # 使用像素坐标计算位移，避免数据坐标随视图移动而反馈
+        dx = (event.x - start_x) * (x_max - x_min) / pixel_width
+        dy = (event.y - start_y) * (y_max - y_min) / pixel_height
+        self.set_view((x_min - dx, x_max - dx), (y_min - dy, y_max - dy))
+    
+    def on_release(self, event):
+        """松开鼠标结束平移"""
+        self.pan_start = None
+    
+    def refresh_fonts(self):
+        """字体更改后刷新画布（经由重绘调度器，同一帧内的多次请求只刷新一次）"""
+        self.request_redraw(('fonts',))
+    
+    def redraw(self, functions: List[Dict]):
+        """使用上一次的范围和显示选项重新绘制"""
+        self.request_redraw(('curves', 'features', 'legend'), functions)
+    
+    def request_redraw(self, parts=REDRAW_PARTS, functions: List[Dict] = None,
+                       ranges: Dict[str, Tuple[float, float]] = None, options: Dict[str, bool] = None):
+        """
+        标记需要重绘的部分，由调度器合并后每帧最多执行一次最小重绘
+        
+        同一帧内的多次请求只保留最新的函数列表、范围和选项；
+        上一次的后台计算尚未完成时，新的请求会合并到计算完成后的下一帧。
+        
+        Args:
+            parts: 需要重绘的部分，取自 REDRAW_PARTS（curves、features、legend、fonts）
+            functions: 函数列表（可选，默认沿用上一次的）
+            ranges: 绘图范围（可选，默认沿用上一次的）
+            options: 显示选项（可选，默认沿用上一次的）
+        """
+        if functions is not None:
+            self.redraw_functions = functions if isinstance(functions, FunctionRecords) else list(functions)
+        if ranges is not None:
+            self.redraw_ranges = dict(ranges)
+        if options is not None:
+            self.redraw_options = dict(options)
+        self.dirty_parts.update(parts)
+        self.schedule_flush()
+    
+    def schedule_flush(self):
+        """在下一帧安排一次重绘，已安排时不重复安排"""
+        if self.flush_job is not None:
+            return
+        elapsed_ms = (time.perf_counter() - self.last_flush_time) * 1000
+        delay = int(max(0, REDRAW_FRAME_MS - elapsed_ms))
+        self.flush_job = self.plot_frame.after(delay, self.flush_redraw)
+    
+    def flush_redraw(self):
+        """执行合并后的重绘：只重绘被标记的部分"""
+        self.flush_job = None
+        if not self.dirty_parts:
+            return
+        # 后台计算进行中时不再提交新任务，结果应用后由 poll_results 重新安排
+        if self.pending_future is not None:
+            return
+        
+        self.last_flush_time = time.perf_counter()
+        parts, self.dirty_parts = self.dirty_parts, set()
+        
+        if parts & {'curves', 'features'}:
+            ranges = self.redraw_ranges
+            if ranges is None and self.current_ranges is not None:
+                ranges = {'x_range': self.current_ranges[0], 'y_range': self.current_ranges[1]}
+            if ranges is None:
+                return
+            # 增量绘制会同时处理图例和字体
+            self.plot_functions(self.redraw_functions, ranges, self.redraw_options or self.current_options)
+            return
+        
+        if not self.axes_ready:
+            return
+        if 'legend' in parts:
+            self.update_legend(self.redraw_functions)
+        if 'fonts' in parts:
+            self.update_fonts()
+            self.status_bar.config(text=f"字体已更新: {self.current_font}")
+        self.canvas.draw_idle()
+    
+    def begin_scrub(self, func: Dict, index: int) -> bool:
+        """
+        开始实时调节某个函数
+        
+        该函数的曲线和特征点标记设为 animated，其余内容绘制一次后缓存为背景，
+        之后每帧只恢复背景并重绘变化的曲线和标记。
+        
+        Args:
+            func: 函数信息
+            index: 函数在列表中的位置
+            
+        Returns:
+            是否成功进入实时调节状态
+        """
+        key = self.get_function_key(func, index)
+        if self.scrub_key == key:
+            return True
+        # 等待尚未执行的重绘和尚未应用的后台计算结果，避免其覆盖调节中的曲线
+        if self.pending_future is not None or self.flush_job is not None:
+            return False
+        self.end_scrub()
+        
+        entry = self.function_artists.get(key)
+        if entry is None:
+            return False
+        
+        self.scrub_key = key
+        entry['line'].set_animated(True)
+        
+        # 该函数的静态特征点和交点标注在调节过程中会过时，暂时隐藏
+        self.scrub_hidden = list(self.feature_artists)
+        for pair, artists in self.intersection_artists.items():
+            if pair[0][0] == key or pair[1][0] == key:
+                self.scrub_hidden += artists
+        for artist in self.scrub_hidden:
+            artist.set_visible(False)
+        
+        # 只为显示选项中开启的特征点创建标记
+        if self.current_options.get('show_extrema', False):
+            self.scrub_markers['extrema'], = self.ax.plot([], [], 'ro', markersize=6, animated=True)
+        if self.current_options.get('show_roots', False):
+            self.scrub_markers['roots'], = self.ax.plot([], [], 'go', markersize=8, animated=True)
+        
+        # 完整绘制一次，on_canvas_draw 会缓存背景
+        self.canvas.draw()
+        return True
+    
+    def scrub_function(self, func: Dict, index: int, params: Tuple[float, float, float]):
+        """
+        实时调节时更新函数曲线（只重绘变化的部分）
+        
+        Args:
+            func: 函数信息
+            index: 函数在列表中的位置
+            params: 新的函数参数 (a, b, c)
+        """
+        if self.current_ranges is None or not self.begin_scrub(func, index):
+            return
+        x_range, y_range = self.current_ranges
+        preview = dict(func, params=tuple(params))
+        
+        # 调节过程中的中间参数不写入求值缓存，避免挤掉常用条目
+        pixel_width, pixel_height = self.get_axes_pixel_size()
+        x, y = self.calculator.sample_curve(preview, x_range, y_range, pixel_width, pixel_height,
+                                            use_cache=False)
+        line = self.function_artists[self.scrub_key]['line']
+        line.set_data(x, y)
+        
+        # 特征点标记（未显示的特征点不计算）
+        if 'extrema' in self.scrub_markers:
+            extrema = PlotUtils.compute_extrema(x, y, preview['type'], preview['params'], x_range)
+            self.scrub_markers['extrema'].set_data(extrema['x'], extrema['y'])
+        if 'roots' in self.scrub_markers:
+            roots = PlotUtils.compute_roots(x, y, x_range, preview['type'], preview['params'])
+            self.scrub_markers['roots'].set_data(roots, np.zeros(len(roots)))
+        
+        self.blit_scrub_artists()
+    
+    def blit_scrub_artists(self):
+        """恢复缓存的背景并只绘制实时调节中的图形对象"""
+        if self.scrub_key is None or self.scrub_background is None:
+            return
+        self.canvas.restore_region(self.scrub_background)
+        self.ax.draw_artist(self.function_artists[self.scrub_key]['line'])
+        for marker in self.scrub_markers.values():
+            self.ax.draw_artist(marker)
+        self.canvas.blit(self.ax.bbox)
+    
+    def on_canvas_draw(self, event):
+        """完整重绘后（包括窗口缩放）重新缓存实时调节的背景"""
+        if self.scrub_key is None:
+            return
+        self.scrub_background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self.blit_scrub_artists()
+    
+    def end_scrub(self):
+        """结束实时调节，恢复静态绘制状态（调用方随后应执行一次完整重绘）"""
+        if self.scrub_key is None:
+            return
+        entry = self.function_artists.get(self.scrub_key)
+        if entry is not None:
+            entry['line'].set_animated(False)
+            # 使签名失效，下次绘制时按最终参数重新采样并更新图例
+            entry['signature'] = None
+        for marker in self.scrub_markers.values():
+            marker.remove()
+        for artist in self.scrub_hidden:
+            artist.set_visible(True)
+        self.scrub_key = None
+        self.scrub_background = None
+        self.scrub_markers = {}      # 特征点名称（extrema、roots）-> 动画标记
+        self.scrub_hidden = []
+    
+    @staticmethod
+    def get_function_key(func: Dict, index: int):
+        """获取函数在注册表中的键：优先使用稳定ID，没有ID时退回到列表位置"""
+        return func.get('id', ('index', index))
+    
+    def get_axes_pixel_size(self) -> Tuple[int, int]:
+        """
+        获取坐标轴区域的像素尺寸
+        
+        Returns:
+            (宽度, 高度)
+        """
+        bbox = self.ax.get_window_extent()
+        return max(int(bbox.width), 1), max(int(bbox.height), 1)
+    
     def clear_plot(self):
         """清除所有图形和数据"""
+        self.end_scrub()
+        # 使尚未返回的后台计算结果过期，取消已安排的重绘
+        self.generation += 1
+        self.dirty_parts = set()
+        self.redraw_functions = []
+        self.redraw_ranges = None
+        if self.flush_job is not None:
+            self.plot_frame.after_cancel(self.flush_job)
+            self.flush_job = None
+        if self.pending_future is not None:
+            self.pending_future.cancel()
+            self.pending_future = None
+        # 颜色条位于单独的坐标轴中，需先移除以恢复绘图区域的大小
+        if self.sweep_artists is not None:
+            self.sweep_artists[1].remove()
         self.ax.clear()
         self.setup_axes_style()
         self.canvas.draw()
         self.status_bar.config(text="图形已清除")
         
-        # 清除当前函数信息
-        if hasattr(self, 'current_x'):
-            delattr(self, 'current_x')
-        if hasattr(self, 'current_y'):
-            delattr(self, 'current_y')
-        if hasattr(self, 'current_func_type'):
-            delattr(self, 'current_func_type')
-        if hasattr(self, 'current_params'):
-            delattr(self, 'current_params')
+        # 重置图形对象注册表，下次绘制时完整设置坐标轴
+        self.function_artists = {}
+        self.feature_artists = []
+        self.intersection_artists = {}
+        self.grid_artists = []
+        self.legend = None
+        self.axes_ready = False
+        self.current_ranges = None
+        self.current_pixel_size = None
+        self.feature_signature = None
+        self.grid_signature = None
+        self.legend_signature = None
+        self.sweep = None
+        self.sweep_artists = None
+        self.sweep_signature = None
     
     def save_plot(self, filename: str = None) -> Tuple[bool, str]:
         """
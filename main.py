@@ -11,8 +11,12 @@ import platform # Added
 # 添加项目根目录到路径
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# 启动计时从这里开始，各阶段耗时在绘图组件加载完成后输出
+from utils.profiling import startup_timer
+
 try:
-    from gui.main_window import MathVisualizerApp
+    with startup_timer.phase("导入界面模块"):
+        from gui.main_window import MathVisualizerApp
 except ImportError as e:
     print(f"导入模块失败: {e}")
     sys.exit(1)
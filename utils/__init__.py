@@ -3,5 +3,17 @@
 工具模块初始化文件
 """
 
-from .plot_utils import PlotUtils
-from .math_utils import MathUtils
+# 按需导入：子模块依赖 numpy/matplotlib，延迟到首次访问时加载以加快启动
+_LAZY_EXPORTS = {
+    'PlotUtils': '.plot_utils',
+    'MathUtils': '.math_utils',
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        from importlib import import_module
+        return getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+"""
+批量渲染模块 - 无界面地读取函数清单并并行输出图像
+
+只使用 matplotlib 的 Figure + Agg 画布，不导入 tkinter；
+坐标轴、特征点标注和保存逻辑与图形界面共用 PlotUtils。
+"""
+
+import os
+import csv
+import json
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Tuple
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from config.settings import (
+    FIGURE_SIZE, FIGURE_DPI, FIGURE_FACECOLOR, AXES_FACECOLOR,
+    DEFAULT_X_RANGE, DEFAULT_Y_RANGE, FUNCTION_COLORS, BATCH_OUTPUT_FORMATS
+)
+from utils.plot_utils import PlotUtils
+from utils.math_utils import MathUtils
+from core.math_functions import MathFunctionCalculator
+from core.function_registry import ExpressionFamily
+from core.fused_evaluator import FusedEvaluator
+
+# 默认显示选项（与控制面板"添加函数"一致）
+DEFAULT_BATCH_OPTIONS = {
+    'show_extrema': True,
+    'show_roots': True,
+    'show_intersection': True,
+    'show_grid_points': False,
+}
+
+# 每个工作进程各自初始化一次的字体
+_worker_font = None
+
+
+class BatchRenderer:
+    """批量渲染器类"""
+
+    @staticmethod
+    def load_manifest(path: str) -> List[Dict]:
+        """
+        读取函数清单
+
+        JSON 清单可以是任务列表，或 {"defaults": {...}, "jobs": [...]}；
+        每个任务包含 output、functions（type、a、b、c、color）、x_range、y_range、
+        options 和 title，也可以直接在任务中写单个函数的 type、a、b、c。
+        函数写 expression（如 "x**3 - sin(2*x)/x"）时按自定义函数绘制，忽略 type。
+
+        CSV 清单每行一个函数，列为 output、type、a、b、c，可选列为 expression、color、
+        x_min、x_max、y_min、y_max、title 以及各显示选项；output 相同的行合并为一张图。
+
+        Args:
+            path: 清单文件路径（.json 或 .csv）
+
+        Returns:
+            规范化后的任务列表
+        """
+        if path.lower().endswith('.csv'):
+            return BatchRenderer._load_csv(path)
+
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+
+        defaults = {}
+        if isinstance(manifest, dict):
+            defaults = manifest.get('defaults', {})
+            manifest = manifest.get('jobs', [])
+
+        jobs = []
+        for index, raw in enumerate(manifest):
+            job = dict(defaults)
+            job.update(raw)
+            job['options'] = dict(DEFAULT_BATCH_OPTIONS, **defaults.get('options', {}), **raw.get('options', {}))
+            if 'functions' not in raw:
+                job['functions'] = [{key: raw[key] for key in ('type', 'expression', 'a', 'b', 'c', 'color') if key in raw}]
+            job.setdefault('output', f"plot_{index + 1:04d}")
+            jobs.append(BatchRenderer._normalize_job(job))
+        return jobs
+
+    @staticmethod
+    def _load_csv(path: str) -> List[Dict]:
+        """读取 CSV 清单，按 output 列分组"""
+        groups = {}
+        with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+            for index, row in enumerate(csv.DictReader(f)):
+                row = {key.strip(): value.strip() for key, value in row.items()
+                       if key is not None and value not in (None, '')}
+                output = row.get('output', f"plot_{index + 1:04d}")
+                job = groups.get(output)
+                if job is None:
+                    job = {'output': output, 'functions': [], 'options': dict(DEFAULT_BATCH_OPTIONS)}
+                    if 'x_min' in row and 'x_max' in row:
+                        job['x_range'] = (row['x_min'], row['x_max'])
+                    if 'y_min' in row and 'y_max' in row:
+                        job['y_range'] = (row['y_min'], row['y_max'])
+                    if 'title' in row:
+                        job['title'] = row['title']
+                    for option in DEFAULT_BATCH_OPTIONS:
+                        if option in row:
+                            job['options'][option] = row[option].lower() in ('1', 'true', 'yes', 'y')
+                    groups[output] = job
+                job['functions'].append({key: row[key] for key in ('type', 'expression', 'a', 'b', 'c', 'color') if key in row})
+        return [BatchRenderer._normalize_job(job) for job in groups.values()]
+
+    @staticmethod
+    def _normalize_job(job: Dict) -> Dict:
+        """将任务中的数值、范围和颜色转换为统一格式"""
+        functions = []
+        for index, func in enumerate(job.get('functions', [])):
+            func_type = func.get('type', "二次函数")
+            if func.get('expression'):
+                func_type = ExpressionFamily.make_type(func['expression'])
+            functions.append({
+                'type': func_type,
+                'params': (float(func.get('a', 1.0)), float(func.get('b', 0.0)), float(func.get('c', 0.0))),
+                'color': func.get('color', FUNCTION_COLORS[index % len(FUNCTION_COLORS)]),
+            })
+        return {
+            'output': str(job['output']),
+            'functions': functions,
+            'x_range': tuple(float(v) for v in job.get('x_range', DEFAULT_X_RANGE)),
+            'y_range': tuple(float(v) for v in job.get('y_range', DEFAULT_Y_RANGE)),
+            'options': dict(job.get('options', DEFAULT_BATCH_OPTIONS)),
+            'title': job.get('title', "数学函数可视化"),
+        }
+
+    @staticmethod
+    def resolve_output_path(output: str, output_dir: str = None, image_format: str = 'png') -> str:
+        """
+        确定输出文件路径，未写扩展名时使用指定格式
+
+        Args:
+            output: 任务中的输出文件名
+            output_dir: 输出目录（可选）
+            image_format: 默认图像格式
+
+        Returns:
+            输出文件路径
+        """
+        extension = os.path.splitext(output)[1].lower().lstrip('.')
+        if extension not in BATCH_OUTPUT_FORMATS:
+            output = f"{output}.{image_format}"
+        if output_dir and not os.path.isabs(output):
+            output = os.path.join(output_dir, output)
+        return output
+
+    @staticmethod
+    def render_job(job: Dict, filename: str, chinese_font: str = "DejaVu Sans") -> Tuple[bool, str]:
+        """
+        渲染单个任务并保存图像
+
+        Args:
+            job: 规范化后的任务
+            filename: 输出文件路径
+            chinese_font: 中文字体
+
+        Returns:
+            (成功标志, 消息)
+        """
+        functions = job['functions']
+        if not functions:
+            return False, f"{filename}: 没有函数"
+        for func in functions:
+            is_valid, error_msg = MathUtils.validate_function_parameters(func['type'], *func['params'])
+            if not is_valid:
+                return False, f"{filename}: {error_msg}"
+
+        x_range, y_range, options = job['x_range'], job['y_range'], job['options']
+
+        # 与绘图区域相同的图形设置，但直接使用 Agg 画布
+        fig = Figure(figsize=FIGURE_SIZE, dpi=FIGURE_DPI, facecolor=FIGURE_FACECOLOR)
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot(111, facecolor=AXES_FACECOLOR)
+        PlotUtils.setup_axes(ax, x_range[0], x_range[1], y_range[0], y_range[1],
+                             title=job['title'], chinese_font=chinese_font)
+        bbox = ax.get_window_extent()
+        pixel_width, pixel_height = int(bbox.width), int(bbox.height)
+
+        calculator = MathFunctionCalculator()
+        handles = []
+        for func in functions:
+            x, y = calculator.sample_curve(func, x_range, y_range, pixel_width, pixel_height)
+            expression = calculator.get_function_expression(func['type'], *func['params'])
+            handles.append(PlotUtils.plot_function_curve(ax, x, y, func['color'], expression))
+
+        # 极值点和零点跟随最后一个函数，与图形界面一致
+        last = functions[-1]
+        if options.get('show_extrema', False):
+            PlotUtils.plot_extrema_points(ax, x, y, last['type'], last['params'], x_range, chinese_font)
+        if options.get('show_roots', False):
+            PlotUtils.plot_roots(ax, x, y, x_range, chinese_font, last['type'], last['params'])
+        if options.get('show_intersection', False):
+            PlotUtils.plot_intersections(ax, functions, x_range, y_range, chinese_font, calculator)
+        if options.get('show_grid_points', False):
+            PlotUtils.plot_grid_points(ax, x_range, y_range, (pixel_width, pixel_height))
+        PlotUtils.add_legend(ax, handles, chinese_font)
+
+        directory = os.path.dirname(filename)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        return PlotUtils.save_plot(fig, filename)
+
+    @staticmethod
+    def _init_worker(fused_threads: int = None) -> None:
+        """
+        工作进程初始化：每个进程只配置一次中文字体
+
+        Args:
+            fused_threads: numexpr 的线程数（多进程时为1，避免线程数超过CPU核数）
+        """
+        global _worker_font
+        FusedEvaluator.set_threads(fused_threads)
+        from core.font_manager import FontManager
+        _worker_font = FontManager().get_current_font()
+
+    @staticmethod
+    def _render_in_worker(job: Dict, filename: str) -> Tuple[bool, str]:
+        """在工作进程中渲染任务，异常转换为失败消息"""
+        try:
+            return BatchRenderer.render_job(job, filename, _worker_font or "DejaVu Sans")
+        except Exception as e:
+            return False, f"{filename}: {e}"
+
+    @staticmethod
+    def render_all(jobs: List[Dict], output_dir: str = None, image_format: str = 'png',
+                   workers: int = None) -> List[Tuple[bool, str]]:
+        """
+        使用进程池并行渲染全部任务
+
+        Args:
+            jobs: 任务列表
+            output_dir: 输出目录（可选）
+            image_format: 未指定扩展名时的图像格式（png 或 svg）
+            workers: 工作进程数，None 表示使用CPU核数，1 表示在当前进程中顺序渲染
+
+        Returns:
+            与任务顺序对应的 (成功标志, 消息) 列表
+        """
+        filenames = [BatchRenderer.resolve_output_path(job['output'], output_dir, image_format)
+                     for job in jobs]
+
+        if workers == 1 or len(jobs) <= 1:
+            BatchRenderer._init_worker()
+            return [BatchRenderer._render_in_worker(job, filename)
+                    for job, filename in zip(jobs, filenames)]
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=BatchRenderer._init_worker,
+                                 initargs=(1,)) as executor:
+            # 每个进程一次领取多个任务，减少进程间通信
+            chunksize = max(1, len(jobs) // (4 * (workers or os.cpu_count() or 1)))
+            return list(executor.map(BatchRenderer._render_in_worker, jobs, filenames,
+                                     chunksize=chunksize))
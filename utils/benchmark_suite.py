@@ -0,0 +1,449 @@
+# -*- coding: utf-8 -*-
+"""
+基准测试模块 - 无界面地测量求值、特征点、交点、网格点和绘图流程的耗时与内存
+
+绘图只使用 Agg 画布；测试结果是可以直接写成JSON的字典，
+可以保存为基准，之后的运行与基准逐项比较，找出变慢或占用更多内存的项目。
+"""
+
+import gc
+import json
+import time
+import platform
+import statistics
+import tracemalloc
+import numpy as np
+import matplotlib
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Sequence
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from config.settings import (
+    FIGURE_SIZE, FIGURE_DPI, FIGURE_FACECOLOR, DEFAULT_Y_RANGE, FUNCTION_COLORS, CUSTOM_FUNCTION_TYPE,
+    BENCHMARK_SIZES, BENCHMARK_CURVES, BENCHMARK_WIDTHS, BENCHMARK_EXPRESSION, BENCHMARK_PARAMS,
+    BENCHMARK_REPEATS, BENCHMARK_CASE_BUDGET_S, BENCHMARK_MAX_GRID_ELEMENTS,
+    BENCHMARK_REGRESSION_RATIO, BENCHMARK_MIN_DELTA_S, BENCHMARK_MIN_DELTA_BYTES,
+    BENCHMARK_MIN_DELTA_ALLOCATIONS
+)
+from core.function_registry import FunctionRegistry, ExpressionFamily
+from core.fused_evaluator import FusedEvaluator
+from core.math_functions import MathFunctionCalculator
+from gui.plot_area import PlotArea
+from utils.plot_utils import PlotUtils
+
+# 全部测试项目
+BENCHMARK_NAMES = ('evaluate', 'roots', 'extrema', 'intersections', 'grid_points', 'plot_functions')
+
+# 绘图流程测试打开全部显示选项
+PLOT_OPTIONS = {
+    'show_extrema': True,
+    'show_roots': True,
+    'show_intersection': True,
+    'show_grid_points': True,
+}
+
+
+class StatusText:
+    """代替状态栏标签，只记录最后一条文字"""
+
+    def __init__(self):
+        self.text = ""
+
+    def config(self, text: str = "", **kwargs) -> None:
+        self.text = text
+
+
+class HeadlessPlotArea(PlotArea):
+    """不创建 tkinter 控件的绘图区域
+
+    在 Agg 画布上同步执行与图形界面相同的 准备任务 → 计算 → 更新图形对象 → 绘制 流程。
+    """
+
+    def create_plot_area(self):
+        """创建 Agg 画布和只记录文字的状态栏"""
+        self.plot_frame = None
+        self.fig = Figure(figsize=FIGURE_SIZE, dpi=FIGURE_DPI, facecolor=FIGURE_FACECOLOR)
+        self.ax = self.fig.add_subplot(111)
+        self.setup_axes_style()
+        self.canvas = FigureCanvasAgg(self.fig)
+        self.status_bar = StatusText()
+
+    def plot_functions(self, functions: List[Dict], ranges: Dict, options: Dict[str, bool]):
+        """同步绘制（与关闭 ASYNC_COMPUTE 时的 PlotArea.plot_functions 相同）"""
+        job = self.prepare_plot_job(functions, ranges, options)
+        self.apply_plot_result(job, self.compute_plot_job(job))
+
+    def close(self) -> None:
+        """关闭后台计算线程池"""
+        self.executor.shutdown(wait=False)
+
+
+class BenchmarkSuite:
+    """基准测试类
+
+    每个测试项目是一个字典：name、params，以及不计时的 setup()、计时的 run(state)
+    和可选的 teardown(state)。
+    """
+
+    _font_manager = None
+
+    @staticmethod
+    def default_families() -> List[str]:
+        """参与测试的函数类型：全部内置函数族和一个自定义表达式"""
+        names = [name for name in FunctionRegistry.names() if name != CUSTOM_FUNCTION_TYPE]
+        return names + [ExpressionFamily.make_type(BENCHMARK_EXPRESSION)]
+
+    @staticmethod
+    def make_functions(families: Sequence[str], count: int) -> List[Dict]:
+        """
+        生成用于测试的函数列表
+
+        依次循环使用各函数类型，参数为 BENCHMARK_PARAMS；同类型的重复函数平移c，使曲线互不重合。
+
+        Args:
+            families: 函数类型列表
+            count: 函数数量
+
+        Returns:
+            函数信息列表
+        """
+        functions = []
+        for index in range(count):
+            func_type = families[index % len(families)]
+            family = FunctionRegistry.get(func_type)
+            a, b, c = BENCHMARK_PARAMS
+            params = (a, b, c + 0.5 * (index // len(families)))
+            # 提前编译自定义表达式，编译时间不计入测试
+            is_valid, error_msg = family.validate(*params)
+            if not is_valid:
+                raise ValueError(error_msg)
+            functions.append({
+                'id': index + 1,
+                'type': func_type,
+                'params': params,
+                'color': FUNCTION_COLORS[index % len(FUNCTION_COLORS)],
+            })
+        return functions
+
+    @staticmethod
+    def make_range(width: float) -> tuple:
+        """以原点为中心、宽度为 width 的范围"""
+        return (-width / 2, width / 2)
+
+    @staticmethod
+    def case_key(name: str, params: Dict) -> str:
+        """生成测试项目的唯一名称，如 evaluate[family=正弦函数, size=1000]（10 与 10.0 的名称相同）"""
+        values = [f"{key}={value:g}" if isinstance(value, float) else f"{key}={value}"
+                  for key, value in params.items()]
+        return f"{name}[{', '.join(values)}]"
+
+    @staticmethod
+    def get_font_manager():
+        """字体管理器只创建一次（字体发现不计入测试）"""
+        if BenchmarkSuite._font_manager is None:
+            from core.font_manager import FontManager
+            BenchmarkSuite._font_manager = FontManager()
+        return BenchmarkSuite._font_manager
+
+    @staticmethod
+    def build_cases(names: Sequence[str] = BENCHMARK_NAMES, families: Optional[Sequence[str]] = None,
+                    sizes: Sequence[int] = BENCHMARK_SIZES, curves: Sequence[int] = BENCHMARK_CURVES,
+                    widths: Sequence[float] = BENCHMARK_WIDTHS) -> List[Dict]:
+        """
+        生成测试项目列表
+
+        Args:
+            names: 要运行的测试项目名称（见 BENCHMARK_NAMES）
+            families: 函数类型列表，None 表示 default_families()
+            sizes: 采样点数
+            curves: 叠加的曲线数量
+            widths: x范围的宽度
+
+        Returns:
+            测试项目列表
+        """
+        families = list(families or BenchmarkSuite.default_families())
+        cases = []
+
+        def add(name, params, setup, run, teardown=None):
+            if name in names:
+                cases.append({'name': name, 'params': params, 'setup': setup, 'run': run,
+                              'teardown': teardown})
+
+        def grid(func, size, width):
+            # 函数值在 setup 中计算，只测量特征点查找
+            calculator = MathFunctionCalculator()
+            x = np.linspace(*BenchmarkSuite.make_range(width), size)
+            with np.errstate(all='ignore'):
+                y = calculator.get_function_values(x, func['type'], *func['params'])
+            return calculator, x, y
+
+        for func_type in families:
+            func = BenchmarkSuite.make_functions([func_type], 1)[0]
+            for size in sizes:
+                add('evaluate', {'family': func_type, 'size': size},
+                    lambda func=func, size=size: (MathFunctionCalculator(),
+                                                  np.linspace(*BenchmarkSuite.make_range(widths[0]), size)),
+                    lambda state, func=func: state[0].get_function_values(state[1], func['type'], *func['params']))
+                for width in widths:
+                    params = {'family': func_type, 'size': size, 'width': width}
+                    add('roots', params,
+                        lambda func=func, size=size, width=width: grid(func, size, width),
+                        lambda state: state[0].find_roots(state[1], state[2]))
+                    add('extrema', params,
+                        lambda func=func, size=size, width=width: grid(func, size, width),
+                        lambda state: state[0].find_extrema(state[1], state[2]))
+
+        for count in curves:
+            functions = BenchmarkSuite.make_functions(families, count)
+            for size in sizes:
+                if count * size > BENCHMARK_MAX_GRID_ELEMENTS:
+                    continue
+                for width in widths:
+                    add('intersections', {'curves': count, 'size': size, 'width': width},
+                        lambda size=size, width=width: (MathFunctionCalculator(),
+                                                        np.linspace(*BenchmarkSuite.make_range(width), size)),
+                        lambda state, functions=functions: state[0].find_all_intersections(state[1], functions))
+
+        for width in widths:
+            add('grid_points', {'width': width},
+                lambda width=width: BenchmarkSuite.make_axes(width),
+                lambda state, width=width: BenchmarkSuite.draw_grid_points(state, width))
+
+        for count in curves:
+            functions = BenchmarkSuite.make_functions(families, count)
+            for width in widths:
+                for mode in ('draw', 'pan'):
+                    add('plot_functions', {'curves': count, 'width': width, 'mode': mode},
+                        lambda functions=functions, width=width, mode=mode:
+                            BenchmarkSuite.make_plot_area(functions, width, mode),
+                        lambda state, functions=functions, width=width, mode=mode:
+                            BenchmarkSuite.replot(state, functions, width, mode),
+                        lambda state: state.close())
+        return cases
+
+    @staticmethod
+    def make_axes(width: float):
+        """创建 Agg 画布上的坐标轴"""
+        fig = Figure(figsize=FIGURE_SIZE, dpi=FIGURE_DPI, facecolor=FIGURE_FACECOLOR)
+        canvas = FigureCanvasAgg(fig)
+        ax = fig.add_subplot(111)
+        x_range = BenchmarkSuite.make_range(width)
+        PlotUtils.update_axes_limits(ax, x_range[0], x_range[1], x_range[0], x_range[1])
+        return canvas, ax
+
+    @staticmethod
+    def draw_grid_points(state, width: float) -> None:
+        """绘制坐标网格点并渲染画布"""
+        canvas, ax = state
+        x_range = BenchmarkSuite.make_range(width)
+        PlotUtils.plot_grid_points(ax, x_range, x_range)
+        canvas.draw()
+
+    @staticmethod
+    def plot_ranges(width: float, mode: str) -> Dict:
+        """绘图流程测试的视图范围：pan 模式下向右平移十分之一宽度"""
+        x_range = BenchmarkSuite.make_range(width)
+        if mode == 'pan':
+            x_range = (x_range[0] + width / 10, x_range[1] + width / 10)
+        return {'x_range': x_range, 'y_range': DEFAULT_Y_RANGE}
+
+    @staticmethod
+    def make_plot_area(functions: List[Dict], width: float, mode: str) -> HeadlessPlotArea:
+        """创建无界面的绘图区域；pan 模式下先按原范围绘制一次"""
+        area = HeadlessPlotArea(None, BenchmarkSuite.get_font_manager())
+        if mode == 'pan':
+            area.plot_functions(functions, BenchmarkSuite.plot_ranges(width, 'draw'), PLOT_OPTIONS)
+        return area
+
+    @staticmethod
+    def replot(area: HeadlessPlotArea, functions: List[Dict], width: float, mode: str) -> None:
+        """执行一次完整的绘图流程"""
+        area.plot_functions(functions, BenchmarkSuite.plot_ranges(width, mode), PLOT_OPTIONS)
+
+    @staticmethod
+    def measure(case: Dict, repeats: int = BENCHMARK_REPEATS,
+                budget: float = BENCHMARK_CASE_BUDGET_S) -> Dict:
+        """
+        测量单个项目的耗时和内存
+
+        计时期间关闭垃圾回收；至少运行一次，最多 repeats 次，累计耗时超过 budget 后停止。
+        峰值内存和分配次数另外用 tracemalloc 单独运行一次测量（tracemalloc 会显著拖慢运行）。
+        分配次数为运行结束时比运行前多出的内存块数（含返回值），由前后两次快照统计。
+
+        Args:
+            case: 测试项目
+            repeats: 最多计时次数
+            budget: 计时的总时间预算（秒）
+
+        Returns:
+            测试结果：time_min、time_median（秒），peak_bytes（运行期间的峰值内存增量）、
+            retained_bytes（运行结束并丢弃返回值后仍占用的内存，如缓存）、
+            allocations（运行中分配且在结束时仍存活的内存块数）
+        """
+        teardown = case['teardown'] or (lambda state: None)
+        times = []
+        while len(times) < max(repeats, 1) and (not times or sum(times) < budget):
+            state = case['setup']()
+            gc_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                start = time.perf_counter()
+                case['run'](state)
+                times.append(time.perf_counter() - start)
+            finally:
+                if gc_enabled:
+                    gc.enable()
+                teardown(state)
+
+        state = case['setup']()
+        tracemalloc.start()
+        try:
+            before_blocks = BenchmarkSuite.count_blocks(tracemalloc.take_snapshot())
+            before = tracemalloc.get_traced_memory()[0]
+            result = case['run'](state)
+            peak = tracemalloc.get_traced_memory()[1]
+            # 快照本身也会被跟踪，因此在读取峰值之后再统计
+            allocations = BenchmarkSuite.count_blocks(tracemalloc.take_snapshot()) - before_blocks
+            del result
+            current = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+            teardown(state)
+
+        return {
+            'name': case['name'],
+            'params': dict(case['params']),
+            'key': BenchmarkSuite.case_key(case['name'], case['params']),
+            'runs': len(times),
+            'time_min': min(times),
+            'time_median': statistics.median(times),
+            'peak_bytes': int(peak - before),
+            'retained_bytes': int(current - before),
+            'allocations': int(allocations),
+        }
+
+    @staticmethod
+    def count_blocks(snapshot: tracemalloc.Snapshot) -> int:
+        """统计 tracemalloc 快照中的内存块数"""
+        return sum(stat.count for stat in snapshot.statistics('filename'))
+
+    @staticmethod
+    def run(cases: List[Dict], repeats: int = BENCHMARK_REPEATS, budget: float = BENCHMARK_CASE_BUDGET_S,
+            progress: Optional[Callable[[Dict], None]] = None) -> List[Dict]:
+        """
+        依次运行全部测试项目
+
+        Args:
+            cases: 测试项目列表
+            repeats: 每项最多计时次数
+            budget: 每项计时的总时间预算（秒）
+            progress: 每完成一项时调用的回调，参数为测试结果（可选）
+
+        Returns:
+            测试结果列表
+        """
+        results = []
+        for case in cases:
+            with np.errstate(all='ignore'):
+                result = BenchmarkSuite.measure(case, repeats, budget)
+            results.append(result)
+            if progress is not None:
+                progress(result)
+        return results
+
+    @staticmethod
+    def environment() -> Dict:
+        """记录运行环境，便于判断两次结果是否可比"""
+        return {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'matplotlib': matplotlib.__version__,
+            'numexpr': FusedEvaluator.backend() is not None,
+            'platform': platform.platform(),
+            'machine': platform.machine(),
+        }
+
+    @staticmethod
+    def make_report(results: List[Dict]) -> Dict:
+        """生成可保存为JSON的测试报告"""
+        return {'environment': BenchmarkSuite.environment(), 'results': results}
+
+    @staticmethod
+    def save_report(report: Dict, path: str) -> None:
+        """保存测试报告"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    @staticmethod
+    def load_report(path: str) -> Dict:
+        """读取测试报告"""
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    @staticmethod
+    def compare(results: List[Dict], baseline: Dict,
+                ratio: float = BENCHMARK_REGRESSION_RATIO) -> Dict[str, Dict]:
+        """
+        与基准报告逐项比较
+
+        耗时按最短时间比较；变化小于 BENCHMARK_MIN_DELTA_S / BENCHMARK_MIN_DELTA_BYTES /
+        BENCHMARK_MIN_DELTA_ALLOCATIONS 时视为噪声。没有记录分配次数的旧基准不比较分配次数。
+
+        Args:
+            results: 本次的测试结果
+            baseline: 基准报告
+            ratio: 视为退化的倍数
+
+        Returns:
+            {测试名称: {'time_ratio', 'memory_ratio', 'allocation_ratio', 'regressed'}}，
+            基准中没有的项目不包含在内；旧基准的 allocation_ratio 为 None
+        """
+        reference = {item['key']: item for item in baseline.get('results', [])}
+        comparison = {}
+        for result in results:
+            base = reference.get(result['key'])
+            if base is None:
+                continue
+            time_ratio = result['time_min'] / max(base['time_min'], 1e-9)
+            memory_ratio = (result['peak_bytes'] + 1) / (base['peak_bytes'] + 1)
+            slower = (time_ratio > ratio and
+                      result['time_min'] - base['time_min'] > BENCHMARK_MIN_DELTA_S)
+            larger = (memory_ratio > ratio and
+                      result['peak_bytes'] - base['peak_bytes'] > BENCHMARK_MIN_DELTA_BYTES)
+            allocation_ratio = None
+            more_allocations = False
+            if 'allocations' in base:
+                allocation_ratio = (result['allocations'] + 1) / (base['allocations'] + 1)
+                more_allocations = (allocation_ratio > ratio and
+                                    result['allocations'] - base['allocations'] > BENCHMARK_MIN_DELTA_ALLOCATIONS)
+            comparison[result['key']] = {
+                'time_ratio': time_ratio,
+                'memory_ratio': memory_ratio,
+                'allocation_ratio': allocation_ratio,
+                'regressed': slower or larger or more_allocations,
+            }
+        return comparison
+
+    @staticmethod
+    def format_result(result: Dict, comparison: Optional[Dict] = None) -> str:
+        """
+        生成单项结果的一行文字
+
+        Args:
+            result: 测试结果
+            comparison: compare() 中该项的比较结果（可选）
+
+        Returns:
+            一行文字
+        """
+        line = (f"{result['key']:<64} {result['time_min'] * 1000:10.3f} ms"
+                f" (中位数 {result['time_median'] * 1000:.3f} ms, {result['runs']} 次)"
+                f"  峰值 {result['peak_bytes'] / 1e6:8.2f} MB  分配 {result['allocations']:8d} 块")
+        if comparison is not None:
+            mark = "⚠️" if comparison['regressed'] else "  "
+            line += f"  {mark} 耗时 ×{comparison['time_ratio']:.2f}, 内存 ×{comparison['memory_ratio']:.2f}"
+            if comparison['allocation_ratio'] is not None:
+                line += f", 分配 ×{comparison['allocation_ratio']:.2f}"
+        return line
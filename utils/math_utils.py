@@ -3,8 +3,9 @@
 数学计算工具函数模块
 """
 
-import numpy as np
-from typing import List, Dict, Any, Tuple
+from typing import List, Tuple
+from config.settings import DEFAULT_X_RANGE, DEFAULT_Y_RANGE
+from core.function_registry import FunctionRegistry
 
 
 class MathUtils:
@@ -22,51 +23,10 @@ class MathUtils:
         Returns:
             特征信息列表
         """
-        key_points = []
-        
-        if func_type == "二次函数":
-            # 顶点
-            vertex_x = -b / (2 * a)
-            vertex_y = a * vertex_x**2 + b * vertex_x + c
-            key_points.append(f"顶点: ({vertex_x:.2f}, {vertex_y:.2f})")
-            
-            # 判别式和零点
-            discriminant = b**2 - 4 * a * c
-            if discriminant > 0:
-                root1 = (-b + np.sqrt(discriminant)) / (2 * a)
-                root2 = (-b - np.sqrt(discriminant)) / (2 * a)
-                key_points.append(f"零点: x₁={root1:.2f}, x₂={root2:.2f}")
-            elif discriminant == 0:
-                root = -b / (2 * a)
-                key_points.append(f"零点: x={root:.2f} (二重根)")
-            else:
-                key_points.append("无实数零点")
-            
-            # y轴交点
-            key_points.append(f"y轴交点: (0, {c:.2f})")
-            
-        elif func_type in ["正弦函数", "余弦函数"]:
-            key_points.append(f"振幅: {abs(a):.2f}")
-            key_points.append(f"周期: {2*np.pi/abs(b):.2f}")
-            key_points.append(f"相位: {c:.2f}")
-            
-        elif func_type == "指数函数":
-            if b < 0:
-                key_points.append(f"水平渐近线: y={c:.2f}")
-            y_intercept = a * np.exp(0) + c
-            key_points.append(f"y轴交点: (0, {y_intercept:.2f})")
-            
-        elif func_type == "对数函数":
-            try:
-                root = (1 - c) / b
-                key_points.append(f"零点: ({root:.2f}, 0)")
-            except:
-                key_points.append("无零点")
-            
-            vertical_asymptote = -c / b
-            key_points.append(f"垂直渐近线: x={vertical_asymptote:.2f}")
-        
-        return key_points
+        family = FunctionRegistry.get(func_type)
+        if family is None:
+            return []
+        return family.describe(a, b, c)
     
     @staticmethod
     def validate_function_parameters(func_type: str, a: float, b: float, c: float) -> Tuple[bool, str]:
@@ -80,25 +40,10 @@ class MathUtils:
         Returns:
             (是否有效, 错误消息)
         """
-        if func_type == "二次函数":
-            if a == 0:
-                return False, "二次函数的参数a不能为0"
-        
-        elif func_type in ["正弦函数", "余弦函数", "正切函数"]:
-            if b == 0:
-                return False, f"{func_type}的参数b不能为0"
-        
-        elif func_type == "指数函数":
-            if a == 0:
-                return False, "指数函数的参数a不能为0"
-        
-        elif func_type == "对数函数":
-            if a == 0:
-                return False, "对数函数的参数a不能为0"
-            if b == 0:
-                return False, "对数函数的参数b不能为0"
-        
-        return True, ""
+        family = FunctionRegistry.get(func_type)
+        if family is None:
+            return False, f"未知的函数类型: {func_type}"
+        return family.validate(a, b, c)
     
     @staticmethod
     def get_optimal_range(func_type: str, a: float, b: float, c: float) -> Tuple[Tuple[float, float], Tuple[float, float]]:
@@ -112,39 +57,10 @@ class MathUtils:
         Returns:
             ((x_min, x_max), (y_min, y_max))
         """
-        if func_type == "二次函数":
-            vertex_x = -b / (2 * a)
-            x_range = (vertex_x - 5, vertex_x + 5)
-            vertex_y = a * vertex_x**2 + b * vertex_x + c
-            y_range = (vertex_y - 10, vertex_y + 10)
-            
-        elif func_type in ["正弦函数", "余弦函数"]:
-            period = 2 * np.pi / abs(b) if b != 0 else 2 * np.pi
-            x_range = (-2 * period, 2 * period)
-            amplitude = abs(a)
-            y_range = (-amplitude * 1.5, amplitude * 1.5)
-            
-        elif func_type == "正切函数":
-            period = np.pi / abs(b) if b != 0 else np.pi
-            x_range = (-2 * period, 2 * period)
-            y_range = (-10, 10)
-            
-        elif func_type == "指数函数":
-            x_range = (-5, 5)
-            if b > 0:
-                y_range = (c - 2, c + 20)
-            else:
-                y_range = (c - 20, c + 2)
-                
-        elif func_type == "对数函数":
-            x_range = (0.1, 10)
-            y_range = (-5, 5)
-            
-        else:
-            x_range = (-5, 5)
-            y_range = (-5, 5)
-        
-        return x_range, y_range
+        family = FunctionRegistry.get(func_type)
+        if family is None:
+            return DEFAULT_X_RANGE, DEFAULT_Y_RANGE
+        return family.default_range(a, b, c)
     
     @staticmethod
     def format_number(value: float, precision: int = 2) -> str:
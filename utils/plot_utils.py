@@ -4,9 +4,15 @@
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
 from typing import List, Tuple, Dict, Any
-from config.settings import DEFAULT_SAVE_FILENAME, SAVE_DPI
+from config.settings import (
+    DEFAULT_SAVE_FILENAME, SAVE_DPI, PLOT_POINTS, MAX_ROOTS, MAX_EXTREMA, GRID_POINT_MIN_SPACING_PX,
+    SWEEP_COLORMAP, SWEEP_LINE_WIDTH, SWEEP_ALPHA
+)
+from core.feature_engine import FeatureEngine
+from core.analytic_solver import AnalyticSolver
+from core.function_registry import FunctionRegistry
 
 
 class PlotUtils:
@@ -35,10 +41,201 @@ class PlotUtils:
         ax.set_xlabel('x', fontsize=12)
         ax.set_ylabel('y', fontsize=12)
     
+    @staticmethod
+    def update_axes_limits(ax, x_min: float, x_max: float, y_min: float, y_max: float) -> None:
+        """
+        原地更新坐标轴范围（不清除已有图形）
+        
+        Args:
+            ax: matplotlib轴对象
+            x_min, x_max: x轴范围
+            y_min, y_max: y轴范围
+        """
+        ax.set_xlim([x_min, x_max])
+        ax.set_ylim([y_min, y_max])
+    
+    @staticmethod
+    def plot_function_curve(ax, x: np.ndarray, y: np.ndarray, color: str, label: str):
+        """
+        绘制一条函数曲线
+        
+        Args:
+            ax: matplotlib轴对象
+            x: x坐标数组
+            y: y坐标数组
+            color: 曲线颜色
+            label: 图例文本
+            
+        Returns:
+            创建的 Line2D 对象
+        """
+        line, = ax.plot(x, y, color + '-', linewidth=2, label=label)
+        return line
+    
+    @staticmethod
+    def add_legend(ax, handles: List, chinese_font: str = "DejaVu Sans"):
+        """
+        按给定曲线顺序创建图例
+        
+        Args:
+            ax: matplotlib轴对象
+            handles: 曲线对象列表
+            chinese_font: 中文字体
+            
+        Returns:
+            图例对象，没有曲线时返回None
+        """
+        legend = ax.get_legend()
+        if legend is not None:
+            legend.remove()
+        if not handles:
+            return None
+        return ax.legend(handles=handles, loc='best', prop={'family': chinese_font, 'size': 9})
+    
+    @staticmethod
+    def make_sweep_segments(x: np.ndarray, values: np.ndarray) -> np.ndarray:
+        """
+        把共享x网格上的曲线族转换为 LineCollection 的线段数组
+        
+        Args:
+            x: (P,) x坐标数组
+            values: (N, P) 函数值矩阵
+        
+        Returns:
+            (N, P, 2) 线段数组，NaN处曲线断开
+        """
+        segments = np.empty(values.shape + (2,), dtype=float)
+        segments[:, :, 0] = x
+        segments[:, :, 1] = values
+        return segments
+    
+    @staticmethod
+    def plot_sweep(ax, x: np.ndarray, values: np.ndarray, sweep_values: np.ndarray,
+                   label: str, chinese_font: str = "DejaVu Sans"):
+        """
+        把参数扫描的曲线族绘制为一个 LineCollection，按参数值着色并添加颜色条
+        
+        Args:
+            ax: matplotlib轴对象
+            x: (P,) x坐标数组
+            values: (N, P) 函数值矩阵
+            sweep_values: (N,) 被扫描参数的取值
+            label: 颜色条标签
+            chinese_font: 中文字体
+        
+        Returns:
+            (LineCollection, Colorbar)
+        """
+        collection = LineCollection(PlotUtils.make_sweep_segments(x, values), cmap=SWEEP_COLORMAP,
+                                    linewidths=SWEEP_LINE_WIDTH, alpha=SWEEP_ALPHA)
+        collection.set_array(sweep_values)
+        # 坐标轴范围由视图控制，不随曲线族自动缩放
+        ax.add_collection(collection, autolim=False)
+        colorbar = ax.figure.colorbar(collection, ax=ax, pad=0.02)
+        colorbar.set_label(label, fontfamily=chinese_font)
+        return collection, colorbar
+    
+    @staticmethod
+    def update_sweep(collection, colorbar, x: np.ndarray, values: np.ndarray,
+                     sweep_values: np.ndarray, label: str, chinese_font: str = "DejaVu Sans") -> None:
+        """
+        原地更新曲线族的线段、颜色和颜色条（不重建图形对象）
+        
+        Args:
+            collection: plot_sweep() 创建的 LineCollection
+            colorbar: plot_sweep() 创建的颜色条
+            x: (P,) x坐标数组
+            values: (N, P) 函数值矩阵
+            sweep_values: (N,) 被扫描参数的取值
+            label: 颜色条标签
+            chinese_font: 中文字体
+        """
+        collection.set_segments(PlotUtils.make_sweep_segments(x, values))
+        collection.set_array(sweep_values)
+        collection.set_clim(np.min(sweep_values), np.max(sweep_values))
+        colorbar.update_normal(collection)
+        colorbar.set_label(label, fontfamily=chinese_font)
+    
+    @staticmethod
+    def update_text_font(texts: List, chinese_font: str) -> None:
+        """
+        原地更新文本对象的字体
+        
+        Args:
+            texts: 文本对象（Text/Annotation）列表
+            chinese_font: 中文字体
+        """
+        for text in texts:
+            text.set_fontfamily(chinese_font)
+    
+    @staticmethod
+    def compute_extrema(x: np.ndarray, y: np.ndarray, func_type: str,
+                        params: Tuple[float, float, float], x_range: Tuple[float, float]) -> np.ndarray:
+        """
+        求函数在x范围内的极值点（不涉及绘图，可在后台线程中调用）
+        
+        Args:
+            x: x坐标数组
+            y: y坐标数组
+            func_type: 函数类型
+            params: 函数参数
+            x_range: x轴范围
+            
+        Returns:
+            极值点结构化数组（x、y、kind 字段）
+        """
+        if AnalyticSolver.supports(func_type):
+            return AnalyticSolver.solve(func_type, params, x_range, max_count=MAX_EXTREMA)['extrema']
+        return FeatureEngine.find_extrema(x, y, max_count=MAX_EXTREMA,
+                                          **PlotUtils.get_refiners(func_type, params, 2))
+    
+    @staticmethod
+    def compute_roots(x: np.ndarray, y: np.ndarray, x_range: Tuple[float, float],
+                      func_type: str = None, params: Tuple[float, float, float] = None) -> np.ndarray:
+        """
+        求函数在x范围内的零点（不涉及绘图，可在后台线程中调用）
+        
+        Args:
+            x: x坐标数组
+            y: y坐标数组
+            x_range: x轴范围
+            func_type: 函数类型（可选，提供时优先使用解析解）
+            params: 函数参数（可选）
+            
+        Returns:
+            升序排列的零点数组
+        """
+        if func_type is not None and params is not None and AnalyticSolver.supports(func_type):
+            roots = AnalyticSolver.solve(func_type, params, x_range, max_count=MAX_ROOTS)['roots']
+        else:
+            roots = FeatureEngine.find_roots(x, y, max_count=MAX_ROOTS,
+                                             **PlotUtils.get_refiners(func_type, params, 1))
+        return roots[(roots >= x_range[0]) & (roots <= x_range[1])]
+    
+    @staticmethod
+    def get_refiners(func_type: str, params: Tuple[float, float, float], order: int) -> Dict[str, Any]:
+        """
+        获取细化零点/极值点所需的求值函数和符号导数
+        
+        Args:
+            func_type: 函数类型（可以为None）
+            params: 函数参数（可以为None）
+            order: 需要的最高导数阶数（零点为1，极值点为2）
+            
+        Returns:
+            FeatureEngine 的关键字参数 func、derivative（、second_derivative），
+            函数类型未知或没有符号导数时返回空字典（只用采样点插值）
+        """
+        family = FunctionRegistry.get(func_type) if func_type is not None else None
+        if family is None or params is None or not family.has_derivatives:
+            return {}
+        names = ('func', 'derivative', 'second_derivative')[:order + 1]
+        return {name: family.bind(params, k) for k, name in enumerate(names)}
+    
     @staticmethod
     def plot_extrema_points(ax, x: np.ndarray, y: np.ndarray, func_type: str, 
                            params: Tuple[float, float, float], x_range: Tuple[float, float],
-                           chinese_font: str = "DejaVu Sans") -> None:
+                           chinese_font: str = "DejaVu Sans") -> List:
         """
         绘制函数的极值点
         
@@ -50,42 +247,54 @@ class PlotUtils:
             params: 函数参数
             x_range: x轴范围
             chinese_font: 中文字体
+            
+        Returns:
+            创建的图形对象列表
         """
-        if func_type == "二次函数":
-            a, b, c = params
-            vertex_x = -b / (2 * a)
-            vertex_y = a * vertex_x**2 + b * vertex_x + c
+        extrema = PlotUtils.compute_extrema(x, y, func_type, params, x_range)
+        return PlotUtils.draw_extrema_points(ax, extrema, func_type, chinese_font)
+    
+    @staticmethod
+    def draw_extrema_points(ax, extrema: np.ndarray, func_type: str,
+                            chinese_font: str = "DejaVu Sans") -> List:
+        """
+        绘制已求出的极值点（函数族指定了标注文字时使用该文字，如二次函数的顶点）
+        
+        Args:
+            ax: matplotlib轴对象
+            extrema: 极值点结构化数组
+            func_type: 函数类型
+            chinese_font: 中文字体
             
-            if x_range[0] <= vertex_x <= x_range[1]:
-                ax.plot(vertex_x, vertex_y, 'ro', markersize=8)
-                ax.annotate(f'顶点\n({vertex_x:.2f}, {vertex_y:.2f})', 
-                           xy=(vertex_x, vertex_y), xytext=(10, 10),
+        Returns:
+            创建的图形对象列表
+        """
+        family = FunctionRegistry.get(func_type)
+        label = family.extremum_label if family is not None else None
+        artists = []
+        for x_ext, y_ext, kind in extrema:
+            if label is not None:
+                artists += ax.plot(x_ext, y_ext, 'ro', markersize=8)
+                artists.append(ax.annotate(f'{label}\n({x_ext:.2f}, {y_ext:.2f})', 
+                           xy=(x_ext, y_ext), xytext=(10, 10),
                            textcoords='offset points', fontsize=9,
                            bbox=dict(boxstyle='round,pad=0.3', facecolor='yellow', alpha=0.7),
-                           fontfamily=chinese_font)
-        
-        elif func_type in ["正弦函数", "余弦函数"]:
-            dy = np.diff(y)
-            extrema_indices = []
-            
-            for i in range(1, len(dy)):
-                if dy[i-1] * dy[i] < 0:
-                    extrema_indices.append(i)
-            
-            for idx in extrema_indices[:5]:
-                x_ext = x[idx]
-                y_ext = y[idx]
-                ext_type = "最大值" if dy[idx-1] > 0 else "最小值"
-                ax.plot(x_ext, y_ext, 'ro', markersize=6)
-                ax.annotate(f'{ext_type}\n({x_ext:.2f}, {y_ext:.2f})', 
+                           fontfamily=chinese_font))
+            else:
+                ext_type = FeatureEngine.extremum_label(kind)
+                artists += ax.plot(x_ext, y_ext, 'ro', markersize=6)
+                artists.append(ax.annotate(f'{ext_type}\n({x_ext:.2f}, {y_ext:.2f})', 
                            xy=(x_ext, y_ext), xytext=(10, 10),
                            textcoords='offset points', fontsize=8,
                            bbox=dict(boxstyle='round,pad=0.3', facecolor='orange', alpha=0.7),
-                           fontfamily=chinese_font)
+                           fontfamily=chinese_font))
+        
+        return artists
     
     @staticmethod
     def plot_roots(ax, x: np.ndarray, y: np.ndarray, x_range: Tuple[float, float],
-                   chinese_font: str = "DejaVu Sans") -> None:
+                   chinese_font: str = "DejaVu Sans", func_type: str = None,
+                   params: Tuple[float, float, float] = None) -> List:
         """
         绘制函数的零点
         
@@ -95,32 +304,43 @@ class PlotUtils:
             y: y坐标数组
             x_range: x轴范围
             chinese_font: 中文字体
+            func_type: 函数类型（可选，提供时优先使用解析解）
+            params: 函数参数（可选）
+            
+        Returns:
+            创建的图形对象列表
         """
-        roots = []
-        tolerance = 0.1
-        
-        for i in range(1, len(y)):
-            if not (np.isnan(y[i]) or np.isnan(y[i-1])):
-                if y[i-1] * y[i] <= 0 and abs(y[i]) < tolerance:
-                    if abs(y[i] - y[i-1]) > 1e-10:
-                        root_x = x[i-1] - y[i-1] * (x[i] - x[i-1]) / (y[i] - y[i-1])
-                        roots.append(root_x)
+        roots = PlotUtils.compute_roots(x, y, x_range, func_type, params)
+        return PlotUtils.draw_roots(ax, roots, chinese_font)
+    
+    @staticmethod
+    def draw_roots(ax, roots: np.ndarray, chinese_font: str = "DejaVu Sans") -> List:
+        """
+        绘制已求出的零点
         
-        roots = list(set([round(r, 2) for r in roots]))
-        roots.sort()
+        Args:
+            ax: matplotlib轴对象
+            roots: 零点数组
+            chinese_font: 中文字体
+            
+        Returns:
+            创建的图形对象列表
+        """
+        artists = []
+        for root in roots:
+            artists += ax.plot(root, 0, 'go', markersize=8)
+            artists.append(ax.annotate(f'零点\n({root:.2f}, 0)', 
+                       xy=(root, 0), xytext=(10, -20),
+                       textcoords='offset points', fontsize=9,
+                       bbox=dict(boxstyle='round,pad=0.3', facecolor='lightgreen', alpha=0.7),
+                       fontfamily=chinese_font))
         
-        for root in roots[:5]:
-            if x_range[0] <= root <= x_range[1]:
-                ax.plot(root, 0, 'go', markersize=8)
-                ax.annotate(f'零点\n({root:.2f}, 0)', 
-                           xy=(root, 0), xytext=(10, -20),
-                           textcoords='offset points', fontsize=9,
-                           bbox=dict(boxstyle='round,pad=0.3', facecolor='lightgreen', alpha=0.7),
-                           fontfamily=chinese_font)
+        return artists
     
     @staticmethod
     def plot_intersections(ax, functions: List[Dict], x_range: Tuple[float, float], 
-                          y_range: Tuple[float, float], chinese_font: str = "DejaVu Sans") -> None:
+                          y_range: Tuple[float, float], chinese_font: str = "DejaVu Sans",
+                          calculator=None) -> List:
         """
         绘制多个函数之间的交点
         
@@ -130,45 +350,93 @@ class PlotUtils:
             x_range: x轴范围
             y_range: y轴范围
             chinese_font: 中文字体
+            calculator: 数学计算器实例（可选，可携带求值缓存）
+            
+        Returns:
+            创建的图形对象列表
         """
+        artists = []
         if len(functions) < 2:
-            return
+            return artists
+        
+        if calculator is None:
+            from core.math_functions import MathFunctionCalculator
+            calculator = MathFunctionCalculator()
         
-        from core.math_functions import MathFunctionCalculator
-        calculator = MathFunctionCalculator()
+        # 所有函数只求值一次，两两交点批量求解
+        x, values = calculator.evaluate_on_grid(functions, x_range, PLOT_POINTS)
+        intersections = calculator.find_all_intersections(x, functions, values=values)
         
-        x = np.linspace(x_range[0], x_range[1], 1000)
+        return PlotUtils.draw_intersection_points(ax, intersections, x_range, y_range, chinese_font)
+    
+    @staticmethod
+    def draw_intersection_points(ax, intersections: np.ndarray, x_range: Tuple[float, float],
+                                 y_range: Tuple[float, float], chinese_font: str = "DejaVu Sans") -> List:
+        """
+        绘制已求出的交点
+        
+        Args:
+            ax: matplotlib轴对象
+            intersections: 交点结构化数组（含 x、y 字段）
+            x_range: x轴范围
+            y_range: y轴范围
+            chinese_font: 中文字体
+            
+        Returns:
+            创建的图形对象列表
+        """
+        artists = []
+        for int_x, int_y in zip(intersections['x'], intersections['y']):
+            if (x_range[0] <= int_x <= x_range[1] and 
+                y_range[0] <= int_y <= y_range[1]):
+                artists += ax.plot(int_x, int_y, 'mo', markersize=10)
+                artists.append(ax.annotate(f'交点\n({int_x:.2f}, {int_y:.2f})', 
+                           xy=(int_x, int_y), xytext=(15, 15),
+                           textcoords='offset points', fontsize=9,
+                           bbox=dict(boxstyle='round,pad=0.3', facecolor='magenta', alpha=0.7),
+                           fontfamily=chinese_font))
         
-        for i in range(len(functions)):
-            for j in range(i + 1, len(functions)):
-                intersections = calculator.find_intersections(x, functions[i], functions[j])
-                
-                for int_x, int_y in intersections:
-                    if (x_range[0] <= int_x <= x_range[1] and 
-                        y_range[0] <= int_y <= y_range[1]):
-                        ax.plot(int_x, int_y, 'mo', markersize=10)
-                        ax.annotate(f'交点\n({int_x:.2f}, {int_y:.2f})', 
-                                   xy=(int_x, int_y), xytext=(15, 15),
-                                   textcoords='offset points', fontsize=9,
-                                   bbox=dict(boxstyle='round,pad=0.3', facecolor='magenta', alpha=0.7),
-                                   fontfamily=chinese_font)
+        return artists
     
     @staticmethod
-    def plot_grid_points(ax, x_range: Tuple[float, float], y_range: Tuple[float, float]) -> None:
+    def plot_grid_points(ax, x_range: Tuple[float, float], y_range: Tuple[float, float],
+                         pixel_size: Tuple[float, float] = None) -> List:
         """
         绘制坐标网格点
         
+        全部整数格点合并为一个散点集合；格点比像素网格更密时按步长抽稀，
+        使相邻格点之间至少相隔 GRID_POINT_MIN_SPACING_PX 像素。
+        
         Args:
             ax: matplotlib轴对象
             x_range: x轴范围
             y_range: y轴范围
+            pixel_size: 绘图区域的像素尺寸 (宽, 高)，默认取轴的窗口尺寸
+            
+        Returns:
+            创建的图形对象列表（至多一个）
         """
-        x_grid = np.arange(int(x_range[0]), int(x_range[1]) + 1, 1)
-        y_grid = np.arange(int(y_range[0]), int(y_range[1]) + 1, 1)
+        x_min, x_max = min(x_range), max(x_range)
+        y_min, y_max = min(y_range), max(y_range)
+        if pixel_size is None:
+            bbox = ax.get_window_extent()
+            pixel_size = (bbox.width, bbox.height)
+        pixel_width, pixel_height = max(pixel_size[0], 1), max(pixel_size[1], 1)
+        
+        # 每个单位长度对应的像素数决定抽稀步长
+        x_stride = max(1, int(np.ceil(GRID_POINT_MIN_SPACING_PX * (x_max - x_min) / pixel_width)))
+        y_stride = max(1, int(np.ceil(GRID_POINT_MIN_SPACING_PX * (y_max - y_min) / pixel_height)))
+        
+        # 只取可见范围内、且为步长整数倍的格点
+        x_grid = np.arange(np.ceil(x_min / x_stride), np.floor(x_max / x_stride) + 1) * x_stride
+        y_grid = np.arange(np.ceil(y_min / y_stride), np.floor(y_max / y_stride) + 1) * y_stride
+        if len(x_grid) == 0 or len(y_grid) == 0:
+            return []
         
-        for x_val in x_grid:
-            for y_val in y_grid:
-                ax.plot(x_val, y_val, 'k.', markersize=2, alpha=0.3)
+        grid_x, grid_y = np.meshgrid(x_grid, y_grid)
+        points = ax.scatter(grid_x.ravel(), grid_y.ravel(), s=4, c='k', marker='.',
+                            alpha=0.3, linewidths=0, zorder=1)
+        return [points]
     
     @staticmethod
     def save_plot(fig, filename: str = None) -> Tuple[bool, str]:
@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+"""
+性能分析工具模块 - 记录启动各阶段（导入、界面创建、字体发现等）的耗时，
+以及每次绘图各阶段（采样、特征点、交点、标注、图例、绘制等）的耗时
+"""
+
+import os
+import json
+import math
+import time
+import threading
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from typing import Dict, List, Optional, Sequence, Tuple
+from config.settings import PLOT_PROFILING, PROFILE_WINDOW, PROFILE_TRACE_MAX_EVENTS
+
+# 关闭计时时所有阶段共用的空上下文
+_NULL_SPAN = nullcontext()
+
+
+class PhaseTimer:
+    """分阶段计时器类
+
+    可以在多个线程中同时使用；各阶段按结束顺序记录。
+    """
+
+    def __init__(self):
+        """初始化计时器，以创建时刻作为起点"""
+        self.start_time = time.perf_counter()
+        self.phases = []  # [(阶段名称, 耗时秒数, 结束时距起点的秒数)]
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, name: str):
+        """
+        记录一个阶段的耗时
+
+        Args:
+            name: 阶段名称
+
+        用法:
+            with startup_timer.phase("导入 matplotlib"):
+                import matplotlib
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            with self._lock:
+                self.phases.append((name, end - start, end - self.start_time))
+
+    def get_phases(self) -> List[Tuple[str, float, float]]:
+        """获取已记录的阶段列表"""
+        with self._lock:
+            return list(self.phases)
+
+    def elapsed(self) -> float:
+        """距起点的秒数"""
+        return time.perf_counter() - self.start_time
+
+    def format_report(self, title: str = "启动耗时") -> str:
+        """
+        生成各阶段耗时报告
+
+        Args:
+            title: 报告标题
+
+        Returns:
+            多行文本报告
+        """
+        phases = self.get_phases()
+        lines = [f"⏱️ {title}（共 {self.elapsed() * 1000:.0f} ms）:"]
+        width = max((len(name) for name, _, _ in phases), default=0)
+        for name, duration, finished_at in phases:
+            lines.append(f"   {name:<{width}}  {duration * 1000:8.1f} ms   (@{finished_at * 1000:.0f} ms)")
+        return "\n".join(lines)
+
+
+class SpanProfiler:
+    """阶段耗时分析器类
+
+    span() 记录一个阶段：耗时累加到该帧的 {阶段: 秒} 字典，同时保存为 Chrome trace 事件。
+    一帧的各阶段可以在不同线程中记录（后台计算与主线程更新），finish_frame() 后计入滚动窗口。
+    关闭时 span() 直接返回共享的空上下文，new_frame() 返回None，几乎没有额外开销。
+    """
+
+    def __init__(self, enabled: bool = PLOT_PROFILING, window: int = PROFILE_WINDOW,
+                 max_events: int = PROFILE_TRACE_MAX_EVENTS):
+        """
+        Args:
+            enabled: 是否记录
+            window: 计算百分位数时使用的最近帧数
+            max_events: 最多保留的 trace 事件数
+        """
+        self.enabled = enabled
+        self.origin = time.perf_counter()
+        self.frames = deque(maxlen=window)      # 最近各帧的 {阶段: 秒}
+        self.events = deque(maxlen=max_events)  # (阶段, 开始时刻, 耗时, 线程ID, 线程名称)
+        self._lock = threading.Lock()
+
+    def span(self, name: str, frame: Optional[Dict[str, float]] = None):
+        """
+        记录一个阶段
+
+        Args:
+            name: 阶段名称
+            frame: 所属帧的耗时字典（new_frame() 的返回值，可选）
+
+        用法:
+            with plot_profiler.span("采样", job['timings']):
+                ...
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return self._record(name, frame)
+
+    @contextmanager
+    def _record(self, name: str, frame: Optional[Dict[str, float]]):
+        """记录阶段耗时的上下文"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            if frame is not None:
+                frame[name] = frame.get(name, 0.0) + duration
+            thread = threading.current_thread()
+            with self._lock:
+                self.events.append((name, start, duration, thread.ident, thread.name))
+
+    def new_frame(self) -> Optional[Dict[str, float]]:
+        """开始新的一帧，关闭时返回None"""
+        return {} if self.enabled else None
+
+    def finish_frame(self, frame: Optional[Dict[str, float]]) -> None:
+        """将一帧的阶段耗时计入滚动窗口"""
+        if frame is None or not self.enabled:
+            return
+        with self._lock:
+            self.frames.append(dict(frame))
+
+    def set_enabled(self, enabled: bool) -> None:
+        """开启或关闭记录，重新开启时清空之前的记录"""
+        if enabled and not self.enabled:
+            self.clear()
+        self.enabled = enabled
+
+    def clear(self) -> None:
+        """清空全部记录"""
+        with self._lock:
+            self.frames.clear()
+            self.events.clear()
+
+    def percentiles(self, quantiles: Sequence[float] = (50, 90, 99),
+                    stage: Optional[str] = None) -> Dict[float, float]:
+        """
+        计算最近各帧耗时的百分位数（最近秩法）
+
+        Args:
+            quantiles: 百分位
+            stage: 阶段名称，None 表示整帧各阶段之和
+
+        Returns:
+            {百分位: 秒}，没有记录时为空字典
+        """
+        with self._lock:
+            frames = list(self.frames)
+        if stage is None:
+            values = sorted(sum(frame.values()) for frame in frames)
+        else:
+            values = sorted(frame[stage] for frame in frames if stage in frame)
+        if not values:
+            return {}
+        return {q: values[min(len(values) - 1, max(0, math.ceil(q / 100 * len(values)) - 1))]
+                for q in quantiles}
+
+    @staticmethod
+    def format_frame(frame: Dict[str, float]) -> str:
+        """
+        生成一帧的耗时分解，如 "采样 3.1 · 零点 0.4 · 绘制 20.3 = 23.8 ms"
+
+        Args:
+            frame: 一帧的 {阶段: 秒}
+
+        Returns:
+            单行文本
+        """
+        stages = " · ".join(f"{name} {seconds * 1000:.1f}" for name, seconds in frame.items())
+        return f"{stages} = {sum(frame.values()) * 1000:.1f} ms"
+
+    def format_summary(self) -> str:
+        """生成最近各帧的百分位数摘要，如：近 30 帧 p50 21.0 / p90 35.2 / p99 48.9 ms"""
+        summary = self.percentiles()
+        if not summary:
+            return ""
+        values = " / ".join(f"p{q:g} {seconds * 1000:.1f}" for q, seconds in summary.items())
+        return f"近 {len(self.frames)} 帧 {values} ms"
+
+    def dump_chrome_trace(self, filename: str) -> Tuple[bool, str]:
+        """
+        将记录的阶段导出为 Chrome trace JSON（可在 chrome://tracing 或 Perfetto 中查看）
+
+        Args:
+            filename: 输出文件路径
+
+        Returns:
+            (成功标志, 消息)
+        """
+        with self._lock:
+            events = list(self.events)
+        pid = os.getpid()
+        trace = []
+        threads = {}
+        for name, start, duration, tid, thread_name in events:
+            threads[tid] = thread_name
+            trace.append({'name': name, 'cat': 'plot', 'ph': 'X', 'pid': pid, 'tid': tid,
+                          'ts': (start - self.origin) * 1e6, 'dur': duration * 1e6})
+        for tid, thread_name in threads.items():
+            trace.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid,
+                          'args': {'name': thread_name}})
+        try:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump({'traceEvents': trace, 'displayTimeUnit': 'ms'}, f, ensure_ascii=False)
+        except OSError as e:
+            return False, f"导出耗时记录失败: {e}"
+        return True, f"已导出 {len(events)} 个阶段到 {filename}"
+
+
+# 全局启动计时器，main.py 导入时即开始计时
+startup_timer = PhaseTimer()
+
+# 全局绘图阶段分析器，由 PLOT_PROFILING 控制是否记录
+plot_profiler = SpanProfiler()